@@ -1,9 +1,9 @@
 from src.scraping.scraper import OnePieceCharacterScraper
+from src.scraping.checkpoint import CheckpointStore
+from src.scraping.llm_rater import DEFAULT_BATCH_SIZE
 import asyncio
 import logging
-import pandas as pd
 import os
-import json
 
 logger = logging.getLogger(__name__)
 
@@ -11,30 +11,19 @@ logger = logging.getLogger(__name__)
 async def main():
     scraper = OnePieceCharacterScraper()
 
-    # Load existing data to preserve it
+    # Append-only checkpoint: one JSON line per processed character
     csv_file = "data/raw/character_data.csv"
-    existing_results = []
-    processed = set()
+    checkpoint = CheckpointStore("data/raw/character_data.jsonl")
 
-    if os.path.exists(csv_file):
+    # One-off migration from runs that only wrote the CSV
+    if len(checkpoint) == 0 and os.path.exists(csv_file):
         try:
-            existing_df = pd.read_csv(csv_file)
-            # Convert existing data back to the format expected by scraper
-            for _, row in existing_df.iterrows():
-                # Use json.loads instead of eval to handle null values properly
-                wiki_data = json.loads(row["wiki_data"].replace("null", "null"))
-                power_scaling = json.loads(row["power_scaling"].replace("null", "null"))
-
-                existing_results.append(
-                    {"wiki_data": wiki_data, "power_scaling": power_scaling}
-                )
-
-                # Extract character name to add to processed set
-                processed.add(wiki_data["name"])
-            print(f"Loaded {len(existing_results)} existing characters")
+            checkpoint.import_csv(csv_file)
         except Exception as e:
             print(f"Error loading existing data: {e}")
 
+    print(f"Loaded {len(checkpoint)} existing characters")
+
     characters = [
         # Start from Nami since first 2 are done
         # "Nami",
@@ -142,22 +131,24 @@ async def main():
         "Shushu",
     ]
 
-    # Start with existing results to preserve previous data
-    results = existing_results.copy()
-
+    pending = []
     for char in characters:
-        if char in processed:
+        if char in checkpoint:
             print(f"Skipping {char} (already processed)")
-            continue
+        else:
+            pending.append(char)
 
-        logger.info(f"Processing character: {char}")
-        result = await scraper.process_character(char)
-        if result:
-            results.append(result)
+    # Rate several characters per LLM request, checkpointing each batch
+    for start in range(0, len(pending), DEFAULT_BATCH_SIZE):
+        batch = pending[start : start + DEFAULT_BATCH_SIZE]
+        logger.info(f"Processing characters: {', '.join(batch)}")
+        results = await scraper.process_characters(batch)
+        for char, result in results.items():
+            checkpoint.append(char, result)
             print(f"Successfully processed {char}")
-            scraper.save_to_csv(results)
 
-    scraper.save_to_csv(results)
+    # Rewrite the CSV once at the end for the preprocessing scripts
+    checkpoint.compact(csv_file)
 
 
 if __name__ == "__main__":
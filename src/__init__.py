@@ -1,3 +1,11 @@
-from .scraping import OnePieceCharacterScraper
+__all__ = ["OnePieceCharacterScraper"]
 
-__all__ = ['OnePieceCharacterScraper']
\ No newline at end of file
+
+def __getattr__(name):
+    # Imported on first use: the scraper pulls in the OpenAI and Gemini
+    # clients, which the API and frontend never need
+    if name == "OnePieceCharacterScraper":
+        from .scraping import OnePieceCharacterScraper
+
+        return OnePieceCharacterScraper
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
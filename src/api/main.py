@@ -1,11 +1,24 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
 import joblib
 import numpy as np
 import pandas as pd
 import os
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Literal, Optional
+
+from src.preprocessing.aliases import AliasIndex
+from src.models.svm_model import OnePieceFightPredictor
+from src.models.artifact import load_artifact
+from src.models.pair_dataset import PairDataset
+from src.models.simulation import TournamentSimulator
+from src.models.matchups import MatchupIndex
+from src.models.leaderboard import (
+    build_leaderboard,
+    cached_leaderboard,
+    leaderboard_key,
+)
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -31,10 +44,17 @@ app.add_middleware(
 MODEL_DIR = "src/models"
 MODEL_AVAILABLE = False
 svm_model = scaler = label_encoder = None
+predictor = None
+model_path = None
 
 try:
-    # Try different possible paths
+    # Try different possible paths; the pickle-free .npz artifact is
+    # memory-mapped and preferred over the joblib pickle. Its pages are
+    # shared by all workers that map the same file, so running N workers
+    # does not keep N copies of the support vectors.
     possible_paths = [
+        os.environ.get("MODEL_FILE", ""),  # Explicit override
+        os.path.join(MODEL_DIR, "svm_fight_predictor.npz"),
         os.path.join(MODEL_DIR, "svm_fight_predictor.pkl"),
         os.path.join(".", MODEL_DIR, "svm_fight_predictor.pkl"),
         "svm_fight_predictor.pkl",  # If moved to root
@@ -42,8 +62,11 @@ try:
 
     model_data = None
     for path in possible_paths:
-        if os.path.exists(path):
-            model_data = joblib.load(path)
+        if path and os.path.exists(path):
+            model_data = (
+                load_artifact(path) if path.endswith(".npz") else joblib.load(path)
+            )
+            model_path = path
             print(f"✅ Models loaded successfully from {path}")
             break
 
@@ -51,6 +74,7 @@ try:
         svm_model = model_data["model"]
         scaler = model_data["scaler"]
         label_encoder = model_data["label_encoder"]
+        predictor = OnePieceFightPredictor().load_model_data(model_data)
         MODEL_AVAILABLE = True
     else:
         print("⚠️ Model files not found, using fallback prediction")
@@ -59,6 +83,48 @@ except Exception as e:
     print(f"❌ Error loading models: {e}")
     print("⚠️ Using fallback prediction method")
 
+# Load character roster at startup
+DATA_DIR = "data/processed"
+character_data = None
+roster_index = None
+
+try:
+    possible_paths = [
+        os.path.join(DATA_DIR, "character_data_cleaned.csv"),
+        os.path.join("..", "..", DATA_DIR, "character_data_cleaned.csv"),
+    ]
+
+    for path in possible_paths:
+        if os.path.exists(path):
+            character_data = pd.read_csv(path).dropna(subset=["name"])
+            character_data = character_data.set_index("name", drop=False)
+            roster_index = AliasIndex(character_data["name"])
+            print(f"✅ Loaded {len(character_data)} characters from {path}")
+            break
+    else:
+        print("⚠️ Character data not found, character lookup disabled")
+
+except Exception as e:
+    print(f"❌ Error loading character data: {e}")
+
+# Opt-in float32 kernel evaluation, validated against float64 on every
+# roster matchup (both orientations) before it is switched on
+if os.environ.get("INFERENCE_PRECISION") == "float32" and predictor is not None:
+    try:
+        if character_data is None:
+            raise ValueError("roster needed for validation")
+        pairs = PairDataset.from_roster(character_data)
+        predictor.enable_reduced_precision(
+            np.vstack(
+                [
+                    pairs.feature_matrix(predictor.all_features),
+                    pairs.mirrored().feature_matrix(predictor.all_features),
+                ]
+            )
+        )
+    except Exception as e:
+        print(f"⚠️ Reduced precision not enabled: {e}")
+
 
 # Request/Response models
 class FighterStats(BaseModel):
@@ -86,12 +152,49 @@ class FightPredictionRequest(BaseModel):
     fighter_2: FighterStats
 
 
+class RosterPredictionRequest(BaseModel):
+    fighter: FighterStats
+    top: int = Field(5, ge=1, description="Number of hardest/easiest opponents")
+
+
+class SweepAxis(BaseModel):
+    stat: str = Field(..., description="FighterStats field to vary")
+    fighter: Literal[1, 2] = Field(1, description="Which fighter's stat to vary")
+    start: float = Field(..., ge=0, le=100)
+    stop: float = Field(..., ge=0, le=100)
+    steps: int = Field(..., ge=2, le=1000)
+
+
+class SweepRequest(BaseModel):
+    fighter_1: FighterStats
+    fighter_2: FighterStats
+    axes: List[SweepAxis] = Field(..., min_length=1, max_length=3)
+    include_grid: bool = Field(
+        True, description="Return the full probability grid, not only crossings"
+    )
+
+
+class SimulationRequest(BaseModel):
+    characters: Optional[List[str]] = Field(
+        None,
+        description="Entrants in seed order, top seed first (default: whole roster)",
+    )
+    mode: Literal["bracket", "round_robin"] = "bracket"
+    n_simulations: int = Field(10000, ge=1, le=5_000_000)
+    seed: Optional[int] = Field(None, description="Random seed for reproducibility")
+    random_seeding: bool = Field(
+        False, description="Shuffle the bracket order in every simulation"
+    )
+    top: int = Field(20, ge=1, description="Number of entrants to return")
+
+
 class PredictionResponse(BaseModel):
     prediction: str
     confidence: float
     probabilities: Dict[str, float]
     fighter_1_advantage: Dict[str, float]
     summary: str
+    explanation: Optional[Dict] = None
 
 
 # Health check endpoint
@@ -101,72 +204,211 @@ async def health_check():
     return {"status": "healthy", "model_status": model_status, "version": "1.0.0"}
 
 
+def inference_precision() -> str:
+    """Dtype of the active kernel evaluation (float64 unless reduced precision is on)."""
+    if predictor.kernel_scorer is not None:
+        return predictor.kernel_scorer.dtype.name
+    return "float64"
+
+
+# Human-readable name of each estimator the predictor can be trained with
+MODEL_TYPES = {
+    "SVC": "Support Vector Machine",
+    "ApproximateKernelClassifier": "Approximate kernel SVM (SGD on random Fourier features)",
+}
+
+
 # Model info endpoint
 @app.get("/model/info")
 async def model_info():
     if svm_model is None:
         raise HTTPException(status_code=503, detail="Model not loaded")
 
+    accuracy = predictor.test_accuracy
     return {
-        "model_type": "Support Vector Machine",
+        "model_type": MODEL_TYPES.get(
+            type(svm_model).__name__, type(svm_model).__name__
+        ),
+        "estimator": type(svm_model).__name__,
         "features": 12,
         "classes": label_encoder.classes_.tolist(),
-        "accuracy": "96.26%",
+        # Held-out accuracy recorded at training time; None for older models
+        "accuracy": f"{accuracy:.2%}" if accuracy is not None else None,
         "feature_engineering": "Difference variables + Conqueror's Haki interaction",
+        "symmetric": predictor.symmetric,
+        "precision": inference_precision(),
+        # Computed on the held-out split at training time, if recorded
+        "feature_importance": predictor.feature_importance,
     }
 
 
-def calculate_features(fighter_1: FighterStats, fighter_2: FighterStats) -> np.ndarray:
-    """Calculate the 12 engineered features from fighter stats."""
+def resolve_character(name: str) -> str:
+    """Resolve any spelling/alias of a character name to its roster name."""
+    if roster_index is None:
+        raise HTTPException(status_code=503, detail="Character data not loaded")
+    roster_name = roster_index.resolve(name)
+    if roster_name is None:
+        raise HTTPException(status_code=404, detail=f"Character '{name}' not found")
+    return roster_name
+
+
+def get_character_stats(name: str) -> FighterStats:
+    """Look up a roster character's stats in the API's FighterStats format."""
+    row = character_data.loc[resolve_character(name)]
+    return FighterStats(
+        **{stat: float(row[stat]) for stat in FighterStats.model_fields.keys()}
+    )
+
+
+@app.get("/characters")
+async def list_characters():
+    """List the names of all characters in the roster."""
+    if character_data is None:
+        raise HTTPException(status_code=503, detail="Character data not loaded")
+    return {"count": len(character_data), "characters": character_data.index.tolist()}
 
-    # Convert to dictionaries
-    f1_dict = fighter_1.model_dump()
-    f2_dict = fighter_2.model_dump()
-
-    # Calculate base difference features (10 features)
-    base_features = [
-        f1_dict["reaction_speed"] - f2_dict["reaction_speed"],
-        f1_dict["stamina"] - f2_dict["stamina"],
-        f1_dict["strength"] - f2_dict["strength"],
-        f1_dict["offense"] - f2_dict["offense"],
-        f1_dict["defense"] - f2_dict["defense"],
-        f1_dict["combat_skills"] - f2_dict["combat_skills"],
-        f1_dict["battle_iq"] - f2_dict["battle_iq"],
-        f1_dict["armament_haki"] - f2_dict["armament_haki"],
-        f1_dict["observation_haki"] - f2_dict["observation_haki"],
-        f1_dict["experience"] - f2_dict["experience"],
-    ]
 
-    # Calculate Conqueror's Haki features (2 features)
+@app.get("/characters/{name}")
+async def get_character(name: str):
+    """Get a character's stats. Accepts aliases such as "Big Mom" or "Kaido"."""
+    roster_name = resolve_character(name)
+    return {"name": roster_name, "stats": get_character_stats(roster_name)}
+
+
+STAT_FIELDS = list(FighterStats.model_fields.keys())
+
+# Stats whose fighter 1 - fighter 2 differences are the model's base features
+BASE_STATS = [
+    "reaction_speed",
+    "stamina",
+    "strength",
+    "offense",
+    "defense",
+    "combat_skills",
+    "battle_iq",
+    "armament_haki",
+    "observation_haki",
+    "experience",
+]
+
+
+def stats_to_array(fighter: FighterStats) -> np.ndarray:
+    """Fighter stats as a row in STAT_FIELDS order."""
+    return np.array([getattr(fighter, stat) for stat in STAT_FIELDS], dtype=float)
+
+
+def calculate_feature_matrix(
+    fighter_1: np.ndarray, fighter_2: np.ndarray
+) -> np.ndarray:
+    """
+    Vectorized `calculate_features` for many fights at once.
+
+    Args:
+        fighter_1: (n, len(STAT_FIELDS)) stats, or one row broadcast against fighter_2
+        fighter_2: (n, len(STAT_FIELDS)) stats, or one row broadcast against fighter_1
+
+    Returns:
+        (n, 12) feature matrix
+    """
+    fighter_1, fighter_2 = np.broadcast_arrays(
+        np.atleast_2d(fighter_1), np.atleast_2d(fighter_2)
+    )
+    base = [STAT_FIELDS.index(stat) for stat in BASE_STATS]
+    conqueror = STAT_FIELDS.index("conqueror_haki")
+
+    # Base difference features (10 features)
+    base_features = fighter_1[:, base] - fighter_2[:, base]
+
+    # Conqueror's Haki features (2 features)
     conqueror_present = (
-        1 if (f1_dict["conqueror_haki"] > 0 or f2_dict["conqueror_haki"] > 0) else 0
+        (fighter_1[:, conqueror] > 0) | (fighter_2[:, conqueror] > 0)
+    ).astype(float)
+    conqueror_impact = (
+        fighter_1[:, conqueror] - fighter_2[:, conqueror]
+    ) * conqueror_present
+
+    return np.column_stack([base_features, conqueror_present, conqueror_impact])
+
+
+def calculate_features(fighter_1: FighterStats, fighter_2: FighterStats) -> np.ndarray:
+    """Calculate the 12 engineered features from fighter stats."""
+    return calculate_feature_matrix(
+        stats_to_array(fighter_1), stats_to_array(fighter_2)
     )
-    conqueror_diff = f1_dict["conqueror_haki"] - f2_dict["conqueror_haki"]
-    conqueror_impact = conqueror_diff * conqueror_present
 
-    # Combine all features
-    features = base_features + [conqueror_present, conqueror_impact]
 
-    return np.array(features).reshape(1, -1)
+roster_stats = None
+
+
+def get_roster_stats() -> np.ndarray:
+    """Roster stats in STAT_FIELDS order, cached for batched scoring."""
+    global roster_stats
+    if character_data is None:
+        raise HTTPException(status_code=503, detail="Character data not loaded")
+    if roster_stats is None:
+        roster_stats = character_data[STAT_FIELDS].to_numpy(dtype=float)
+    return roster_stats
+
+
+# Large enough to hold every ordered pair of the roster
+EXPLANATION_CACHE_SIZE = 20_000
+
+
+@lru_cache(maxsize=EXPLANATION_CACHE_SIZE)
+def explain_features(features: tuple, method: str) -> Dict[str, Dict[str, float]]:
+    """Cached per-outcome feature attributions for one fight's features."""
+    _, attributions = predictor.explain(np.array([features]), method=method)
+    return {
+        label: dict(zip(predictor.all_features, attributions[0, :, k].tolist()))
+        for k, label in enumerate(label_encoder.classes_)
+    }
 
 
 @app.post("/predict", response_model=PredictionResponse)
-async def predict_fight(request: FightPredictionRequest):
-    """Predict the outcome of a fight between two characters."""
+async def predict_fight(
+    request: FightPredictionRequest,
+    explain: bool = Query(False, description="Include per-feature attributions"),
+    explain_method: Literal["occlusion", "shapley"] = Query(
+        "occlusion", description="Attribution method when explain=true"
+    ),
+):
+    """
+    Predict the outcome of a fight between two characters.
+
+    With `explain=true` the response also attributes the predicted outcome's
+    probability to the 12 model features, relative to an average training
+    fight. Explanations are cached, so repeated roster matchups are free.
+    """
+    explanation = None
 
     try:
         if MODEL_AVAILABLE and svm_model is not None:
             # Use your ML model
             features = calculate_features(request.fighter_1, request.fighter_2)
-            features_scaled = scaler.transform(features)
-            prediction_encoded = svm_model.predict(features_scaled)[0]
-            prediction = label_encoder.inverse_transform([prediction_encoded])[0]
-            probabilities = svm_model.predict_proba(features_scaled)[0]
+            probabilities = predictor.proba_from_features(features)[0]
+            # Symmetric models predict by argmax, so swapping the fighters
+            # swaps victory and loss exactly
+            prediction = predictor.predict_from_features(features)[0]
             prob_dict = {
                 label: float(prob)
                 for label, prob in zip(label_encoder.classes_, probabilities)
             }
             confidence = float(max(probabilities))
+
+            if explain:
+                by_outcome = explain_features(
+                    tuple(features[0].tolist()), explain_method
+                )
+                attributions = sorted(
+                    by_outcome[prediction].items(), key=lambda item: -abs(item[1])
+                )
+                explanation = {
+                    "method": explain_method,
+                    "baseline": "training mean",
+                    "outcome": prediction,
+                    "attributions": dict(attributions),
+                    "by_outcome": by_outcome,
+                }
         else:
             # Fallback: Simple stats-based prediction
             f1_stats = request.fighter_1.model_dump()
@@ -212,12 +454,328 @@ async def predict_fight(request: FightPredictionRequest):
             probabilities=prob_dict,
             fighter_1_advantage=advantages,
             summary=summary,
+            explanation=explanation,
         )
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Prediction error: {str(e)}")
 
 
+@app.post("/predict/roster")
+def predict_against_roster(request: RosterPredictionRequest):
+    """
+    Score one custom fighter (as fighter 1) against every roster character
+    in a single batched prediction.
+
+    "predicted" counts the model's labels (the same ones /predict returns);
+    "expected" sums the outcome probabilities, i.e. expected counts over
+    all opponents.
+    """
+    if predictor is None:
+        raise HTTPException(status_code=503, detail="Model not loaded")
+    stats = get_roster_stats()
+
+    features = calculate_feature_matrix(stats_to_array(request.fighter), stats)
+    probabilities = predictor.proba_from_features(features)
+    classes = label_encoder.classes_.tolist()
+    # Labels from the model's own decision, which can differ from the
+    # probability argmax (SVC votes one-vs-one; Platt scaling is separate)
+    predicted = predictor.predict_from_features(features)
+
+    matchups = pd.DataFrame(probabilities, columns=classes)
+    matchups.insert(0, "name", character_data.index.to_numpy())
+    matchups["prediction"] = predicted
+    matchups = matchups.sort_values("victory", ascending=False, kind="stable")
+
+    return {
+        "opponents": len(matchups),
+        "predicted": {label: int((predicted == label).sum()) for label in classes},
+        "expected": {label: float(matchups[label].sum()) for label in classes},
+        "easiest_opponents": matchups.head(request.top).to_dict(orient="records"),
+        "hardest_opponents": matchups.iloc[::-1]
+        .head(request.top)
+        .to_dict(orient="records"),
+    }
+
+
+# Largest grid a single sweep may evaluate
+MAX_SWEEP_POINTS = 250_000
+
+
+def sweep_probabilities(request: SweepRequest):
+    """
+    Outcome probabilities and predicted labels over the full sweep grid.
+
+    Returns:
+        (axis values, probabilities of shape grid_shape + (n_classes,),
+        predicted labels of shape grid_shape)
+    """
+    values = [np.linspace(axis.start, axis.stop, axis.steps) for axis in request.axes]
+    grids = np.meshgrid(*values, indexing="ij")
+    n_points = grids[0].size
+
+    fighters = {
+        1: np.tile(stats_to_array(request.fighter_1), (n_points, 1)),
+        2: np.tile(stats_to_array(request.fighter_2), (n_points, 1)),
+    }
+    for axis, grid in zip(request.axes, grids):
+        fighters[axis.fighter][:, STAT_FIELDS.index(axis.stat)] = grid.ravel()
+
+    features = calculate_feature_matrix(fighters[1], fighters[2])
+    probabilities = predictor.proba_from_features(features)
+    # Labels come from the model's own decision rule, which need not agree
+    # with the argmax of its calibrated probabilities
+    predictions = predictor.predict_from_features(features)
+    shape = grids[0].shape
+    return values, probabilities.reshape(shape + (-1,)), predictions.reshape(shape)
+
+
+def boundary_crossings(
+    axes: List[SweepAxis], values, probabilities, predictions, classes
+):
+    """
+    Where the predicted outcome changes between neighbouring grid points.
+
+    The crossing value along the changing axis is linearly interpolated
+    where the two outcomes' probabilities are equal, clipped to the step.
+    If the probabilities don't separate the two outcomes, the midpoint of
+    the step is used.
+    """
+    # classes are sorted (LabelEncoder order), so labels map to their index
+    predicted = np.searchsorted(classes, predictions)
+    crossings = []
+
+    for a, axis in enumerate(axes):
+        lower = [slice(None)] * predicted.ndim
+        upper = [slice(None)] * predicted.ndim
+        lower[a], upper[a] = slice(None, -1), slice(1, None)
+        changed = np.argwhere(predicted[tuple(lower)] != predicted[tuple(upper)])
+
+        for index in changed:
+            before = tuple(index)
+            after = tuple(index + np.eye(len(index), dtype=int)[a])
+            label_from, label_to = predicted[before], predicted[after]
+
+            margin_before = (
+                probabilities[before][label_from] - probabilities[before][label_to]
+            )
+            margin_after = (
+                probabilities[after][label_from] - probabilities[after][label_to]
+            )
+            denominator = margin_before - margin_after
+            t = margin_before / denominator if denominator != 0 else 0.5
+            t = min(max(t, 0.0), 1.0)
+
+            low, high = values[a][index[a]], values[a][index[a] + 1]
+            crossings.append(
+                {
+                    "stat": f"fighter_{axis.fighter}.{axis.stat}",
+                    "value": float(low + t * (high - low)),
+                    "from": classes[label_from],
+                    "to": classes[label_to],
+                    "at": {
+                        f"fighter_{other.fighter}.{other.stat}": float(
+                            values[b][index[b]]
+                        )
+                        for b, other in enumerate(axes)
+                        if b != a
+                    },
+                }
+            )
+
+    return crossings
+
+
+@app.post("/predict/sweep")
+def predict_sweep(request: SweepRequest):
+    """
+    Vary one to three stats over a grid and find where the predicted
+    outcome flips, e.g. how much strength Usopp needs to beat Katakuri.
+    The whole grid is scored with a single batched model call.
+    """
+    if predictor is None:
+        raise HTTPException(status_code=503, detail="Model not loaded")
+
+    for axis in request.axes:
+        if axis.stat not in STAT_FIELDS:
+            raise HTTPException(status_code=400, detail=f"Unknown stat '{axis.stat}'")
+    varied = [(axis.fighter, axis.stat) for axis in request.axes]
+    if len(set(varied)) != len(varied):
+        raise HTTPException(status_code=400, detail="Each stat may only be swept once")
+    n_points = int(np.prod([axis.steps for axis in request.axes]))
+    if n_points > MAX_SWEEP_POINTS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Grid has {n_points} points (limit {MAX_SWEEP_POINTS})",
+        )
+
+    values, probabilities, predictions = sweep_probabilities(request)
+    classes = label_encoder.classes_.tolist()
+
+    response = {
+        "axes": [
+            {"stat": axis.stat, "fighter": axis.fighter, "values": axis_values.tolist()}
+            for axis, axis_values in zip(request.axes, values)
+        ],
+        "classes": classes,
+        "crossings": boundary_crossings(
+            request.axes, values, probabilities, predictions, classes
+        ),
+    }
+    if request.include_grid:
+        response["probabilities"] = probabilities.tolist()
+        response["predictions"] = predictions.tolist()
+    return response
+
+
+simulator = None
+
+
+def get_simulator() -> TournamentSimulator:
+    """Pairwise probabilities over the roster, computed on first use."""
+    global simulator
+    if predictor is None:
+        raise HTTPException(status_code=503, detail="Model not loaded")
+    if character_data is None:
+        raise HTTPException(status_code=503, detail="Character data not loaded")
+    if simulator is None:
+        simulator = TournamentSimulator.from_predictor(predictor, character_data)
+    return simulator
+
+
+@app.post("/simulate")
+def simulate(request: SimulationRequest):
+    """
+    Simulate a tournament between roster characters.
+
+    "bracket" runs Monte Carlo single-elimination brackets; "round_robin"
+    returns expected standings. Both use the cached pairwise probabilities,
+    so no per-fight model calls are made.
+    """
+    sim = get_simulator()
+    names = None
+    if request.characters is not None:
+        names = [resolve_character(name) for name in request.characters]
+        if len(set(names)) != len(names):
+            raise HTTPException(status_code=400, detail="Duplicate entrants")
+
+    if request.mode == "round_robin":
+        results = sim.round_robin(names)
+    else:
+        if names is not None and len(names) < 2:
+            raise HTTPException(
+                status_code=400, detail="A bracket needs at least two entrants"
+            )
+        results = sim.simulate_bracket(
+            names,
+            n_simulations=request.n_simulations,
+            seed=request.seed,
+            random_seeding=request.random_seeding,
+        )
+
+    return {
+        "mode": request.mode,
+        "entrants": len(results),
+        "n_simulations": request.n_simulations if request.mode == "bracket" else None,
+        "seed": request.seed,
+        "results": results.head(request.top).to_dict(orient="records"),
+    }
+
+
+matchup_index = None
+
+
+def get_matchup_index() -> MatchupIndex:
+    """Sorted per-character matchup lists, built from the simulator's matrix."""
+    global matchup_index
+    if matchup_index is None:
+        sim = get_simulator()
+        matchup_index = MatchupIndex(sim.matrix, sim.classes, sim.names)
+    return matchup_index
+
+
+@app.get("/characters/{name}/matchups")
+def get_matchups(
+    name: str,
+    min_prob: float = Query(0.5, ge=0, le=1, description="Win probability threshold"),
+    k: Optional[int] = Query(None, ge=1, description="Maximum opponents per list"),
+    ascending: bool = Query(
+        False, description="Narrowest qualifying matchups first (e.g. weakest winners)"
+    ),
+):
+    """
+    Who `name` beats and who beats `name` with at least `min_prob`,
+    answered from precomputed sorted lists without model calls.
+    """
+    roster_name = resolve_character(name)
+    index = get_matchup_index()
+
+    def entries(beaten_by):
+        return [
+            {"name": opponent, "probability": prob}
+            for opponent, prob in index.query(
+                roster_name, min_prob, k, beaten_by=beaten_by, ascending=ascending
+            )
+        ]
+
+    return {
+        "name": roster_name,
+        "min_prob": min_prob,
+        "can_beat": entries(beaten_by=False),
+        "beaten_by": entries(beaten_by=True),
+    }
+
+
+leaderboard = None
+
+
+def load_leaderboard() -> pd.DataFrame:
+    """
+    Leaderboard for the loaded model and roster.
+
+    Stored on disk under a fingerprint of both and of the inference
+    precision and symmetry, so it is only recomputed when one of them changes.
+    """
+    global leaderboard
+    if predictor is None:
+        raise HTTPException(status_code=503, detail="Model not loaded")
+    if character_data is None:
+        raise HTTPException(status_code=503, detail="Character data not loaded")
+    if leaderboard is None:
+
+        def compute():
+            sim = get_simulator()
+            return build_leaderboard(sim.matrix, sim.classes, sim.names)
+
+        key = leaderboard_key(
+            model_path,
+            character_data,
+            precision=inference_precision(),
+            symmetric=predictor.symmetric,
+        )
+        leaderboard = cached_leaderboard(key, compute)
+    return leaderboard
+
+
+@app.get("/leaderboard")
+def get_leaderboard(
+    offset: int = Query(0, ge=0, description="Index of the first entry"),
+    limit: int = Query(25, ge=1, le=500, description="Entries per page"),
+):
+    """
+    Characters ranked by an Elo-scaled Bradley-Terry rating fitted to the
+    model's pairwise probabilities, with expected win/draw/loss rates.
+    """
+    table = load_leaderboard()
+    page = table.iloc[offset : offset + limit]
+    return {
+        "total": len(table),
+        "offset": offset,
+        "limit": limit,
+        "entries": page.to_dict(orient="records"),
+    }
+
+
 # Example endpoint
 @app.get("/example")
 async def get_example():
@@ -0,0 +1,192 @@
+from typing import Dict, List
+import urllib.request
+import numpy as np
+import subprocess
+import argparse
+import socket
+import json
+import time
+import sys
+import os
+
+# Fighter stats sent to warm up every worker (touches all model pages)
+WARMUP_FIGHT = {
+    "fighter_1": {
+        "reaction_speed": 8,
+        "stamina": 8,
+        "strength": 8,
+        "offense": 8,
+        "defense": 8,
+        "combat_skills": 8,
+        "battle_iq": 8,
+        "armament_haki": 8,
+        "observation_haki": 8,
+        "conqueror_haki": 1,
+        "experience": 8,
+    },
+    "fighter_2": {
+        "reaction_speed": 6,
+        "stamina": 6,
+        "strength": 6,
+        "offense": 6,
+        "defense": 6,
+        "combat_skills": 6,
+        "battle_iq": 6,
+        "armament_haki": 6,
+        "observation_haki": 6,
+        "conqueror_haki": 0,
+        "experience": 6,
+    },
+}
+
+
+def memory_of(pid: int) -> Dict[str, float]:
+    """RSS, PSS and private memory of a process in MB (Linux smaps_rollup)."""
+    fields = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                fields[parts[0].rstrip(":")] = int(parts[1]) / 1024
+    return {
+        "rss_mb": fields["Rss"],
+        "pss_mb": fields["Pss"],
+        "private_mb": fields["Private_Clean"] + fields["Private_Dirty"],
+        "shared_mb": fields["Shared_Clean"] + fields["Shared_Dirty"],
+    }
+
+
+def worker_pids(parent: int) -> List[int]:
+    """Direct children of the uvicorn supervisor, minus multiprocessing helpers."""
+    pids = []
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+            with open(f"/proc/{entry}/cmdline", "rb") as f:
+                cmdline = f.read()
+        except (FileNotFoundError, ProcessLookupError):
+            continue
+        if ppid == parent and b"resource_tracker" not in cmdline:
+            pids.append(int(entry))
+    return pids
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _post(url, payload):
+    request = urllib.request.Request(
+        url,
+        data=json.dumps(payload).encode(),
+        headers={"Content-Type": "application/json"},
+    )
+    with urllib.request.urlopen(request, timeout=60) as response:
+        return response.read()
+
+
+def measure_workers(
+    n_workers: int, model_file: str, timeout=600
+) -> List[Dict[str, float]]:
+    """
+    Start the API with `n_workers` uvicorn workers serving `model_file`,
+    send predictions until the workers are warm, and read each worker's
+    memory.
+
+    Returns:
+        One memory dict per worker
+    """
+    port = _free_port()
+    env = dict(os.environ, MODEL_FILE=model_file, PYTHONWARNINGS="ignore")
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "src.api.main:app",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--workers",
+            str(n_workers),
+            "--log-level",
+            "warning",
+        ],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.time() + timeout
+        if n_workers == 1:
+            # A single worker runs inside the supervisor process itself
+            workers = [server.pid]
+        else:
+            workers = []
+            while len(workers) < n_workers and time.time() < deadline:
+                time.sleep(1)
+                workers = worker_pids(server.pid)
+
+        # Spread requests over fresh connections until every worker's
+        # memory stops growing between rounds
+        previous = None
+        while time.time() < deadline:
+            for _ in range(4 * n_workers):
+                try:
+                    _post(f"http://127.0.0.1:{port}/predict", WARMUP_FIGHT)
+                except OSError:
+                    time.sleep(0.5)
+            current = [memory_of(pid)["rss_mb"] for pid in workers]
+            if previous is not None and np.allclose(current, previous, atol=0.5):
+                break
+            previous = current
+            time.sleep(2)
+
+        return [memory_of(pid) for pid in workers]
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    """
+    Per-worker memory of the API at several worker counts, for the
+    memory-mapped .npz artifact and the joblib pickle.
+    """
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument(
+        "--models",
+        nargs="+",
+        default=[
+            "src/models/svm_fight_predictor.npz",
+            "src/models/svm_fight_predictor.pkl",
+        ],
+    )
+    args = parser.parse_args()
+
+    print("API MEMORY PER WORKER (median over workers, MB)")
+    print("=" * 40)
+    for model_file in args.models:
+        for n_workers in args.workers:
+            per_worker = measure_workers(n_workers, model_file)
+            median = {
+                key: float(np.median([worker[key] for worker in per_worker]))
+                for key in per_worker[0]
+            }
+            total = sum(worker["pss_mb"] for worker in per_worker)
+            print(
+                f"{os.path.basename(model_file):<28} workers {n_workers:>3}  "
+                f"RSS {median['rss_mb']:7.1f}  PSS {median['pss_mb']:7.1f}  "
+                f"private {median['private_mb']:7.1f}  total PSS {total:8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -5,9 +5,16 @@ import pandas as pd
 from PIL import Image
 import io
 import os
+import sys
+
+# Make the repo root importable when run via `streamlit run src/frontend/...`
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from src.preprocessing.aliases import AliasIndex
 
 # Page configuration
-st.set_page_config(page_title="One Piece Match Predictor", page_icon="⚔️", layout="wide")
+st.set_page_config(
+    page_title="One Piece Match Predictor", page_icon="⚔️", layout="wide"
+)
 
 # Custom CSS for styling
 st.markdown(
@@ -77,6 +84,9 @@ def load_character_data():
 # Load the data
 character_data = load_character_data()
 
+# Resolves poll names ("Nefetari_Vivi", "Kaidou", ...) to names in the CSV
+name_index = AliasIndex(character_data["name"]) if character_data is not None else None
+
 # Import the exact character names from your extract_names.py
 ALL_CHARACTER_NAMES = [
     # Top 10 (1-10)
@@ -198,19 +208,8 @@ def get_character_stats(character_name):
     if character_data is None:
         return None
 
-    # Try multiple name formats to find the character
-    search_variations = [
-        character_name,  # "Monkey_D_Luffy"
-        character_name.replace("_", " "),  # "Monkey D Luffy"
-        character_name.replace("_", "."),  # "Monkey.D.Luffy"
-        character_name.replace("_D_", " D. "),  # "Monkey D. Luffy"
-    ]
-
-    character_row = None
-    for name_variant in search_variations:
-        character_row = character_data[character_data["name"] == name_variant]
-        if not character_row.empty:
-            break
+    roster_name = name_index.resolve(character_name)
+    character_row = character_data[character_data["name"] == roster_name]
 
     if character_row is None or character_row.empty:
         # Show what names are actually available for debugging
@@ -0,0 +1,335 @@
+from sklearn.kernel_approximation import RBFSampler
+from sklearn.linear_model import SGDClassifier
+from sklearn.preprocessing import StandardScaler, LabelEncoder
+from sklearn.svm import SVC
+import numpy as np
+import zipfile
+import struct
+import json
+import io
+import os
+
+from src.models.incremental import ApproximateKernelClassifier
+
+# Classes an artifact may instantiate. Loading never imports anything else,
+# so an untrusted file cannot run code the way a pickle can.
+ESTIMATOR_CLASSES = {
+    f"{cls.__module__}.{cls.__qualname__}": cls
+    for cls in (
+        SVC,
+        StandardScaler,
+        LabelEncoder,
+        RBFSampler,
+        SGDClassifier,
+        ApproximateKernelClassifier,
+    )
+}
+
+# Fitted state that is rebuilt by the estimator itself (SGD's Cython loss
+# object is recreated on the next partial_fit)
+SKIPPED_ATTRIBUTES = {"_loss_function_"}
+
+METADATA_MEMBER = "metadata.json"
+
+# Array data starts on this boundary inside the file, so memory-mapped
+# arrays are aligned like freshly allocated ones
+ALIGNMENT = 64
+
+# Zip "extra field" id used for the alignment padding
+_PADDING_HEADER_ID = 0xD935
+
+
+def _estimator_state(estimator, prefix, arrays):
+    """
+    JSON description of an estimator; its arrays are added to `arrays`.
+
+    Nested estimators (e.g. the feature map of ApproximateKernelClassifier)
+    are described recursively.
+    """
+    name = f"{type(estimator).__module__}.{type(estimator).__qualname__}"
+    if name not in ESTIMATOR_CLASSES:
+        raise TypeError(f"Cannot store {name} in a model artifact")
+
+    state = {}
+    for attribute, value in vars(estimator).items():
+        if attribute in SKIPPED_ATTRIBUTES:
+            continue
+        key = f"{prefix}/{attribute}"
+        if isinstance(value, tuple(ESTIMATOR_CLASSES.values())):
+            state[attribute] = {"estimator": _estimator_state(value, key, arrays)}
+        elif isinstance(value, (np.ndarray, np.generic)):
+            value = np.asarray(value)
+            if value.dtype == object:
+                # Labels and feature names: stored as fixed-width strings
+                arrays[key] = value.astype(str)
+                state[attribute] = {"array": key, "dtype": "object"}
+            else:
+                arrays[key] = value
+                state[attribute] = {"array": key}
+        elif isinstance(value, tuple):
+            state[attribute] = {"tuple": list(value)}
+        elif value is None or isinstance(value, (bool, int, float, str, list, dict)):
+            state[attribute] = {"value": value}
+        else:
+            raise TypeError(
+                f"Cannot store attribute {key} of type {type(value).__name__}"
+            )
+
+    return {"class": name, "state": state}
+
+
+def _restore_estimator(description, arrays):
+    """Rebuild an estimator from `_estimator_state` output and loaded arrays."""
+    cls = ESTIMATOR_CLASSES.get(description["class"])
+    if cls is None:
+        raise ValueError(
+            f"Model artifact references unknown class {description['class']}"
+        )
+
+    estimator = cls.__new__(cls)
+    for attribute, entry in description["state"].items():
+        if "estimator" in entry:
+            value = _restore_estimator(entry["estimator"], arrays)
+        elif "array" in entry:
+            value = arrays[entry["array"]]
+            if entry.get("dtype") == "object":
+                value = value.astype(object)
+            elif value.ndim == 0:
+                value = value[()]
+        elif "tuple" in entry:
+            value = tuple(entry["tuple"])
+        else:
+            value = entry["value"]
+        setattr(estimator, attribute, value)
+    return estimator
+
+
+def _padding(offset, name):
+    """Zip extra field that aligns the member's .npy data to ALIGNMENT."""
+    # Local file header: 30 bytes + file name + extra field. np.save pads
+    # the .npy header itself to a multiple of 64 bytes.
+    header_end = offset + 30 + len(name.encode()) + 4
+    pad = -header_end % ALIGNMENT
+    return struct.pack("<HH", _PADDING_HEADER_ID, pad) + b"\0" * pad
+
+
+def save_artifact(model_data, filepath):
+    """
+    Write a predictor's model data as a pickle-free .npz artifact.
+
+    The file is an uncompressed zip: one aligned .npy member per fitted
+    array plus `metadata.json` describing the estimators and the model
+    metadata (features, classes, accuracy, importance).
+
+    Args:
+        model_data: Dict as built by `OnePieceFightPredictor.save_model`
+        filepath: Output path, conventionally ending in .npz
+    """
+    arrays = {}
+    metadata = {
+        key: value
+        for key, value in model_data.items()
+        if key not in ("model", "scaler", "label_encoder")
+    }
+    metadata["estimators"] = {
+        key: _estimator_state(model_data[key], key, arrays)
+        for key in ("model", "scaler", "label_encoder")
+    }
+
+    tmp_file = f"{filepath}.tmp"
+    with zipfile.ZipFile(tmp_file, "w", compression=zipfile.ZIP_STORED) as archive:
+        for key, value in arrays.items():
+            name = f"{key}.npy"
+            buffer = io.BytesIO()
+            np.lib.format.write_array(
+                buffer, np.asarray(value, order="C"), allow_pickle=False
+            )
+
+            member = zipfile.ZipInfo(name, date_time=(1980, 1, 1, 0, 0, 0))
+            member.extra = _padding(archive.fp.tell(), name)
+            archive.writestr(member, buffer.getvalue())
+
+        archive.writestr(
+            zipfile.ZipInfo(METADATA_MEMBER, date_time=(1980, 1, 1, 0, 0, 0)),
+            json.dumps(metadata, indent=2),
+        )
+
+    os.replace(tmp_file, filepath)
+
+
+def _mapped_arrays(filepath, archive, mmap):
+    """Every .npy member of the archive, memory-mapped in place when possible."""
+    arrays = {}
+    with open(filepath, "rb") as f:
+        for member in archive.infolist():
+            if not member.filename.endswith(".npy"):
+                continue
+            key = member.filename[: -len(".npy")]
+
+            if not mmap or member.compress_type != zipfile.ZIP_STORED:
+                with archive.open(member) as data:
+                    arrays[key] = np.lib.format.read_array(data, allow_pickle=False)
+                continue
+
+            # Skip the local file header to reach the .npy bytes
+            f.seek(member.header_offset + 26)
+            name_length, extra_length = struct.unpack("<HH", f.read(4))
+            f.seek(member.header_offset + 30 + name_length + extra_length)
+            if np.lib.format.read_magic(f) == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+            else:
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+            if dtype.hasobject:
+                raise ValueError(f"Object array {key} in model artifact")
+
+            if not shape or 0 in shape:
+                arrays[key] = np.lib.format.read_array(
+                    archive.open(member), allow_pickle=False
+                )
+            else:
+                # Copy-on-write: pages are shared between processes until written
+                arrays[key] = np.memmap(
+                    filepath,
+                    dtype=dtype,
+                    mode="c",
+                    offset=f.tell(),
+                    shape=shape,
+                    order="F" if fortran_order else "C",
+                )
+    return arrays
+
+
+def load_artifact(filepath, mmap=True):
+    """
+    Load a .npz artifact written by `save_artifact`.
+
+    No pickle is involved: arrays are read (or memory-mapped) from their
+    .npy members and only the estimator classes in ESTIMATOR_CLASSES can
+    be instantiated.
+
+    Args:
+        filepath: Path to the .npz artifact
+        mmap: Memory-map the arrays instead of reading them into memory
+
+    Returns:
+        Model data dict accepted by `OnePieceFightPredictor.load_model_data`
+    """
+    with zipfile.ZipFile(filepath, "r") as archive:
+        metadata = json.loads(archive.read(METADATA_MEMBER))
+        arrays = _mapped_arrays(filepath, archive, mmap)
+
+    model_data = {
+        key: _restore_estimator(description, arrays)
+        for key, description in metadata.pop("estimators").items()
+    }
+    model_data.update(metadata)
+    return model_data
+
+
+# Run in a fresh interpreter per measurement so earlier loads don't skew RSS
+_BENCHMARK_SCRIPT = """
+import json, sys, time
+import joblib
+from src.models.artifact import load_artifact
+
+def rss():
+    fields = {}
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith(("RssAnon", "RssFile")):
+                name, value = line.split(":")
+                fields[name] = int(value.split()[0]) / 1024
+    return fields
+
+path, mmap = sys.argv[1], sys.argv[2] == "1"
+before = rss()
+start = time.perf_counter()
+model_data = load_artifact(path, mmap=mmap) if path.endswith(".npz") else joblib.load(path)
+elapsed = time.perf_counter() - start
+model_data["model"].predict_proba(model_data["scaler"].mean_[None, :])
+after = rss()
+print(json.dumps({
+    "load_ms": elapsed * 1000,
+    "anon_mb": after["RssAnon"] - before["RssAnon"],
+    "file_mb": after["RssFile"] - before["RssFile"],
+}))
+"""
+
+
+def benchmark_load(paths, repeats=5):
+    """
+    Load time and resident memory of model files, each load in a fresh
+    process. Private (anonymous) memory is per worker; file-backed pages
+    of a memory-mapped artifact are shared through the page cache.
+
+    Args:
+        paths: Model files (.pkl via joblib, .npz via `load_artifact`)
+        repeats: Loads per file; the median is reported
+
+    Returns:
+        List of dicts with file, loader, load_ms, anon_mb and file_mb
+    """
+    import subprocess
+    import sys
+
+    results = []
+    for path in paths:
+        loaders = (
+            [("mmap", "1"), ("read", "0")]
+            if path.endswith(".npz")
+            else [("joblib", "0")]
+        )
+        for loader, mmap in loaders:
+            runs = [
+                json.loads(
+                    subprocess.run(
+                        [
+                            sys.executable,
+                            "-W",
+                            "ignore",
+                            "-c",
+                            _BENCHMARK_SCRIPT,
+                            path,
+                            mmap,
+                        ],
+                        capture_output=True,
+                        text=True,
+                        check=True,
+                    )
+                    .stdout.strip()
+                    .splitlines()[-1]
+                )
+                for _ in range(repeats)
+            ]
+            median = {
+                key: float(np.median([run[key] for run in runs]))
+                for key in ("load_ms", "anon_mb", "file_mb")
+            }
+            results.append({"file": path, "loader": loader, **median})
+            print(
+                f"{os.path.basename(path):<28} {loader:<7} load {median['load_ms']:8.1f} ms  "
+                f"private {median['anon_mb']:7.1f} MB  file-backed {median['file_mb']:7.1f} MB"
+            )
+    return results
+
+
+def main():
+    """
+    Convert the committed joblib model to a .npz artifact and compare
+    load time and memory of both formats.
+    """
+    import joblib
+
+    pickle_file = "src/models/svm_fight_predictor.pkl"
+    artifact_file = "src/models/svm_fight_predictor.npz"
+
+    save_artifact(joblib.load(pickle_file), artifact_file)
+    print(f"Wrote {artifact_file} ({os.path.getsize(artifact_file) / 1024:.0f} KB)\n")
+
+    print("MODEL LOAD BENCHMARK (median of 5 fresh processes)")
+    print("=" * 40)
+    benchmark_load([pickle_file, artifact_file])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+from sklearn.kernel_approximation import RBFSampler
+from sklearn.linear_model import SGDClassifier
+import numpy as np
+
+
+class ApproximateKernelClassifier:
+    """
+    Linear classifier on a random Fourier feature map of the RBF kernel.
+
+    Approximates the kernel SVC's decision function while training with
+    `partial_fit` one chunk at a time, so memory and time grow linearly
+    with the number of fights instead of O(n^2) to O(n^3).
+    """
+
+    def __init__(self, n_components=500, gamma=None, alpha=1e-5, random_state=42):
+        """
+        Args:
+            n_components: Dimension of the kernel feature map
+            gamma: RBF kernel width (default: 1 / n_features, which is what
+                SVC's gamma="scale" gives on standardized features)
+            alpha: SGD regularization strength
+            random_state: Seed for the feature map and SGD
+        """
+        self.n_components = n_components
+        self.gamma = gamma
+        self.alpha = alpha
+        self.random_state = random_state
+        self.feature_map = None
+        self.classifier = SGDClassifier(
+            loss="log_loss", alpha=alpha, random_state=random_state
+        )
+
+    @property
+    def classes_(self):
+        return self.classifier.classes_
+
+    def _transform(self, X):
+        X = np.asarray(X, dtype=float)
+        if self.feature_map is None:
+            gamma = self.gamma if self.gamma is not None else 1.0 / X.shape[1]
+            # RBFSampler only needs the input dimension to draw its weights
+            self.feature_map = RBFSampler(
+                gamma=gamma,
+                n_components=self.n_components,
+                random_state=self.random_state,
+            ).fit(X[:1])
+        return self.feature_map.transform(X)
+
+    def partial_fit(self, X, y, classes=None):
+        """One SGD pass over a chunk of scaled features."""
+        self.classifier.partial_fit(self._transform(X), y, classes=classes)
+        return self
+
+    def predict(self, X):
+        return self.classifier.predict(self._transform(X))
+
+    def predict_proba(self, X):
+        return self.classifier.predict_proba(self._transform(X))
+
+    def nbytes_per_row(self, n_features):
+        """Approximate working memory per fight during training."""
+        # float64 input, kernel features and SGD's internal copy
+        return 8 * (n_features + 2 * self.n_components)
@@ -0,0 +1,198 @@
+from typing import Callable
+import pandas as pd
+import numpy as np
+import hashlib
+import json
+import os
+
+LEADERBOARD_CACHE_FILE = "data/.leaderboard_cache.json"
+
+# Elo points per factor-of-e difference in Bradley-Terry strength
+ELO_SCALE = 400 / np.log(10)
+ELO_BASE = 1500
+
+
+def win_share_matrix(matrix, classes):
+    """
+    Expected share of the fights character i wins against character j.
+
+    Both orientations are averaged (i as fighter 1 and as fighter 2) and a
+    draw counts as half a win, so share[i, j] + share[j, i] == 1.
+
+    Args:
+        matrix: (n, n, n_classes) pairwise outcome probabilities
+        classes: Outcome labels in matrix order
+
+    Returns:
+        (n, n) array with zeros on the diagonal
+    """
+    classes = list(classes)
+    victory = matrix[..., classes.index("victory")]
+    loss = matrix[..., classes.index("loss")]
+    draw = matrix[..., classes.index("draw")]
+
+    as_fighter_1 = victory + draw / 2
+    as_fighter_2 = loss.T + draw.T / 2
+    return np.nan_to_num((as_fighter_1 + as_fighter_2) / 2)
+
+
+def bradley_terry(win_share, prior=0.5, max_iter=10_000, tol=1e-9):
+    """
+    Fit Bradley-Terry strengths to a matrix of expected win shares.
+
+    Uses the minorization-maximization updates of Hunter (2004), with one
+    virtual game of weight `2 * prior` against a reference opponent of
+    strength 1. The prior keeps near-unbeaten characters finite.
+
+    Args:
+        win_share: (n, n) expected share of wins of i over j
+        prior: Virtual wins (and losses) against the reference opponent
+        max_iter: Iteration limit
+        tol: Convergence threshold on the largest log-strength change
+
+    Returns:
+        Log-strengths, one per character
+    """
+    n = len(win_share)
+    games = 1 - np.eye(n)
+    wins = win_share.sum(axis=1) + prior
+
+    strength = np.ones(n)
+    for _ in range(max_iter):
+        denominator = (games / (strength[:, None] + strength[None, :])).sum(axis=1)
+        denominator += 2 * prior / (strength + 1)
+        updated = wins / denominator
+        change = np.abs(np.log(updated) - np.log(strength)).max()
+        strength = updated
+        if change < tol:
+            break
+
+    return np.log(strength)
+
+
+def build_leaderboard(matrix, classes, names):
+    """
+    Rank characters from the full pairwise probability matrix.
+
+    Args:
+        matrix: (n, n, n_classes) outcome probabilities, e.g. from
+            `OnePieceFightPredictor.pairwise_proba`
+        classes: Outcome labels in matrix order
+        names: Character names, one per matrix row
+
+    Returns:
+        DataFrame sorted by rating: Elo-scaled Bradley-Terry rating and
+        expected win/draw/loss rates against the rest of the roster
+    """
+    classes = list(classes)
+    n = len(names)
+    opponents = 2 * (n - 1)
+
+    def rate(label, transposed):
+        # Outcome for i as fighter 1, plus the mirrored outcome as fighter 2
+        probabilities = matrix[..., classes.index(label)]
+        other = matrix[..., classes.index(transposed)].T
+        return (np.nansum(probabilities, axis=1) + np.nansum(other, axis=1)) / opponents
+
+    share = win_share_matrix(matrix, classes)
+    log_strength = bradley_terry(share)
+    rating = ELO_BASE + ELO_SCALE * (log_strength - log_strength.mean())
+
+    leaderboard = pd.DataFrame(
+        {
+            "name": names,
+            "rating": rating,
+            "win_rate": rate("victory", "loss"),
+            "draw_rate": rate("draw", "draw"),
+            "loss_rate": rate("loss", "victory"),
+            "win_share": share.sum(axis=1) / (n - 1),
+        }
+    )
+    leaderboard = leaderboard.sort_values("rating", ascending=False)
+    leaderboard.insert(0, "rank", np.arange(1, n + 1))
+    return leaderboard.reset_index(drop=True)
+
+
+def leaderboard_key(model_file, roster, precision="float64", symmetric=False):
+    """
+    Cache key from the model file's bytes, the roster's contents and the
+    inference settings that change the pairwise probabilities.
+
+    Args:
+        model_file: Model file the predictor was loaded from
+        roster: Roster DataFrame
+        precision: Dtype name of the kernel evaluation ("float64" for the
+            scikit-learn model, or the reduced-precision scorer's dtype)
+        symmetric: Whether the predictor scores matchups symmetrically
+    """
+    digest = hashlib.sha256()
+    with open(model_file, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    digest.update(pd.util.hash_pandas_object(roster, index=False).to_numpy().tobytes())
+    digest.update(
+        json.dumps({"precision": precision, "symmetric": bool(symmetric)}).encode()
+    )
+    return digest.hexdigest()
+
+
+def cached_leaderboard(
+    key: str, compute: Callable[[], pd.DataFrame], cache_file=LEADERBOARD_CACHE_FILE
+):
+    """
+    Load the leaderboard stored under `key`, or compute and store it.
+
+    Args:
+        key: Fingerprint of the model and roster (`leaderboard_key`)
+        compute: Builds the leaderboard when the cache is missing or stale
+        cache_file: JSON file holding the key and the leaderboard rows
+
+    Returns:
+        Leaderboard DataFrame
+    """
+    if os.path.exists(cache_file):
+        try:
+            with open(cache_file, "r") as f:
+                cached = json.load(f)
+            if cached.get("key") == key:
+                return pd.DataFrame(cached["rows"])
+        except (json.JSONDecodeError, KeyError):
+            pass
+
+    leaderboard = compute()
+
+    os.makedirs(os.path.dirname(cache_file) or ".", exist_ok=True)
+    tmp_file = f"{cache_file}.tmp"
+    with open(tmp_file, "w") as f:
+        json.dump({"key": key, "rows": leaderboard.to_dict(orient="records")}, f)
+    os.replace(tmp_file, cache_file)
+    print(f"Leaderboard recomputed for {len(leaderboard)} characters")
+
+    return leaderboard
+
+
+def main():
+    """
+    Example: print the top of the leaderboard for the current model and roster.
+    """
+    from src.models.svm_model import OnePieceFightPredictor
+    from src.models.pair_dataset import PairDataset
+
+    model_file = "src/models/svm_fight_predictor.pkl"
+    roster = pd.read_csv("data/processed/character_data_cleaned.csv")
+    predictor = OnePieceFightPredictor().load_model(model_file)
+
+    def compute():
+        pairs = PairDataset.from_roster(roster)
+        matrix = predictor.pairwise_proba(pairs)
+        return build_leaderboard(matrix, predictor.label_encoder.classes_, pairs.names)
+
+    leaderboard = cached_leaderboard(leaderboard_key(model_file, roster), compute)
+
+    print("\nPOWER LEADERBOARD")
+    print("=" * 40)
+    print(leaderboard.head(15).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+from typing import List, Tuple
+import numpy as np
+
+
+class MatchupIndex:
+    """
+    "Who can X beat" / "who beats X" queries over a pairwise probability matrix.
+
+    For every character the opponents are stored pre-sorted by win
+    probability, in both directions. A threshold query is a binary search
+    and a top-k query a slice, so no model evaluation happens per request.
+    """
+
+    def __init__(self, matrix, classes, names):
+        """
+        Args:
+            matrix: (n, n, n_classes) outcome probabilities, e.g. from
+                `OnePieceFightPredictor.pairwise_proba`
+            classes: Outcome labels in matrix order
+            names: Character names, one per matrix row
+        """
+        classes = list(classes)
+        victory = matrix[..., classes.index("victory")]
+        loss = matrix[..., classes.index("loss")]
+
+        # P(i beats j), averaged over i fighting as fighter 1 and as fighter 2
+        self.win_prob = (victory + loss.T) / 2
+        self.names = np.asarray(names, dtype=object)
+        self._position = {name: i for i, name in enumerate(self.names)}
+
+        self._beats = self._sorted_lists(self.win_prob)
+        self._beaten_by = self._sorted_lists(self.win_prob.T)
+
+    @staticmethod
+    def _sorted_lists(prob):
+        """Per row: opponents and probabilities, highest probability first."""
+        n = len(prob)
+        # Drop the diagonal (self-fights) before sorting
+        off_diagonal = ~np.eye(n, dtype=bool)
+        opponents = np.broadcast_to(np.arange(n), (n, n))[off_diagonal].reshape(
+            n, n - 1
+        )
+        values = prob[off_diagonal].reshape(n, n - 1)
+
+        order = np.argsort(-values, axis=1, kind="stable")
+        return (
+            np.take_along_axis(opponents, order, axis=1).astype(np.int32),
+            np.take_along_axis(values, order, axis=1),
+        )
+
+    def __contains__(self, name):
+        return name in self._position
+
+    def query(
+        self, name, min_prob=0.5, k=None, beaten_by=False, ascending=False
+    ) -> List[Tuple[str, float]]:
+        """
+        Opponents `name` beats (or, with `beaten_by`, that beat `name`) with
+        probability at least `min_prob`.
+
+        Args:
+            name: Roster name
+            min_prob: Win probability threshold
+            k: Return at most this many opponents (default: all)
+            beaten_by: Query "who beats X" instead of "who can X beat"
+            ascending: Return the narrowest qualifying matchups first, e.g.
+                the weakest characters that still beat X
+
+        Returns:
+            List of (opponent, probability) tuples
+        """
+        row = self._position[name]
+        opponents, probs = self._beaten_by if beaten_by else self._beats
+        opponents, probs = opponents[row], probs[row]
+
+        # probs is descending; count how many are >= min_prob
+        count = len(probs) - np.searchsorted(probs[::-1], min_prob, side="left")
+        k = count if k is None else min(k, count)
+
+        if ascending:
+            selected = np.arange(count - 1, count - k - 1, -1)
+        else:
+            selected = slice(0, k)
+
+        return [
+            (self.names[opponent], float(prob))
+            for opponent, prob in zip(opponents[selected], probs[selected])
+        ]
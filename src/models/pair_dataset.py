@@ -0,0 +1,199 @@
+import pandas as pd
+import numpy as np
+
+from src.preprocessing.fight_outcome_generator import OUTCOME_ATTRIBUTES, score_fights
+
+DEFAULT_BATCH_SIZE = 65536
+
+
+class PairDataset:
+    """
+    Fights as (i, j) index pairs into a character attribute matrix.
+
+    Instead of a materialized fight table (both fighters' attributes plus
+    diff and advantage columns for every pair), only the roster matrix and
+    two index arrays are stored. Model features such as `strength_diff`,
+    `conqueror_present` and `conqueror_impact` are computed on demand, one
+    batch of pairs at a time.
+
+    Memory is O(n_characters x n_attributes + n_pairs x 2) instead of
+    O(n_pairs x ~80) for the fight table.
+    """
+
+    def __init__(self, names, values, attributes, idx1, idx2, labels=None):
+        """
+        Args:
+            names: Character names, one per row of `values`
+            values: (n_characters, n_attributes) attribute matrix
+            attributes: Column names of `values`
+            idx1: Row of fighter 1 for each pair
+            idx2: Row of fighter 2 for each pair
+            labels: Optional outcome per pair; computed with the fight
+                scoring rules when omitted
+        """
+        self.names = np.asarray(names, dtype=object)
+        self.values = np.asarray(values, dtype=float)
+        self.attributes = list(attributes)
+        self._columns = {attr: i for i, attr in enumerate(self.attributes)}
+
+        index_dtype = np.int32 if len(self.names) < 2**31 else np.int64
+        self.idx1 = np.asarray(idx1, dtype=index_dtype)
+        self.idx2 = np.asarray(idx2, dtype=index_dtype)
+        if self.idx1.shape != self.idx2.shape:
+            raise ValueError("idx1 and idx2 must have the same length")
+
+        self.labels = None if labels is None else np.asarray(labels, dtype=object)
+
+    @classmethod
+    def from_roster(cls, roster, attributes=None):
+        """
+        Every pairing of distinct characters, in `create_fight_data` order.
+
+        Args:
+            roster: Cleaned roster DataFrame or CSV path
+            attributes: Attribute columns to keep (default: all but `name`)
+        """
+        if isinstance(roster, str):
+            roster = pd.read_csv(roster)
+        roster = roster.dropna(subset=["name"]).reset_index(drop=True)
+        if attributes is None:
+            attributes = [col for col in roster.columns if col != "name"]
+
+        idx1, idx2 = np.triu_indices(len(roster), k=1)
+        return cls(
+            roster["name"],
+            roster[attributes].to_numpy(dtype=float),
+            attributes,
+            idx1,
+            idx2,
+        )
+
+    @classmethod
+    def from_names(
+        cls, roster, fighter_1_names, fighter_2_names, labels=None, attributes=None
+    ):
+        """
+        Specific pairings, given by fighter names.
+
+        Args:
+            roster: Cleaned roster DataFrame or CSV path
+            fighter_1_names: Fighter 1 name per pair
+            fighter_2_names: Fighter 2 name per pair
+            labels: Optional outcome per pair
+            attributes: Attribute columns to keep (default: all but `name`)
+        """
+        dataset = cls.from_roster(roster, attributes)
+        position = pd.Series(np.arange(len(dataset.names)), index=dataset.names)
+
+        idx1 = pd.Series(fighter_1_names).map(position)
+        idx2 = pd.Series(fighter_2_names).map(position)
+        unknown = set(pd.Series(fighter_1_names)[idx1.isna().to_numpy()]) | set(
+            pd.Series(fighter_2_names)[idx2.isna().to_numpy()]
+        )
+        if unknown:
+            raise KeyError(f"Fighters not in roster: {sorted(unknown)[:10]}")
+
+        return cls(
+            dataset.names,
+            dataset.values,
+            dataset.attributes,
+            idx1.to_numpy(),
+            idx2.to_numpy(),
+            labels,
+        )
+
+    def __len__(self):
+        return len(self.idx1)
+
+    @property
+    def nbytes(self):
+        """Bytes held by the roster matrix and pair indices."""
+        return self.values.nbytes + self.idx1.nbytes + self.idx2.nbytes
+
+    def _column(self, attr):
+        if attr not in self._columns:
+            raise KeyError(f"Attribute '{attr}' not in roster columns")
+        return self._columns[attr]
+
+    def features(self, feature_names, start=0, stop=None):
+        """
+        Compute model features for pairs [start, stop).
+
+        Supported names: `<attr>_diff`, `fighter_1_<attr>`, `fighter_2_<attr>`,
+        `conqueror_present` and `conqueror_impact`.
+
+        Returns:
+            (stop - start, len(feature_names)) float array
+        """
+        i = self.idx1[start:stop]
+        j = self.idx2[start:stop]
+        X = np.empty((len(i), len(feature_names)), dtype=float)
+
+        for k, feature in enumerate(feature_names):
+            if feature in ("conqueror_present", "conqueror_impact"):
+                col = self._column("conqueror_haki")
+                c1, c2 = self.values[i, col], self.values[j, col]
+                present = ((c1 > 0) | (c2 > 0)).astype(float)
+                X[:, k] = (
+                    present if feature == "conqueror_present" else (c1 - c2) * present
+                )
+            elif feature.endswith("_diff"):
+                col = self._column(feature[: -len("_diff")])
+                X[:, k] = self.values[i, col] - self.values[j, col]
+            elif feature.startswith("fighter_1_"):
+                X[:, k] = self.values[i, self._column(feature[len("fighter_1_") :])]
+            elif feature.startswith("fighter_2_"):
+                X[:, k] = self.values[j, self._column(feature[len("fighter_2_") :])]
+            else:
+                raise KeyError(f"Cannot derive feature '{feature}' from pairs")
+
+        return X
+
+    def iter_batches(self, feature_names, batch_size=DEFAULT_BATCH_SIZE):
+        """Yield (start, stop, X) feature batches over all pairs."""
+        for start in range(0, len(self), batch_size):
+            stop = min(start + batch_size, len(self))
+            yield start, stop, self.features(feature_names, start, stop)
+
+    def feature_matrix(self, feature_names, batch_size=DEFAULT_BATCH_SIZE):
+        """All pairs' features, filled batch by batch into one array."""
+        X = np.empty((len(self), len(feature_names)), dtype=float)
+        for start, stop, batch in self.iter_batches(feature_names, batch_size):
+            X[start:stop] = batch
+        return X
+
+    def outcomes(self, start=0, stop=None, batch_size=DEFAULT_BATCH_SIZE):
+        """
+        Outcome per pair in [start, stop): the given labels, or the fight
+        scoring rules from `fight_outcome_generator` applied batch by batch.
+        """
+        stop = len(self) if stop is None else min(stop, len(self))
+        if self.labels is not None:
+            return self.labels[start:stop]
+
+        cols = [self._column(attr) for attr in OUTCOME_ATTRIBUTES]
+        outcomes = np.empty(stop - start, dtype=object)
+        for batch_start in range(start, stop, batch_size):
+            batch_stop = min(batch_start + batch_size, stop)
+            rows_1 = self.values[self.idx1[batch_start:batch_stop]][:, cols]
+            rows_2 = self.values[self.idx2[batch_start:batch_stop]][:, cols]
+            outcomes[batch_start - start : batch_stop - start] = score_fights(
+                rows_1, rows_2
+            )[2]
+        return outcomes
+
+    def mirrored(self):
+        """The same fights with fighter 1 and fighter 2 swapped."""
+        labels = None
+        if self.labels is not None:
+            swap = {"victory": "loss", "loss": "victory"}
+            labels = [swap.get(label, label) for label in self.labels]
+        return PairDataset(
+            self.names, self.values, self.attributes, self.idx2, self.idx1, labels
+        )
+
+    def fight_names(self):
+        """`"<fighter 1> vs <fighter 2>"` per pair, as in the fight table."""
+        return (
+            pd.Series(self.names[self.idx1]) + " vs " + pd.Series(self.names[self.idx2])
+        )
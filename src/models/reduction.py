@@ -0,0 +1,255 @@
+from sklearn.cluster import MiniBatchKMeans
+import pandas as pd
+import numpy as np
+import time
+
+
+def deduplicate(X, y, sample_weight=None):
+    """
+    Collapse identical (features, label) rows into one weighted row.
+
+    Returns:
+        (X_unique, y_unique, weights) where weights sum to the input weight
+    """
+    X = np.asarray(X, dtype=float)
+    y = np.asarray(y)
+    if sample_weight is None:
+        sample_weight = np.ones(len(X))
+
+    rows = np.column_stack([X, y.astype(float)])
+    unique, inverse = np.unique(rows, axis=0, return_inverse=True)
+    weights = np.bincount(inverse.ravel(), weights=sample_weight, minlength=len(unique))
+    return unique[:, :-1], unique[:, -1].astype(y.dtype), weights
+
+
+def stratified_subsample(y, ratio, min_per_class=10, random_state=42):
+    """
+    Indices of a random subsample keeping each class's share.
+
+    Args:
+        y: Class labels
+        ratio: Share of each class to keep
+        min_per_class: Keep at least this many rows of every class
+
+    Returns:
+        Sorted row indices
+    """
+    rng = np.random.default_rng(random_state)
+    keep = []
+    for label in np.unique(y):
+        rows = np.flatnonzero(y == label)
+        n_keep = min(len(rows), max(min_per_class, int(round(ratio * len(rows)))))
+        keep.append(rng.choice(rows, n_keep, replace=False))
+    return np.sort(np.concatenate(keep))
+
+
+def kmeans_coreset(X, y, ratio, sample_weight=None, min_per_class=10, random_state=42):
+    """
+    Weighted k-means coreset, built per class.
+
+    Each class is summarized by `ratio` times as many cluster centres as it
+    has rows; every centre is weighted by the total weight of its cluster.
+    Clustering runs on standardized features so no feature dominates.
+
+    Returns:
+        (centres, labels, weights)
+    """
+    X = np.asarray(X, dtype=float)
+    y = np.asarray(y)
+    if sample_weight is None:
+        sample_weight = np.ones(len(X))
+
+    mean, std = X.mean(axis=0), X.std(axis=0)
+    std[std == 0] = 1.0
+
+    centres, labels, weights = [], [], []
+    for label in np.unique(y):
+        rows = y == label
+        n_clusters = min(rows.sum(), max(min_per_class, int(round(ratio * rows.sum()))))
+        if n_clusters == rows.sum():
+            # As many centres as rows: keep the rows themselves. k-means
+            # would leave some clusters empty and drop below min_per_class.
+            centres.append(X[rows])
+            labels.append(y[rows])
+            weights.append(sample_weight[rows])
+            continue
+        kmeans = MiniBatchKMeans(
+            n_clusters=n_clusters, random_state=random_state, n_init=3, batch_size=4096
+        ).fit((X[rows] - mean) / std, sample_weight=sample_weight[rows])
+
+        cluster_weight = np.bincount(
+            kmeans.labels_, weights=sample_weight[rows], minlength=n_clusters
+        )
+        used = cluster_weight > 0
+        centres.append(kmeans.cluster_centers_[used] * std + mean)
+        labels.append(np.full(used.sum(), label))
+        weights.append(cluster_weight[used])
+
+    return np.vstack(centres), np.concatenate(labels), np.concatenate(weights)
+
+
+class DataReduction:
+    """
+    Training-set reduction applied by `OnePieceFightPredictor.fit` to the
+    training split before the SVC is fitted.
+
+    Kernel SVC training grows roughly O(n^2) to O(n^3) with the number of
+    rows; duplicates are removed for free (as sample weights) and the
+    remainder is subsampled or summarized by a weighted k-means coreset.
+    """
+
+    METHODS = ("stratified", "kmeans")
+
+    def __init__(
+        self, ratio=1.0, method="stratified", deduplicate=True, random_state=42
+    ):
+        """
+        Args:
+            ratio: Share of (deduplicated) training rows to keep
+            method: "stratified" subsampling by outcome, or "kmeans" coresets
+            deduplicate: Merge identical feature/label rows first
+            random_state: Seed for subsampling and clustering
+        """
+        if method not in self.METHODS:
+            raise ValueError(
+                f"Unknown reduction method '{method}'. Methods: {self.METHODS}"
+            )
+        if not 0 < ratio <= 1:
+            raise ValueError("ratio must be in (0, 1]")
+        self.ratio = ratio
+        self.method = method
+        self.deduplicate = deduplicate
+        self.random_state = random_state
+
+    def __repr__(self):
+        return (
+            f"DataReduction(ratio={self.ratio}, method='{self.method}', "
+            f"deduplicate={self.deduplicate})"
+        )
+
+    def apply(self, X, y):
+        """
+        Reduce a training set.
+
+        Args:
+            X: Feature DataFrame
+            y: Encoded labels
+
+        Returns:
+            (X_reduced DataFrame, y_reduced, sample_weight)
+        """
+        columns = X.columns
+        X_values, y_values = X.to_numpy(dtype=float), np.asarray(y)
+        weights = np.ones(len(X_values))
+
+        if self.deduplicate:
+            X_values, y_values, weights = deduplicate(X_values, y_values, weights)
+
+        if self.ratio < 1:
+            if self.method == "stratified":
+                keep = stratified_subsample(
+                    y_values, self.ratio, random_state=self.random_state
+                )
+                X_values, y_values, weights = (
+                    X_values[keep],
+                    y_values[keep],
+                    weights[keep],
+                )
+            else:
+                X_values, y_values, weights = kmeans_coreset(
+                    X_values,
+                    y_values,
+                    self.ratio,
+                    weights,
+                    random_state=self.random_state,
+                )
+
+        return pd.DataFrame(X_values, columns=columns), y_values, weights
+
+
+def reduction_tradeoff_report(
+    data,
+    ratios=(1.0, 0.5, 0.25, 0.1, 0.05),
+    methods=DataReduction.METHODS,
+    symmetric=False,
+):
+    """
+    Fit the SVC at several reduction ratios and compare fit time and
+    held-out accuracy. All runs share the same train/test split.
+
+    Args:
+        data: Fight DataFrame or PairDataset
+        ratios: Shares of the training rows to keep
+        methods: Reduction methods to compare
+        symmetric: Train symmetric predictors
+
+    Returns:
+        DataFrame with one row per (method, ratio)
+    """
+    import contextlib
+    import io
+    from src.models.svm_model import OnePieceFightPredictor
+
+    rows = []
+    for method in methods:
+        for ratio in ratios:
+            if ratio == 1.0 and method != methods[0]:
+                continue
+            predictor = OnePieceFightPredictor(symmetric=symmetric)
+            reduction = DataReduction(ratio=ratio, method=method)
+
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                predictor.fit(data, reduction=reduction)
+            elapsed = time.perf_counter() - start
+
+            rows.append(
+                {
+                    "method": method if ratio < 1 else "full (dedup only)",
+                    "ratio": ratio,
+                    "train_rows": predictor.train_rows,
+                    "fit_seconds": round(elapsed, 2),
+                    "test_accuracy": round(predictor.test_accuracy, 4),
+                }
+            )
+
+    return pd.DataFrame(rows)
+
+
+def main():
+    """
+    Trade-off report on the committed fights and on a larger roster.
+    """
+    from src.models.pair_dataset import PairDataset
+
+    print("COMMITTED FIGHTS (fight_data_cleaned.csv)")
+    print("=" * 40)
+    report = reduction_tradeoff_report(
+        pd.read_csv("data/processed/fight_data_cleaned.csv")
+    )
+    print(report.to_string(index=False))
+
+    # A larger roster: real characters resampled with noise, stats rounded
+    # to whole points
+    n_characters = 200
+    roster = pd.read_csv("data/processed/character_data_cleaned.csv")
+    rng = np.random.default_rng(0)
+    large = roster.sample(n_characters, replace=True, random_state=0).reset_index(
+        drop=True
+    )
+    stats = [col for col in roster.columns if col != "name"]
+    noise = rng.normal(0, 0.5, (n_characters, len(stats)))
+    large[stats] = np.clip(large[stats] + noise, 0, 10).round()
+    large["name"] = [f"Synthetic {i}" for i in range(n_characters)]
+
+    n_fights = n_characters * (n_characters - 1) // 2
+    print(f"\nSYNTHETIC ROSTER ({n_characters} characters, {n_fights} fights)")
+    print("=" * 40)
+    report = reduction_tradeoff_report(
+        PairDataset.from_roster(large), ratios=(1.0, 0.25, 0.1, 0.05)
+    )
+    print(report.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+import pandas as pd
+import numpy as np
+import time
+
+from src.models.pair_dataset import PairDataset
+
+# Brackets are simulated in chunks of this many brackets to bound memory
+DEFAULT_CHUNK_SIZE = 100_000
+
+
+def seed_order(n_slots):
+    """
+    Seed (0 = top seed) in each bracket slot under standard seeding.
+
+    Seed s meets seed n_slots - 1 - s in the first round, and the top two
+    seeds can only meet in the final, e.g. [0, 7, 3, 4, 1, 6, 2, 5] for 8.
+
+    Args:
+        n_slots: Bracket size, a power of two
+    """
+    order = np.array([0])
+    while len(order) < n_slots:
+        order = np.column_stack([order, 2 * len(order) - 1 - order]).ravel()
+    return order
+
+
+class TournamentSimulator:
+    """
+    Tournament simulations over a precomputed pairwise probability matrix.
+
+    The model is evaluated once for every ordered pair of characters
+    (`OnePieceFightPredictor.pairwise_proba`); all simulations then only
+    index into that matrix and draw NumPy random numbers, so millions of
+    brackets cost no further model calls.
+    """
+
+    def __init__(self, matrix, classes, names):
+        """
+        Args:
+            matrix: (n, n, n_classes) outcome probabilities, [i, j] being
+                character i as fighter 1 against character j
+            classes: Outcome labels in matrix order (victory/loss/draw)
+            names: Character names, one per matrix row
+        """
+        self.matrix = np.asarray(matrix, dtype=float)
+        self.classes = list(classes)
+        self.names = np.asarray(names, dtype=object)
+        self._position = {name: i for i, name in enumerate(self.names)}
+
+        victory = self.matrix[..., self.classes.index("victory")]
+        draw = self.matrix[..., self.classes.index("draw")]
+
+        # Knockout fights need a winner: a draw is settled by a coin flip.
+        # The last row/column is a bye that always loses.
+        n = len(self.names)
+        self.win_matrix = np.zeros((n + 1, n + 1))
+        self.win_matrix[:n, :n] = np.nan_to_num(victory + draw / 2)
+        self.win_matrix[:n, n] = 1.0
+
+    @classmethod
+    def from_predictor(cls, predictor, roster):
+        """
+        Score every pairing of the roster once and build a simulator.
+
+        Args:
+            predictor: Fitted OnePieceFightPredictor (symmetric mode
+                recommended, so bracket position does not matter)
+            roster: Cleaned roster DataFrame or CSV path
+        """
+        pairs = PairDataset.from_roster(roster)
+        start = time.perf_counter()
+        matrix = predictor.pairwise_proba(pairs)
+        print(
+            f"Scored {len(pairs.names)} characters "
+            f"({len(pairs.names) * (len(pairs.names) - 1)} matchups) "
+            f"in {time.perf_counter() - start:.2f}s"
+        )
+        return cls(matrix, predictor.label_encoder.classes_, pairs.names)
+
+    def indices(self, names=None):
+        """Matrix rows of the given character names (default: everyone)."""
+        if names is None:
+            return np.arange(len(self.names))
+        unknown = [name for name in names if name not in self._position]
+        if unknown:
+            raise KeyError(f"Characters not in roster: {unknown}")
+        return np.array([self._position[name] for name in names])
+
+    def round_robin(self, names=None, points=(3, 1, 0)):
+        """
+        Expected standings when every entrant fights every other entrant
+        twice, once as fighter 1 and once as fighter 2.
+
+        Args:
+            names: Entrants (default: the whole roster)
+            points: Points for a victory, draw and loss
+
+        Returns:
+            DataFrame, best first, of each entrant's expected number of
+            wins, draws and losses over its `fights` fights (they sum to
+            `fights`) and the expected points
+        """
+        entrants = self.indices(names)
+        sub = self.matrix[np.ix_(entrants, entrants)]
+        victory, draw, loss = (
+            sub[..., self.classes.index(label)] for label in ("victory", "draw", "loss")
+        )
+
+        # As fighter 2 against j, i wins when fighter 1 (j) loses
+        wins = np.nansum(victory, axis=1) + np.nansum(loss, axis=0)
+        draws = np.nansum(draw, axis=1) + np.nansum(draw, axis=0)
+        losses = np.nansum(loss, axis=1) + np.nansum(victory, axis=0)
+
+        standings = pd.DataFrame(
+            {
+                "name": self.names[entrants],
+                "fights": 2 * (len(entrants) - 1),
+                "expected_wins": wins,
+                "expected_draws": draws,
+                "expected_losses": losses,
+                "expected_points": points[0] * wins
+                + points[1] * draws
+                + points[2] * losses,
+            }
+        )
+        standings = standings.sort_values("expected_points", ascending=False)
+        standings.insert(0, "rank", np.arange(1, len(standings) + 1))
+        return standings.reset_index(drop=True)
+
+    def simulate_bracket(
+        self,
+        names=None,
+        n_simulations=100_000,
+        seed=None,
+        random_seeding=False,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+    ):
+        """
+        Monte Carlo single-elimination brackets.
+
+        Every round pairs slots (0, 1), (2, 3), ... and draws all fights of
+        all brackets in the chunk at once. Entrants are placed by standard
+        seeding (`seed_order`) in a bracket padded with byes to the next
+        power of two; the byes take the lowest seeds, so they go to the top
+        seeds' first-round slots and two byes never meet.
+
+        Args:
+            names: Entrants in seed order, top seed first (default: the
+                whole roster)
+            n_simulations: Number of brackets to simulate
+            seed: Random seed for reproducible results
+            random_seeding: Draw a new seed order of the entrants in every
+                simulation (byes stay in the lowest seeds)
+            chunk_size: Brackets simulated per vectorized step
+
+        Returns:
+            DataFrame with each entrant's probability of reaching each round
+            and of winning the tournament, most likely champion first
+        """
+        entrants = self.indices(names)
+        if len(entrants) < 2:
+            raise ValueError("A bracket needs at least two entrants")
+
+        n_rounds = int(np.ceil(np.log2(len(entrants))))
+        bye = len(self.names)
+        order = seed_order(2**n_rounds)
+        # Seeds beyond the entrants are byes
+        byes = np.full(2**n_rounds - len(entrants), bye)
+
+        rng = np.random.default_rng(seed)
+        # reached[r, i]: brackets in which character i survived r rounds
+        reached = np.zeros((n_rounds + 1, bye + 1), dtype=np.int64)
+
+        for start in range(0, n_simulations, chunk_size):
+            size = min(chunk_size, n_simulations - start)
+            if random_seeding:
+                seeds = rng.permuted(np.tile(entrants, (size, 1)), axis=1)
+            else:
+                seeds = np.broadcast_to(entrants, (size, len(entrants)))
+            alive = np.hstack([seeds, np.broadcast_to(byes, (size, len(byes)))])[
+                :, order
+            ]
+
+            reached[0] += np.bincount(alive.ravel(), minlength=bye + 1)
+            for round_number in range(1, n_rounds + 1):
+                fighter_1, fighter_2 = alive[:, 0::2], alive[:, 1::2]
+                p_win = self.win_matrix[fighter_1, fighter_2]
+                alive = np.where(rng.random(p_win.shape) < p_win, fighter_1, fighter_2)
+                reached[round_number] += np.bincount(alive.ravel(), minlength=bye + 1)
+
+        probabilities = reached[:, entrants].T / n_simulations
+        results = pd.DataFrame(
+            probabilities[:, 1:],
+            columns=[f"round_{r}" for r in range(1, n_rounds)] + ["champion"],
+        )
+        results.insert(0, "name", self.names[entrants])
+        return results.sort_values("champion", ascending=False).reset_index(drop=True)
+
+
+def main():
+    """
+    Example: round-robin standings and one million brackets over the roster.
+    """
+    from src.models.svm_model import OnePieceFightPredictor
+
+    predictor = OnePieceFightPredictor().load_model(
+        "src/models/svm_fight_predictor.pkl"
+    )
+    simulator = TournamentSimulator.from_predictor(
+        predictor, "data/processed/character_data_cleaned.csv"
+    )
+
+    print("\nROUND-ROBIN STANDINGS")
+    print("=" * 40)
+    print(simulator.round_robin().head(10).to_string(index=False))
+
+    n_simulations = 1_000_000
+    start = time.perf_counter()
+    bracket = simulator.simulate_bracket(
+        n_simulations=n_simulations, seed=42, random_seeding=True
+    )
+    elapsed = time.perf_counter() - start
+
+    print(f"\nBRACKET SIMULATION ({n_simulations:,} brackets in {elapsed:.1f}s)")
+    print("=" * 40)
+    print(bracket[["name", "champion"]].head(10).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
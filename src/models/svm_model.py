@@ -4,10 +4,121 @@ from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import StandardScaler, LabelEncoder
 from sklearn.svm import SVC
 from sklearn.metrics import accuracy_score, classification_report, confusion_matrix
+from concurrent.futures import ThreadPoolExecutor
+from joblib import Parallel, delayed
 import joblib
 import os
 import json
 
+from src.models.pair_dataset import PairDataset, DEFAULT_BATCH_SIZE
+from src.models.incremental import ApproximateKernelClassifier
+from src.models.artifact import save_artifact, load_artifact
+from src.models.rbf_inference import RBFKernelScorer
+
+# Features that do not change sign when the fighters are swapped
+SYMMETRIC_FEATURES = {"conqueror_present"}
+
+
+def antisymmetric_mask(feature_names):
+    """True for features that are negated when fighter 1 and 2 swap places."""
+    return np.array([name not in SYMMETRIC_FEATURES for name in feature_names])
+
+
+def mirror_features(X, feature_names):
+    """Features of the same fights with fighter 1 and fighter 2 swapped."""
+    X = np.array(X, dtype=float)
+    X[:, antisymmetric_mask(feature_names)] *= -1
+    return X
+
+
+def swap_outcomes(probabilities, classes):
+    """Reorder outcome probabilities for the swapped orientation (victory <-> loss)."""
+    classes = list(classes)
+    order = [
+        classes.index({"victory": "loss", "loss": "victory"}.get(label, label))
+        for label in classes
+    ]
+    return np.asarray(probabilities)[..., order]
+
+
+def csv_chunk_offsets(path, chunk_rows):
+    """
+    Column names of a CSV and the byte offset of every `chunk_rows`-record
+    chunk, so chunks can be read in any order.
+
+    Quoted fields may contain line breaks: a line only ends a record when
+    the quotes seen so far are balanced.
+
+    Returns:
+        (header, offsets)
+    """
+    with open(path, "rb") as f:
+        header = pd.read_csv(f, nrows=0).columns.tolist()
+        f.seek(0)
+        in_quotes = False
+        records = 0
+        offsets = []
+        offset = 0
+        for line in f:
+            if not in_quotes:
+                if records > 0 and (records - 1) % chunk_rows == 0:
+                    offsets.append(offset)
+                records += 1
+            in_quotes ^= line.count(b'"') % 2 == 1
+            offset += len(line)
+    return header, offsets
+
+
+def feature_correlations(X, y):
+    """
+    Pearson correlation of every feature column with `y`, in one pass.
+
+    Args:
+        X: (n_samples, n_features) feature matrix
+        y: (n_samples,) numeric target
+
+    Returns:
+        (n_features,) correlations; NaN for constant features
+    """
+    X = np.asarray(X, dtype=float)
+    y = np.asarray(y, dtype=float)
+    X_centered = X - X.mean(axis=0)
+    y_centered = y - y.mean()
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return (X_centered.T @ y_centered) / np.sqrt(
+            (X_centered**2).sum(axis=0) * (y_centered**2).sum()
+        )
+
+
+def _permutation_drops(predictor, X, y, column, n_repeats, seed):
+    """Accuracy drops from shuffling one feature column (a joblib task)."""
+    rng = np.random.default_rng([seed, column])
+    baseline = accuracy_score(y, predictor._predict_encoded(X))
+    drops = []
+    for _ in range(n_repeats):
+        X_permuted = X.copy()
+        X_permuted[:, column] = rng.permutation(X_permuted[:, column])
+        drops.append(
+            baseline - accuracy_score(y, predictor._predict_encoded(X_permuted))
+        )
+    return drops
+
+
+def canonical_flip(X, feature_names):
+    """
+    Which rows to mirror so that (A, B) and (B, A) map to the same input.
+
+    A row is flipped when its first non-zero antisymmetric feature is
+    negative. Rows with all antisymmetric features zero are their own mirror.
+
+    Returns:
+        (flip, self_mirrored) boolean arrays
+    """
+    A = np.asarray(X, dtype=float)[:, antisymmetric_mask(feature_names)]
+    nonzero = A != 0
+    first = A[np.arange(len(A)), nonzero.argmax(axis=1)]
+    return first < 0, ~nonzero.any(axis=1)
+
 
 class OnePieceFightPredictor:
     """
@@ -17,12 +128,27 @@ class OnePieceFightPredictor:
     with special handling for Conqueror's Haki interactions.
     """
 
-    def __init__(self):
+    def __init__(self, symmetric=False):
+        """
+        Args:
+            symmetric: Train on both orientations of every fight and predict
+                in a canonical orientation, so that (B, A) is always (A, B)
+                with victory and loss swapped
+        """
         self.model = SVC(random_state=42, probability=True)
         self.scaler = StandardScaler()
         self.label_encoder = LabelEncoder()
+        self.symmetric = symmetric
         self.is_fitted = False
 
+        # Held-out evaluation filled in by fit() and saved with the model
+        self.test_accuracy = None
+        self.feature_importance = None
+        self.train_rows = None
+
+        # Reduced-precision scorer, set by enable_reduced_precision()
+        self.kernel_scorer = None
+
         # Feature definitions based on notebook analysis
         self.base_diff_features = [
             "reaction_speed_diff",
@@ -80,20 +206,81 @@ class OnePieceFightPredictor:
 
         return X
 
-    def fit(self, df, target_column="outcome"):
+    def _features_and_target(self, data, target_column="outcome"):
+        """Feature matrix and target from a fight DataFrame or a PairDataset."""
+        if isinstance(data, PairDataset):
+            X = pd.DataFrame(
+                data.feature_matrix(self.all_features), columns=self.all_features
+            )
+            return X, pd.Series(data.outcomes())
+        return self.prepare_features(data), data[target_column]
+
+    def _feature_batches(self, data, batch_size=DEFAULT_BATCH_SIZE):
+        """Yield unscaled feature batches; a DataFrame is a single batch."""
+        if isinstance(data, PairDataset):
+            for _, _, X in data.iter_batches(self.all_features, batch_size):
+                yield X
+        else:
+            yield self.prepare_features(data).to_numpy(dtype=float)
+
+    def _scale(self, X):
+        return self.scaler.transform(pd.DataFrame(X, columns=self.all_features))
+
+    def _model_proba(self, X_scaled):
+        if self.kernel_scorer is not None:
+            return self.kernel_scorer.predict_proba(X_scaled)
+        return self.model.predict_proba(X_scaled)
+
+    def _model_predict(self, X_scaled):
+        if self.kernel_scorer is not None:
+            return self.kernel_scorer.predict(X_scaled)
+        return self.model.predict(X_scaled)
+
+    def proba_from_features(self, X):
+        """
+        Outcome probabilities for an unscaled feature matrix.
+
+        Args:
+            X: (n_fights, len(all_features)) array, e.g. from `calculate_features`
+
+        Returns:
+            (n_fights, n_classes) probabilities in `label_encoder.classes_` order
+        """
+        if not self.symmetric:
+            return self._model_proba(self._scale(X))
+
+        # Score every fight in its canonical orientation, then permute the
+        # probabilities back for rows that were mirrored
+        flip, self_mirrored = canonical_flip(X, self.all_features)
+        X = np.where(flip[:, None], mirror_features(X, self.all_features), X)
+        probabilities = self._model_proba(self._scale(X))
+
+        classes = self.label_encoder.classes_
+        probabilities[flip] = swap_outcomes(probabilities[flip], classes)
+        probabilities[self_mirrored] = (
+            probabilities[self_mirrored]
+            + swap_outcomes(probabilities[self_mirrored], classes)
+        ) / 2
+        return probabilities
+
+    def fit(self, df, target_column="outcome", reduction=None):
         """
         Train the SVM model on fight data.
 
         Args:
-            df: DataFrame with fight data
-            target_column: Name of the target column
+            df: DataFrame with fight data, or a PairDataset whose features
+                and outcomes are computed from the roster matrix
+            target_column: Name of the target column (DataFrame input only)
+            reduction: Optional `DataReduction` applied to the training
+                split (deduplication, stratified subsampling or k-means
+                coresets) to bound SVC training time
         """
         print("Training ONE PIECE Fight Predictor...")
         print("=" * 50)
+        self.kernel_scorer = None
 
         # Prepare features
-        X = self.prepare_features(df)
-        y = df[target_column]
+        X, y = self._features_and_target(df, target_column)
 
         print(f"Features: {X.shape[1]}")
         print(f"Samples: {X.shape[0]}")
@@ -107,31 +294,306 @@ class OnePieceFightPredictor:
             X, y_encoded, test_size=0.2, random_state=42, stratify=y_encoded
         )
 
+        if self.symmetric:
+            X_train, y_train = self._mirror_training_set(X_train, y_train)
+            print(f"Symmetric mode: {len(X_train)} training rows incl. mirrored fights")
+
+        sample_weight = None
+        if reduction is not None:
+            n_rows = len(X_train)
+            X_train, y_train, sample_weight = reduction.apply(X_train, y_train)
+            print(
+                f"Reduced training set: {n_rows} -> {len(X_train)} rows ({reduction})"
+            )
+        self.train_rows = len(X_train)
+
         # Scale features (important for SVM)
-        X_train_scaled = self.scaler.fit_transform(X_train)
-        X_test_scaled = self.scaler.transform(X_test)
+        self.scaler.fit(X_train, sample_weight=sample_weight)
+        X_train_scaled = self.scaler.transform(X_train)
 
         # Train model
-        self.model.fit(X_train_scaled, y_train)
+        self.model.fit(X_train_scaled, y_train, sample_weight=sample_weight)
+
+        self.is_fitted = True
 
         # Evaluate on test set
-        y_pred = self.model.predict(X_test_scaled)
-        test_accuracy = accuracy_score(y_test, y_pred)
+        X_test = X_test.to_numpy(dtype=float)
+        test_accuracy = accuracy_score(y_test, self._predict_encoded(X_test))
 
         print(f"\nTraining completed!")
         print(f"Test Accuracy: {test_accuracy:.4f}")
         print(f"Classes: {self.label_encoder.classes_}")
 
+        self.test_accuracy = float(test_accuracy)
+        self.feature_importance = self._importance_report(X_test, y_test)
+
+        return self
+
+    def _predict_encoded(self, X):
+        """Encoded class predictions for an unscaled feature matrix."""
+        if self.symmetric:
+            return self.proba_from_features(X).argmax(axis=1)
+        return self._model_predict(self._scale(X))
+
+    def predict_from_features(self, X):
+        """
+        Outcome labels for an unscaled feature matrix.
+
+        Args:
+            X: (n_fights, len(all_features)) array, e.g. from `calculate_features`
+
+        Returns:
+            Array of predicted outcomes
+        """
+        return self.label_encoder.inverse_transform(self._predict_encoded(X))
+
+    def _importance_report(
+        self, X, y_encoded, n_repeats=5, n_jobs=-1, random_state=42, max_samples=2000
+    ):
+        """
+        Correlation and permutation importance on encoded held-out data.
+
+        Permutation importance uses at most `max_samples` rows, so its
+        n_features * n_repeats predictions stay cheap on large datasets.
+        """
+        correlations = feature_correlations(X, y_encoded)
+
+        if len(X) > max_samples:
+            rows = np.random.default_rng(random_state).choice(
+                len(X), max_samples, replace=False
+            )
+            X, y_encoded = X[rows], y_encoded[rows]
+
+        # One joblib task per feature; each shuffles its column n_repeats times
+        drops = Parallel(n_jobs=n_jobs)(
+            delayed(_permutation_drops)(
+                self, X, y_encoded, column, n_repeats, random_state
+            )
+            for column in range(X.shape[1])
+        )
+
+        return {
+            "correlation": {
+                feature: float(abs(corr))
+                for feature, corr in zip(self.all_features, correlations)
+            },
+            "permutation": {
+                feature: {"mean": float(np.mean(d)), "std": float(np.std(d))}
+                for feature, d in zip(self.all_features, drops)
+            },
+            "n_samples": int(len(y_encoded)),  # rows used for permutation importance
+            "n_repeats": n_repeats,
+        }
+
+    def importance_report(self, data, target_column="outcome", n_repeats=5, n_jobs=-1):
+        """
+        Feature importance on the given data without modifying the model.
+
+        Args:
+            data: Held-out DataFrame with fight data and target, or a PairDataset
+            target_column: Name of the target column (DataFrame input only)
+            n_repeats: Shuffles per feature for permutation importance
+            n_jobs: joblib workers (-1 = all cores)
+
+        Returns:
+            Dict with absolute correlations and permutation importance
+            (mean/std accuracy drop) per feature
+        """
+        if not self.is_fitted:
+            raise ValueError("Model must be fitted before computing importance")
+
+        X, y = self._features_and_target(data, target_column)
+        y_encoded = self.label_encoder.transform(y)
+        return self._importance_report(
+            X.to_numpy(dtype=float), y_encoded, n_repeats=n_repeats, n_jobs=n_jobs
+        )
+
+    def _chunk_reader(self, source, chunk_rows, target_column="outcome"):
+        """
+        Random access to (features DataFrame, labels) chunks of a fight CSV
+        (only the columns the features need are read) or a PairDataset.
+
+        Returns:
+            (n_chunks, read_chunk) where read_chunk(i) loads the i-th chunk
+        """
+        if isinstance(source, PairDataset):
+
+            def read_chunk(chunk_index):
+                start = chunk_index * chunk_rows
+                stop = min(start + chunk_rows, len(source))
+                X = pd.DataFrame(
+                    source.features(self.all_features, start, stop),
+                    columns=self.all_features,
+                )
+                return X, pd.Series(source.outcomes(start, stop))
+
+            return -(-len(source) // chunk_rows), read_chunk
+
+        columns = self.base_diff_features + [
+            "fighter_1_conqueror_haki",
+            "fighter_2_conqueror_haki",
+            "conqueror_haki_diff",
+            target_column,
+        ]
+        header, offsets = csv_chunk_offsets(source, chunk_rows)
+
+        def read_chunk(chunk_index):
+            with open(source, "rb") as f:
+                f.seek(offsets[chunk_index])
+                chunk = pd.read_csv(
+                    f, header=None, names=header, usecols=columns, nrows=chunk_rows
+                )
+            return self.prepare_features(chunk), chunk[target_column]
+
+        return len(offsets), read_chunk
+
+    def fit_incremental(
+        self,
+        source,
+        target_column="outcome",
+        epochs=5,
+        max_memory_mb=256,
+        test_size=0.2,
+        n_components=500,
+    ):
+        """
+        Train out of core on fight data streamed from disk in chunks.
+
+        Replaces the kernel SVC with `ApproximateKernelClassifier` (SGD over
+        a random Fourier approximation of the RBF kernel). The first pass
+        over the data updates the scaler and collects the classes; each
+        epoch then streams the chunks again through `partial_fit`, visiting
+        the chunks in a fresh random order and shuffling the rows inside
+        each. A pseudo-random `test_size` share of every chunk is held out.
+
+        Args:
+            source: Fight CSV path (e.g. fight_data_cleaned.csv) or a PairDataset
+            target_column: Name of the target column (CSV input only)
+            epochs: Passes over the training data
+            max_memory_mb: Memory ceiling that sets the chunk size
+            test_size: Held-out share of every chunk
+            n_components: Dimension of the kernel feature map
+        """
+        print("Training ONE PIECE Fight Predictor (incremental)...")
+        print("=" * 50)
+
+        self.model = ApproximateKernelClassifier(n_components=n_components)
+        self.kernel_scorer = None
+        self.scaler = StandardScaler()
+
+        # Chunk size from the memory ceiling; mirroring doubles training rows
+        row_bytes = self.model.nbytes_per_row(len(self.all_features)) * (
+            2 if self.symmetric else 1
+        )
+        chunk_rows = max(1000, int(max_memory_mb * 2**20 / row_bytes))
+        print(f"Chunk size: {chunk_rows} fights (memory ceiling {max_memory_mb} MB)")
+
+        n_chunks, read_chunk = self._chunk_reader(source, chunk_rows, target_column)
+
+        def split(chunk_index, n_rows):
+            rng = np.random.default_rng([42, chunk_index])
+            return rng.random(n_rows) < test_size
+
+        # Pass 1: scaler statistics and classes
+        labels = set()
+        n_train = n_test = 0
+        for chunk_index in range(n_chunks):
+            X, y = read_chunk(chunk_index)
+            is_test = split(chunk_index, len(X))
+            labels.update(y.unique())
+            X_train = X[~is_test]
+            if self.symmetric:
+                X_train = pd.concat(
+                    [
+                        X_train,
+                        pd.DataFrame(
+                            mirror_features(X_train, self.all_features),
+                            columns=self.all_features,
+                        ),
+                    ]
+                )
+            self.scaler.partial_fit(X_train)
+            n_train += int((~is_test).sum())
+            n_test += int(is_test.sum())
+
+        self.label_encoder.fit(sorted(labels))
+        classes = np.arange(len(self.label_encoder.classes_))
+        print(f"Features: {len(self.all_features)}")
+        print(f"Samples: {n_train} train, {n_test} held out")
+        print(f"Target classes: {self.label_encoder.classes_}")
+
+        # Passes 2..: stream chunks through partial_fit. SGD is sensitive to
+        # the order it sees the data in, and the fight CSV is sorted by
+        # fighter, so both the chunks and the rows within them are shuffled.
+        for epoch in range(epochs):
+            for chunk_index in np.random.default_rng([42, epoch]).permutation(n_chunks):
+                X, y = read_chunk(chunk_index)
+                is_test = split(chunk_index, len(X))
+                X_train = X[~is_test]
+                y_train = self.label_encoder.transform(y[~is_test])
+                if self.symmetric:
+                    X_train, y_train = self._mirror_training_set(X_train, y_train)
+
+                order = np.random.default_rng([epoch, chunk_index]).permutation(
+                    len(X_train)
+                )
+                self.model.partial_fit(
+                    self._scale(X_train.to_numpy(dtype=float)[order]),
+                    y_train[order],
+                    classes=classes,
+                )
+            print(f"Epoch {epoch + 1}/{epochs} done")
+
         self.is_fitted = True
 
+        # Held-out evaluation, chunk by chunk; importance on the first chunk's hold-out
+        correct = 0
+        importance_X = importance_y = None
+        for chunk_index in range(n_chunks):
+            X, y = read_chunk(chunk_index)
+            is_test = split(chunk_index, len(X))
+            X_test = X[is_test].to_numpy(dtype=float)
+            y_test = self.label_encoder.transform(y[is_test])
+            correct += int((self._predict_encoded(X_test) == y_test).sum())
+            if importance_X is None:
+                importance_X, importance_y = X_test, y_test
+
+        self.test_accuracy = correct / max(n_test, 1)
+        self.feature_importance = self._importance_report(importance_X, importance_y)
+
+        print(f"\nTraining completed!")
+        print(f"Test Accuracy: {self.test_accuracy:.4f}")
+        print(f"Classes: {self.label_encoder.classes_}")
+
         return self
 
+    def _mirror_training_set(self, X_train, y_train):
+        """
+        Append each training fight with the fighters swapped.
+
+        Only the training split is mirrored, so no test fight leaks into
+        training through its reversed orientation.
+        """
+        X_mirrored = pd.DataFrame(
+            mirror_features(X_train, self.all_features),
+            columns=self.all_features,
+            index=X_train.index,
+        )
+        classes = self.label_encoder.classes_
+        swapped = self.label_encoder.transform(swap_outcomes(classes, classes))
+        y_mirrored = swapped[y_train]
+
+        return (
+            pd.concat([X_train, X_mirrored], ignore_index=True),
+            np.concatenate([y_train, y_mirrored]),
+        )
+
     def predict(self, df):
         """
         Predict fight outcomes.
 
         Args:
-            df: DataFrame with fight data
+            df: DataFrame with fight data, or a PairDataset (scored in batches)
 
         Returns:
             predictions: Array of predicted outcomes
@@ -139,20 +601,36 @@ class OnePieceFightPredictor:
         if not self.is_fitted:
             raise ValueError("Model must be fitted before making predictions")
 
-        X = self.prepare_features(df)
-        X_scaled = self.scaler.transform(X)
-
-        predictions_encoded = self.model.predict(X_scaled)
+        if self.symmetric:
+            predictions_encoded = self.predict_proba(df).argmax(axis=1)
+        else:
+            predictions_encoded = np.concatenate(
+                [self._model_predict(self._scale(X)) for X in self._feature_batches(df)]
+            )
         predictions = self.label_encoder.inverse_transform(predictions_encoded)
 
         return predictions
 
-    def predict_proba(self, df):
+    def _unique_proba(self, X):
+        """
+        `proba_from_features` evaluated once per distinct feature row.
+
+        Characters with identical stat lines give identical feature vectors
+        against every opponent; those rows are scored once and the result
+        is fanned back out through the inverse index.
+        """
+        unique, inverse = np.unique(X, axis=0, return_inverse=True)
+        if len(unique) == len(X):
+            return self.proba_from_features(X)
+        return self.proba_from_features(unique)[inverse.ravel()]
+
+    def predict_proba(self, df, deduplicate=True):
         """
         Predict fight outcome probabilities.
 
         Args:
-            df: DataFrame with fight data
+            df: DataFrame with fight data, or a PairDataset (scored in batches)
+            deduplicate: Score each distinct feature vector of a batch once
 
         Returns:
             probabilities: Array of prediction probabilities
@@ -160,30 +638,319 @@ class OnePieceFightPredictor:
         if not self.is_fitted:
             raise ValueError("Model must be fitted before making predictions")
 
-        X = self.prepare_features(df)
-        X_scaled = self.scaler.transform(X)
-
-        probabilities = self.model.predict_proba(X_scaled)
+        score = self._unique_proba if deduplicate else self.proba_from_features
+        probabilities = np.concatenate([score(X) for X in self._feature_batches(df)])
 
         return probabilities
 
+    def _inference_bytes_per_row(self):
+        """Approximate peak working memory per fight while scoring a tile."""
+        # Feature copies (raw, scaled, canonical, unique) plus the
+        # per-row k x k pairwise-coupling matrices; ~1 KB for this model
+        n_classes = len(self.label_encoder.classes_)
+        row_bytes = 8 * (8 * len(self.all_features) + 4 * n_classes**2)
+        if isinstance(self.model, ApproximateKernelClassifier):
+            # Random Fourier features of every row
+            row_bytes += 8 * self.model.n_components
+        return row_bytes
+
+    def _kernel_block_bytes(self):
+        """Kernel working memory of one scoring thread, whatever the tile size."""
+        if self.kernel_scorer is not None:
+            scorer = self.kernel_scorer
+            return (
+                scorer.block_rows * len(scorer.support_vectors) * scorer.dtype.itemsize
+            )
+        # libsvm evaluates the kernel one row at a time, in float64
+        return 8 * len(getattr(self.model, "support_vectors_", ()))
+
+    def _feature_tile(self, data, start, stop):
+        """Unscaled features of rows [start, stop) of a DataFrame or PairDataset."""
+        if isinstance(data, PairDataset):
+            return data.features(self.all_features, start, stop)
+        return self.prepare_features(data.iloc[start:stop]).to_numpy(dtype=float)
+
+    def predict_proba_to_file(
+        self,
+        data,
+        output_file,
+        max_memory_mb=256,
+        n_jobs=None,
+        dtype=np.float32,
+        deduplicate=True,
+    ):
+        """
+        Score a very large batch tile by tile into a memory-mapped .npy file.
+
+        Rows are split into tiles sized so that all threads together stay
+        within `max_memory_mb`, counting each thread's kernel block as well
+        as its tile; each tile's features are computed, scored
+        and written straight into the output file, so neither the feature
+        matrix nor the probabilities of the whole batch are ever held in
+        memory. Within a tile, the NumPy kernel scorer (when enabled with
+        `enable_reduced_precision`) further works in cache-sized blocks.
+
+        Args:
+            data: Fight DataFrame or PairDataset, e.g. every pair of a large roster
+            output_file: .npy file receiving the (n_fights, n_classes) probabilities
+            max_memory_mb: Working-memory ceiling across all threads
+            n_jobs: Threads scoring tiles concurrently (default: CPU count).
+                BLAS, exp and libsvm release the GIL.
+            dtype: Dtype of the stored probabilities
+            deduplicate: Score each distinct feature vector of a tile once
+
+        Returns:
+            Memory-mapped (n_fights, n_classes) array backed by `output_file`
+
+        Raises:
+            ValueError: If `max_memory_mb` cannot hold one row per thread
+                next to the threads' kernel blocks
+        """
+        if not self.is_fitted:
+            raise ValueError("Model must be fitted before making predictions")
+
+        n_jobs = n_jobs or os.cpu_count() or 1
+        n_rows = len(data)
+        thread_bytes = self._kernel_block_bytes() + self._inference_bytes_per_row()
+        tile_bytes = max_memory_mb * 2**20 - n_jobs * self._kernel_block_bytes()
+        tile_rows = int(tile_bytes / (n_jobs * self._inference_bytes_per_row()))
+        if tile_rows < 1:
+            raise ValueError(
+                f"max_memory_mb={max_memory_mb} is too small for {n_jobs} threads; "
+                f"need at least {n_jobs * thread_bytes / 2**20:.2f} MB"
+            )
+        output = np.lib.format.open_memmap(
+            output_file,
+            mode="w+",
+            dtype=dtype,
+            shape=(n_rows, len(self.label_encoder.classes_)),
+        )
+        score = self._unique_proba if deduplicate else self.proba_from_features
+
+        def score_tile(start):
+            stop = min(start + tile_rows, n_rows)
+            output[start:stop] = score(self._feature_tile(data, start, stop))
+
+        with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+            # list() re-raises the first exception from a tile
+            list(pool.map(score_tile, range(0, n_rows, tile_rows)))
+
+        output.flush()
+        return output
+
+    def explain(self, X, method="occlusion", baseline=None):
+        """
+        Per-prediction feature attributions, computed with one batched
+        `predict_proba` call for all fights and perturbations.
+
+        Methods:
+            occlusion: attribution of a feature = P(x) - P(x with that
+                feature set to its baseline value); n_features + 1 rows per fight
+            shapley: exact Shapley values over all 2^n_features coalitions
+                of features kept vs. set to baseline; they sum to
+                P(x) - P(baseline)
+
+        Args:
+            X: (n_fights, len(all_features)) unscaled feature matrix
+            method: "occlusion" or "shapley"
+            baseline: Reference feature values (default: the training mean)
+
+        Returns:
+            (probabilities (n_fights, n_classes),
+             attributions (n_fights, n_features, n_classes))
+        """
+        if not self.is_fitted:
+            raise ValueError("Model must be fitted before explaining predictions")
+
+        X = np.atleast_2d(np.asarray(X, dtype=float))
+        n_fights, n_features = X.shape
+        if baseline is None:
+            baseline = self.scaler.mean_
+        baseline = np.asarray(baseline, dtype=float)
+
+        if method == "occlusion":
+            # Row 0 keeps every feature; row k + 1 replaces feature k
+            keep = ~np.vstack(
+                [np.zeros(n_features, dtype=bool), np.eye(n_features, dtype=bool)]
+            )
+        elif method == "shapley":
+            coalitions = np.arange(2**n_features)
+            keep = (coalitions[:, None] >> np.arange(n_features)) & 1 == 1
+        else:
+            raise ValueError(f"Unknown explanation method '{method}'")
+
+        rows = np.where(keep[None, :, :], X[:, None, :], baseline)
+        probabilities = self.proba_from_features(rows.reshape(-1, n_features))
+        probabilities = probabilities.reshape(n_fights, len(keep), -1)
+
+        if method == "occlusion":
+            attributions = probabilities[:, :1, :] - probabilities[:, 1:, :]
+            return probabilities[:, 0, :], attributions
+
+        # Shapley weight |S|! (n - |S| - 1)! / n! of each coalition S without i
+        sizes = keep.sum(axis=1)
+        factorial = np.cumprod([1.0] + list(range(1, n_features + 1)))
+        weights = factorial[sizes] * factorial[np.maximum(n_features - sizes - 1, 0)]
+        weights /= factorial[n_features]
+
+        attributions = np.empty((n_fights, n_features, probabilities.shape[2]))
+        for i in range(n_features):
+            without = coalitions[~keep[:, i]]
+            with_i = without | (1 << i)
+            marginal = probabilities[:, with_i, :] - probabilities[:, without, :]
+            attributions[:, i, :] = np.tensordot(
+                weights[without], marginal, axes=([0], [1])
+            )
+
+        return probabilities[:, -1, :], attributions
+
+    def enable_reduced_precision(
+        self,
+        data,
+        dtype=np.float32,
+        max_label_disagreement=0.001,
+        max_probability_error=0.01,
+    ):
+        """
+        Switch inference to a NumPy RBF scorer at reduced precision, after
+        checking it against the float64 scikit-learn model.
+
+        The scorer is only activated if, on `data`, the share of predicted
+        labels that change and the largest absolute probability difference
+        both stay within their thresholds. Otherwise the predictor keeps
+        using the float64 model.
+
+        Args:
+            data: Validation fights: DataFrame, PairDataset or unscaled
+                feature matrix (e.g. every roster pair in both orientations)
+            dtype: Precision of the kernel evaluation
+            max_label_disagreement: Largest tolerated share of changed labels
+            max_probability_error: Largest tolerated probability difference
+
+        Returns:
+            Dict with the measured disagreement and whether the mode is active
+        """
+        if not self.is_fitted:
+            raise ValueError("Model must be fitted before enabling reduced precision")
+
+        report = {"dtype": np.dtype(dtype).name, "activated": False}
+        try:
+            scorer = RBFKernelScorer(self.model, dtype=dtype)
+        except TypeError as e:
+            report["reason"] = str(e)
+            print(f"Reduced precision not enabled: {e}")
+            return report
+
+        if isinstance(data, np.ndarray):
+            X = data
+        else:
+            X = np.concatenate(list(self._feature_batches(data)))
+        X_scaled = self._scale(X)
+
+        reference_proba = self.model.predict_proba(X_scaled)
+        reference_labels = self.model.predict(X_scaled)
+        proba = scorer.predict_proba(X_scaled)
+        labels = scorer.predict(X_scaled)
+
+        report.update(
+            {
+                "rows": int(len(X)),
+                "label_disagreement": float(np.mean(labels != reference_labels)),
+                "argmax_disagreement": float(
+                    np.mean(proba.argmax(axis=1) != reference_proba.argmax(axis=1))
+                ),
+                "max_probability_error": float(np.abs(proba - reference_proba).max()),
+            }
+        )
+        report["activated"] = (
+            report["label_disagreement"] <= max_label_disagreement
+            and report["argmax_disagreement"] <= max_label_disagreement
+            and report["max_probability_error"] <= max_probability_error
+        )
+
+        if report["activated"]:
+            self.kernel_scorer = scorer
+            print(
+                f"{report['dtype']} inference enabled ({report['rows']} validation fights, "
+                f"label disagreement {report['label_disagreement']:.4%}, "
+                f"max probability error {report['max_probability_error']:.2e})"
+            )
+        else:
+            print(f"Reduced precision not enabled, outside tolerance: {report}")
+        return report
+
+    def pairwise_proba(self, roster):
+        """
+        Outcome probabilities for every ordered pair of roster characters.
+
+        In symmetric mode only the i < j pairs are scored and (j, i) is
+        derived by swapping victory and loss, halving the work.
+
+        Args:
+            roster: Cleaned roster DataFrame or CSV path, or a PairDataset
+                built with `PairDataset.from_roster`
+
+        Returns:
+            (n, n, n_classes) array; [i, j] is character i as fighter 1 against
+            character j. The diagonal (self-fights) is NaN.
+        """
+        pairs = (
+            roster
+            if isinstance(roster, PairDataset)
+            else PairDataset.from_roster(roster)
+        )
+        n = len(pairs.names)
+
+        upper = self.predict_proba(pairs)
+        if self.symmetric:
+            lower = swap_outcomes(upper, self.label_encoder.classes_)
+        else:
+            lower = self.predict_proba(pairs.mirrored())
+
+        matrix = np.full((n, n, upper.shape[1]), np.nan)
+        matrix[pairs.idx1, pairs.idx2] = upper
+        matrix[pairs.idx2, pairs.idx1] = lower
+        return matrix
+
+    def symmetry_gap(self, data):
+        """
+        Consistency check between the two orientations of the same fights.
+
+        Returns:
+            Largest absolute difference between P(B vs A) and P(A vs B) with
+            victory and loss swapped. 0 (up to rounding) in symmetric mode.
+        """
+        if isinstance(data, PairDataset):
+            mirrored_proba = self.predict_proba(data.mirrored())
+        else:
+            X = self.prepare_features(data).to_numpy(dtype=float)
+            mirrored_proba = self.proba_from_features(
+                mirror_features(X, self.all_features)
+            )
+        expected = swap_outcomes(self.predict_proba(data), self.label_encoder.classes_)
+        return float(np.abs(mirrored_proba - expected).max())
+
     def get_feature_importance(self, df):
         """
         Analyze feature correlations with the target variable.
 
         Args:
-            df: DataFrame with fight data and target
+            df: DataFrame with fight data and target, or a PairDataset
 
         Returns:
             correlations: Sorted list of (feature, correlation) tuples
         """
-        X = self.prepare_features(df)
-        y_encoded = self.label_encoder.fit_transform(df["outcome"])
+        X, y = self._features_and_target(df)
 
-        correlations = []
-        for feature in self.all_features:
-            corr = np.corrcoef(X[feature], y_encoded)[0, 1]
-            correlations.append((feature, abs(corr)))
+        # Encode without refitting, so a loaded model's encoder is untouched
+        if self.is_fitted:
+            y_encoded = self.label_encoder.transform(y)
+        else:
+            y_encoded = LabelEncoder().fit_transform(y)
+
+        correlations = list(
+            zip(self.all_features, np.abs(feature_correlations(X, y_encoded)).tolist())
+        )
 
         # Sort by absolute correlation
         correlations.sort(key=lambda x: x[1], reverse=True)
@@ -205,36 +972,63 @@ class OnePieceFightPredictor:
             "scaler": self.scaler,
             "label_encoder": self.label_encoder,
             "features": self.all_features,
+            "symmetric": self.symmetric,
+            "test_accuracy": self.test_accuracy,
+            "feature_importance": self.feature_importance,
         }
 
-        os.makedirs('models', exist_ok=True)
-        joblib.dump(model_data, 'models/svm_fight_predictor.pkl')
-        joblib.dump(self.label_encoder, 'models/label_encoder.pkl')
-        joblib.dump(self.scaler, 'models/feature_scaler.pkl')
+        # Preprocessors and metadata are written next to the model file
+        model_dir = os.path.dirname(filepath) or "."
+        os.makedirs(model_dir, exist_ok=True)
+        joblib.dump(model_data, filepath)
+        # Pickle-free copy of the same model, loaded by the API when present
+        save_artifact(model_data, os.path.splitext(filepath)[0] + ".npz")
+        joblib.dump(self.label_encoder, os.path.join(model_dir, "label_encoder.pkl"))
+        joblib.dump(self.scaler, os.path.join(model_dir, "feature_scaler.pkl"))
 
         metadata = {
             "features": self.all_features,
             "classes": self.label_encoder.classes_.tolist(),
+            "symmetric": self.symmetric,
+            "test_accuracy": self.test_accuracy,
+            "feature_importance": self.feature_importance,
         }
-        with open('models/model_metadata.json', 'w') as f:
+        with open(os.path.join(model_dir, "model_metadata.json"), "w") as f:
             json.dump(metadata, f, indent=2)
 
         print(f"Model and metadata saved to {filepath}")
 
-    def load_model(self, filepath):
+    def load_model_data(self, model_data):
         """
-        Load a trained model and preprocessors.
+        Restore a fitted predictor from the dict written by `save_model`.
 
         Args:
-            filepath: Path to the saved model
+            model_data: Dict with model, scaler, label_encoder and features
         """
-        model_data = joblib.load(filepath)
-
         self.model = model_data["model"]
         self.scaler = model_data["scaler"]
         self.label_encoder = model_data["label_encoder"]
         self.all_features = model_data["features"]
+        self.symmetric = model_data.get("symmetric", False)
+        self.test_accuracy = model_data.get("test_accuracy")
+        self.feature_importance = model_data.get("feature_importance")
+        self.kernel_scorer = None
         self.is_fitted = True
+        return self
+
+    def load_model(self, filepath, mmap=True):
+        """
+        Load a trained model and preprocessors.
+
+        Args:
+            filepath: Path to the saved model; a .npz artifact is loaded
+                without pickle
+            mmap: Memory-map the arrays of a .npz artifact
+        """
+        if filepath.endswith(".npz"):
+            self.load_model_data(load_artifact(filepath, mmap=mmap))
+        else:
+            self.load_model_data(joblib.load(filepath))
 
         print(f"Model loaded from {filepath}")
         return self
@@ -265,8 +1059,23 @@ def main():
         marker = "🔥" if "conqueror" in feature else "  "
         print(f"{i:2d}. {marker} {feature}: {corr:.3f}")
 
-    # Save model
-    predictor.save_model("../../models/one_piece_fight_predictor.pkl")
+    print("\nPERMUTATION IMPORTANCE (held-out accuracy drop)")
+    print("=" * 40)
+    permutation = sorted(
+        predictor.feature_importance["permutation"].items(),
+        key=lambda item: item[1]["mean"],
+        reverse=True,
+    )
+    for i, (feature, drop) in enumerate(permutation[:10], 1):
+        marker = "🔥" if "conqueror" in feature else "  "
+        print(f"{i:2d}. {marker} {feature}: {drop['mean']:.3f} ± {drop['std']:.3f}")
+
+    # Check that swapping the fighters swaps victory and loss
+    gap = predictor.symmetry_gap(df)
+    print(f"\nOrientation consistency: max |P(B vs A) - swap(P(A vs B))| = {gap:.4f}")
+
+    # Save model where the API loads it from
+    predictor.save_model("src/models/svm_fight_predictor.pkl")
 
     print("\nModel training and deployment preparation complete!")
 
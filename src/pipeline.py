@@ -0,0 +1,453 @@
+"""
+End-to-end data pipeline: raw scrape -> cleaned roster -> fights -> outcomes
+-> model features -> trained model.
+
+Each stage declares its input and output files. A stage is skipped when the
+content hash of its inputs, its code and its parameters matches the last
+successful run recorded in the manifest and its outputs are unchanged.
+Stages whose inputs are ready run in parallel.
+
+    python -m src.pipeline                      # run what is out of date
+    python -m src.pipeline --from-stage fights  # force fights, then downstream as needed
+    python -m src.pipeline --list
+"""
+
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Callable, Dict, List
+import pandas as pd
+import importlib.util
+import argparse
+import hashlib
+import inspect
+import ast
+import json
+import time
+import os
+
+from src.preprocessing.preprocessor import clean_character_data, fix_conqueror_haki
+from src.preprocessing.fight_generator import create_fight_data, select_model_features
+from src.preprocessing.fight_outcome_generator import add_fight_outcomes
+from src.models.svm_model import OnePieceFightPredictor
+
+# Modules under this package count as stage code for cache keys
+LOCAL_PACKAGE = "src"
+
+# Bump to invalidate every cached stage
+PIPELINE_VERSION = 1
+
+MANIFEST_FILE = "data/.pipeline_manifest.json"
+
+RAW_CHARACTER_FILE = "data/raw/character_data.csv"
+CLEANED_CHARACTER_FILE = "data/processed/character_data_cleaned.csv"
+UNLABELED_FIGHT_FILE = "data/processed/fight_data_unlabeled.csv"
+FIGHT_FILE = "data/processed/fight_data.csv"
+MODEL_FIGHT_FILE = "data/processed/fight_data_cleaned.csv"
+MODEL_DIR = "src/models"
+MODEL_FILE = os.path.join(MODEL_DIR, "svm_fight_predictor.pkl")
+
+
+class Stage:
+    """A pipeline step with declared file inputs and outputs."""
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable,
+        inputs: List[str],
+        outputs: List[str],
+        code: List[Callable] = (),
+        params: Dict = None,
+        optional_inputs: Dict[str, str] = None,
+    ):
+        self.name = name
+        self.func = func
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        # Extra functions/classes whose source files affect this stage
+        self.code = [func] + list(code)
+        self.params = params or {}
+        # Keyword argument -> file read only if it exists (e.g. a downstream
+        # table updated in place). Part of the cache key, but neither a
+        # scheduling dependency nor required to exist.
+        self.optional_inputs = dict(optional_inputs or {})
+
+    def run(self):
+        return self.func(
+            *self.inputs, *self.outputs, **self.optional_inputs, **self.params
+        )
+
+
+def _clean_stage(raw_file, cleaned_file):
+    clean_character_data(raw_file, cleaned_file)
+    fix_conqueror_haki(cleaned_file)
+
+
+def _fight_stage(cleaned_file, unlabeled_file, base_file=None, incremental=False):
+    # Incremental updates start from the labelled table, so the outcomes of
+    # unchanged pairs carry over and only new pairs are scored
+    create_fight_data(
+        cleaned_file, unlabeled_file, incremental=incremental, base_file=base_file
+    )
+
+
+def _outcome_stage(unlabeled_file, fight_file, incremental=False):
+    add_fight_outcomes(unlabeled_file, output_file=fight_file, incremental=incremental)
+
+
+def _train_stage(
+    fight_file, model_file, *_sibling_files, symmetric=False, out_of_core=False
+):
+    predictor = OnePieceFightPredictor(symmetric=symmetric)
+    if out_of_core:
+        # Stream the fight table from disk instead of loading it whole
+        predictor.fit_incremental(fight_file)
+    else:
+        predictor.fit(pd.read_csv(fight_file))
+    predictor.save_model(model_file)
+
+
+STAGES = [
+    Stage(
+        "clean",
+        _clean_stage,
+        inputs=[RAW_CHARACTER_FILE],
+        outputs=[CLEANED_CHARACTER_FILE],
+        code=[clean_character_data, fix_conqueror_haki],
+    ),
+    Stage(
+        "fights",
+        _fight_stage,
+        inputs=[CLEANED_CHARACTER_FILE],
+        outputs=[UNLABELED_FIGHT_FILE],
+        code=[create_fight_data],
+        params={"incremental": False},
+        optional_inputs={"base_file": FIGHT_FILE},
+    ),
+    Stage(
+        "outcomes",
+        _outcome_stage,
+        inputs=[UNLABELED_FIGHT_FILE],
+        outputs=[FIGHT_FILE],
+        code=[add_fight_outcomes],
+        params={"incremental": False},
+    ),
+    Stage(
+        "select",
+        select_model_features,
+        inputs=[FIGHT_FILE],
+        outputs=[MODEL_FIGHT_FILE],
+    ),
+    Stage(
+        "train",
+        _train_stage,
+        inputs=[MODEL_FIGHT_FILE],
+        outputs=[
+            MODEL_FILE,
+            os.path.join(MODEL_DIR, "svm_fight_predictor.npz"),
+            os.path.join(MODEL_DIR, "label_encoder.pkl"),
+            os.path.join(MODEL_DIR, "feature_scaler.pkl"),
+            os.path.join(MODEL_DIR, "model_metadata.json"),
+        ],
+        code=[OnePieceFightPredictor],
+        params={"symmetric": False, "out_of_core": False},
+    ),
+]
+
+
+def file_hash(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _module_file(name: str):
+    try:
+        spec = importlib.util.find_spec(name)
+    except (ImportError, ValueError):
+        return None
+    return spec.origin if spec is not None and spec.origin != "built-in" else None
+
+
+def _local_imports(module_name: str, source_file: str) -> set:
+    """Names of the `src.*` modules imported anywhere in a source file."""
+    with open(source_file, "rb") as f:
+        tree = ast.parse(f.read(), filename=source_file)
+
+    package = (
+        module_name
+        if source_file.endswith("__init__.py")
+        else module_name.rpartition(".")[0]
+    )
+    imported = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            imported.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                base = (
+                    package.rsplit(".", node.level - 1)[0]
+                    if node.level > 1
+                    else package
+                )
+                module = f"{base}.{node.module}" if node.module else base
+            else:
+                module = node.module
+            imported.add(module)
+            # `from package import submodule`
+            imported.update(f"{module}.{alias.name}" for alias in node.names)
+
+    return {
+        name
+        for name in imported
+        if name == LOCAL_PACKAGE or name.startswith(LOCAL_PACKAGE + ".")
+    }
+
+
+def code_files(objects) -> List[str]:
+    """
+    Source files of the given functions/classes plus every `src.*` module
+    they import, transitively.
+    """
+    pending = [
+        inspect.getmodule(obj).__name__ for obj in objects if not _is_pipeline_code(obj)
+    ]
+    seen, files = set(), set()
+    while pending:
+        name = pending.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        source_file = _module_file(name)
+        if source_file is None or not source_file.endswith(".py"):
+            continue
+        files.add(source_file)
+        pending.extend(_local_imports(name, source_file) - seen)
+    return sorted(files)
+
+
+def _is_pipeline_code(obj) -> bool:
+    # Stage wrappers defined in this file: hashed by their own source, since
+    # this module imports every stage's code
+    return inspect.getsourcefile(obj) == inspect.getsourcefile(_is_pipeline_code)
+
+
+def code_hash(objects) -> str:
+    """Hash the source files of the given functions/classes and their local imports."""
+    digest = hashlib.sha256()
+    for obj in objects:
+        if _is_pipeline_code(obj):
+            digest.update(inspect.getsource(obj).encode())
+    for source_file in code_files(objects):
+        digest.update(
+            os.path.relpath(
+                source_file, os.path.dirname(os.path.dirname(__file__))
+            ).encode()
+        )
+        with open(source_file, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def stage_key(stage: Stage) -> str:
+    """Cache key from the stage's input contents, code and parameters."""
+    digest = hashlib.sha256()
+    digest.update(f"{PIPELINE_VERSION}:{stage.name}".encode())
+    digest.update(code_hash(stage.code).encode())
+    digest.update(json.dumps(stage.params, sort_keys=True, default=str).encode())
+    for path in stage.inputs:
+        digest.update(path.encode())
+        digest.update(file_hash(path).encode())
+    for name, path in sorted(stage.optional_inputs.items()):
+        digest.update(f"{name}={path}".encode())
+        digest.update(file_hash(path).encode() if os.path.exists(path) else b"missing")
+    return digest.hexdigest()
+
+
+def stage_dependencies(stages: List[Stage]) -> Dict[str, set]:
+    """Map each stage to the stages producing its inputs."""
+    producers = {path: stage.name for stage in stages for path in stage.outputs}
+    return {
+        stage.name: {producers[path] for path in stage.inputs if path in producers}
+        for stage in stages
+    }
+
+
+def downstream_of(stage_name: str, stages: List[Stage]) -> set:
+    """The named stage plus every stage that (transitively) consumes its outputs."""
+    dependencies = stage_dependencies(stages)
+    selected = {stage_name}
+    changed = True
+    while changed:
+        changed = False
+        for name, upstream in dependencies.items():
+            if name not in selected and upstream & selected:
+                selected.add(name)
+                changed = True
+    return selected
+
+
+def _load_manifest(manifest_file: str) -> Dict:
+    if os.path.exists(manifest_file):
+        with open(manifest_file, "r") as f:
+            return json.load(f)
+    return {}
+
+
+def _save_manifest(manifest: Dict, manifest_file: str):
+    os.makedirs(os.path.dirname(manifest_file) or ".", exist_ok=True)
+    tmp_file = f"{manifest_file}.tmp"
+    with open(tmp_file, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_file, manifest_file)
+
+
+def _is_cached(stage: Stage, key: str, manifest: Dict) -> bool:
+    entry = manifest.get(stage.name)
+    if not entry or entry.get("key") != key:
+        return False
+    for path in stage.outputs:
+        if not os.path.exists(path) or entry["outputs"].get(path) != file_hash(path):
+            return False
+    return True
+
+
+def run_pipeline(
+    stages: List[Stage] = STAGES,
+    from_stage: str = None,
+    force: bool = False,
+    jobs: int = 2,
+    manifest_file: str = MANIFEST_FILE,
+) -> Dict[str, str]:
+    """
+    Run the pipeline, skipping stages whose cached outputs are up to date.
+
+    Args:
+        stages: Stage definitions
+        from_stage: Start at this stage. It is always rerun; stages upstream
+            of it are not run, stages downstream run only if their inputs changed.
+        force: Rerun every selected stage regardless of the cache
+        jobs: Maximum number of stages to run concurrently
+        manifest_file: Where cache keys and output hashes are recorded
+
+    Returns:
+        Dict mapping stage name to "ran" or "cached"
+    """
+    by_name = {stage.name: stage for stage in stages}
+    if from_stage is not None and from_stage not in by_name:
+        raise ValueError(f"Unknown stage '{from_stage}'. Stages: {list(by_name)}")
+
+    selected = downstream_of(from_stage, stages) if from_stage else set(by_name)
+    dependencies = {
+        name: upstream & selected
+        for name, upstream in stage_dependencies(stages).items()
+        if name in selected
+    }
+
+    manifest = _load_manifest(manifest_file)
+    status = {}
+    running = {}
+    pending_keys = {}
+
+    def submit_ready(executor):
+        for name in [s.name for s in stages if s.name in dependencies]:
+            if name in status or name in running.values():
+                continue
+            if not dependencies[name] <= set(status):
+                continue
+
+            stage = by_name[name]
+            missing = [path for path in stage.inputs if not os.path.exists(path)]
+            if missing:
+                raise FileNotFoundError(f"Stage '{name}' is missing inputs: {missing}")
+
+            key = stage_key(stage)
+            if not force and name != from_stage and _is_cached(stage, key, manifest):
+                print(f"[pipeline] {name}: up to date, skipping")
+                status[name] = "cached"
+                return True
+
+            print(f"[pipeline] {name}: running")
+            running[executor.submit(_timed_run, stage)] = name
+            pending_keys[name] = key
+        return False
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        while len(status) < len(dependencies):
+            # Cached stages can unlock further stages immediately
+            while submit_ready(executor):
+                pass
+            if not running:
+                break
+
+            done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                elapsed = future.result()
+                stage = by_name[name]
+                manifest[name] = {
+                    "key": pending_keys.pop(name),
+                    "outputs": {path: file_hash(path) for path in stage.outputs},
+                    "seconds": round(elapsed, 2),
+                }
+                _save_manifest(manifest, manifest_file)
+                status[name] = "ran"
+                print(f"[pipeline] {name}: done in {elapsed:.1f}s")
+
+    return status
+
+
+def _timed_run(stage: Stage) -> float:
+    start = time.perf_counter()
+    stage.run()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the data/model pipeline")
+    parser.add_argument(
+        "--from-stage",
+        choices=[stage.name for stage in STAGES],
+        help="Rerun this stage and anything downstream whose inputs change",
+    )
+    parser.add_argument("--force", action="store_true", help="Ignore the cache")
+    parser.add_argument("--jobs", type=int, default=2, help="Parallel stages")
+    parser.add_argument("--list", action="store_true", help="List stages and exit")
+    parser.add_argument(
+        "--symmetric",
+        action="store_true",
+        help="Train on mirrored fights and predict both orientations consistently",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only build and score the fights of new or re-rated characters",
+    )
+    parser.add_argument(
+        "--out-of-core",
+        action="store_true",
+        help="Train with SGD on an approximate RBF kernel, streaming the fight table",
+    )
+    args = parser.parse_args()
+
+    params = {stage.name: stage.params for stage in STAGES}
+    params["fights"]["incremental"] = args.incremental
+    params["outcomes"]["incremental"] = args.incremental
+    params["train"]["symmetric"] = args.symmetric
+    params["train"]["out_of_core"] = args.out_of_core
+
+    if args.list:
+        for stage in STAGES:
+            inputs = stage.inputs + [
+                f"{path} (if present)" for path in stage.optional_inputs.values()
+            ]
+            print(f"{stage.name:<10} {inputs} -> {stage.outputs}")
+        return
+
+    status = run_pipeline(from_stage=args.from_stage, force=args.force, jobs=args.jobs)
+    print(f"\nPipeline finished: {status}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+import pandas as pd
+import unicodedata
+import re
+
+# Canonical name (as it appears in character_data_cleaned.csv) -> other
+# spellings seen in wiki slugs, the poll list, epithets and older data.
+CHARACTER_ALIASES = {
+    "Kaidou": ["Kaido", "Kaido of the Beasts"],
+    "Charlotte Linlin": ["Big Mom", "Charlotte Big Mom"],
+    "Edward Newgate": ["Whitebeard"],
+    "Gol D. Roger": ["Gold Roger", "Gol D Rogers"],
+    "Shanks": ["Red-Haired Shanks"],
+    "Silvers Rayleigh": ["Dark King Rayleigh"],
+    "Portgas D. Ace": ["Fire Fist Ace"],
+    "Sengoku": ["Buddha Sengoku"],
+    "Eustass Kid": ["Eustass Captain Kid", "Captain Kid"],
+    "Roronoa Zoro": ["Pirate Hunter Zoro"],
+    "Kouzuki Oden": ["Kozuki Oden"],
+    "Kouzuki Hiyori": ["Kozuki Hiyori", "Kozui Hiyori"],
+    "Trafalgar D. Water Law": ["Trafalgar Law"],
+    "Nefertari Vivi": ["Nefetari Vivi"],
+    "Izou": ["Izo"],
+    "Kurozumi Tama": ["Otama"],
+    "Hiriluk": ["Dr. Hiriluk"],
+    "Namur": ["Namule"],
+    "Bell-mère": ["Bellemere", "Belle-Mere"],
+    "Animal Species/Arabasta Saga": ["Kung Fu Dugong"],
+    "Charlotte Mont-d'Or": ["Charlotte Mont Dor"],
+    "Chouchou": ["Shushu"],
+    "Kin'emon": ["Kinemon"],
+}
+
+# Confirmed Conqueror's Haki users from the One Piece wiki
+CONQUEROR_HAKI_USERS = [
+    # Supreme King Haki Users (Current/Alive)
+    "Shanks",
+    "Monkey D. Luffy",
+    "Silvers Rayleigh",
+    "Boa Hancock",
+    "Donquixote Doflamingo",
+    "Chinjao",
+    "Charlotte Linlin",
+    "Charlotte Katakuri",
+    "Eustass Kid",
+    "Sengoku",
+    "Kaidou",
+    "Roronoa Zoro",
+    "Yamato",
+    "Monkey D. Garp",
+    "Topman Marcus",
+    "Marcus Mars",
+    "Scopper Gaban",
+    "Imu",
+    # Deceased Users
+    "Edward Newgate",
+    "Portgas D. Ace",
+    "Kouzuki Oden",
+    "Gol D. Roger",
+    "Joy Boy",
+    "Jaygarcia Saturn",
+    "Rocks D. Xebec",
+    "Harald",
+    # Non-Canon Users
+    "Naguri",
+    "Douglas Bullet",
+]
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalize a character name for lookup.
+
+    "Monkey_D_Luffy", "Monkey D. Luffy" and "monkey d luffy" all map to
+    "monkey d luffy"; accents are dropped ("Bell-mère" -> "bell mere").
+    """
+    ascii_name = (
+        unicodedata.normalize("NFKD", str(name)).encode("ascii", "ignore").decode()
+    )
+    return _NON_ALNUM.sub(" ", ascii_name.lower()).strip()
+
+
+def normalize_names(names: pd.Series) -> pd.Series:
+    """Vectorized `normalize_name` over a Series of names."""
+    return (
+        names.astype(str)
+        .str.normalize("NFKD")
+        .str.encode("ascii", "ignore")
+        .str.decode("ascii")
+        .str.lower()
+        .str.replace(_NON_ALNUM, " ", regex=True)
+        .str.strip()
+    )
+
+
+def alias_keys(canonical_names, aliases=CHARACTER_ALIASES) -> set:
+    """Normalized keys of the given canonical names and all their aliases."""
+    keys = set()
+    for name in canonical_names:
+        keys.add(normalize_name(name))
+        keys.update(normalize_name(alias) for alias in aliases.get(name, []))
+    return keys
+
+
+class AliasIndex:
+    """
+    Resolve any spelling of a character name to its roster name.
+
+    Built once from the roster's names plus the alias table; lookups are a
+    single dict access on the normalized name.
+    """
+
+    def __init__(self, roster_names, aliases=CHARACTER_ALIASES):
+        self.names = list(roster_names)
+        self._index = {}
+
+        for name in self.names:
+            self._index[normalize_name(name)] = name
+
+        for canonical, alternatives in aliases.items():
+            roster_name = self._index.get(normalize_name(canonical))
+            if roster_name is None:
+                continue
+            for alias in alternatives:
+                self._index.setdefault(normalize_name(alias), roster_name)
+
+    def resolve(self, name: str):
+        """Return the roster name for `name`, or None if it is unknown."""
+        return self._index.get(normalize_name(name))
+
+    def resolve_series(self, names: pd.Series) -> pd.Series:
+        """Vectorized `resolve`; unknown names become NaN."""
+        return normalize_names(names).map(self._index)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Alias table as a (key, name) DataFrame, for merges."""
+        return pd.DataFrame(list(self._index.items()), columns=["key", "name"])
+
+    def __contains__(self, name: str) -> bool:
+        return self.resolve(name) is not None
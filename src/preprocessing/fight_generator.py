@@ -1,62 +1,156 @@
 import pandas as pd
-from itertools import combinations
+import numpy as np
+import os
 
 
-def create_fight_data(cleaned_character_file, output_file):
+def build_fight_rows(df, idx1, idx2, attributes):
+    """
+    Build fight rows for the given fighter pairs in one vectorized pass.
+
+    Args:
+        df: Roster DataFrame (name + attribute columns)
+        idx1, idx2: Integer position arrays of fighter 1 and fighter 2
+        attributes: Attribute columns to include
+
+    Returns:
+        DataFrame in the fight table layout: names, then per attribute the
+        fighter_1/fighter_2 values, `_diff` and `_advantage`
+    """
+    names = df["name"].to_numpy()
+    names_1 = names[idx1]
+    names_2 = names[idx2]
+
+    columns = {
+        "fight_name": pd.Series(names_1, dtype=object) + " vs " + names_2,
+        "fighter_1_name": names_1,
+        "fighter_2_name": names_2,
+    }
+
+    for attr in attributes:
+        values = df[attr].to_numpy(dtype=float)
+        values_1 = values[idx1]
+        values_2 = values[idx2]
+        both_known = ~(np.isnan(values_1) | np.isnan(values_2))
+
+        columns[f"fighter_1_{attr}"] = values_1
+        columns[f"fighter_2_{attr}"] = values_2
+        # Difference features (fighter_1 - fighter_2)
+        columns[f"{attr}_diff"] = values_1 - values_2
+        # Binary comparison (1 if fighter_1 > fighter_2, 0 otherwise)
+        advantage = (values_1 > values_2).astype(float)
+        advantage[~both_known] = np.nan
+        columns[f"{attr}_advantage"] = (
+            advantage.astype(int) if both_known.all() else advantage
+        )
+
+    return pd.DataFrame(columns)
+
+
+def _stats_from_fights(fight_df, attributes):
+    """Recover each character's attributes from an existing fight table."""
+    sides = []
+    for side in ("fighter_1", "fighter_2"):
+        side_columns = {f"{side}_name": "name"}
+        side_columns.update({f"{side}_{attr}": attr for attr in attributes})
+        present = [col for col in side_columns if col in fight_df.columns]
+        sides.append(fight_df[present].rename(columns=side_columns))
+    return pd.concat(sides).drop_duplicates(subset=["name"]).set_index("name")
+
+
+def _changed_characters(df, existing_df, attributes):
+    """Names that are new in the roster or whose attributes were re-rated."""
+    old_stats = _stats_from_fights(existing_df, attributes)
+    roster = df.set_index("name")[attributes]
+
+    known = roster.index.isin(old_stats.index)
+    changed = set(roster.index[~known])
+
+    common = roster[known]
+    old_common = old_stats.reindex(index=common.index, columns=attributes)
+    differs = ~(
+        np.isclose(common.to_numpy(float), old_common.to_numpy(float), equal_nan=True)
+    ).all(axis=1)
+    changed.update(common.index[differs])
+
+    removed = set(old_stats.index) - set(roster.index)
+    return changed, removed
+
+
+def create_fight_data(
+    cleaned_character_file, output_file, incremental=False, base_file=None
+):
     """
     Create fight data using hybrid approach: separate columns + differences + binary comparisons.
+
+    Args:
+        cleaned_character_file: Cleaned roster CSV
+        output_file: Fight table CSV to write
+        incremental: If the existing table exists, only build the pairs
+            involving characters that were added or re-rated (n - 1 pairs per
+            character) and merge them into it. Rows of unchanged pairs,
+            including any outcome columns, are kept as is; rows involving
+            removed characters are dropped. Only the feature computation
+            shrinks: the existing table is still read and the whole table is
+            rewritten, so file I/O stays proportional to all n^2 / 2 pairs.
+        base_file: Existing table to update in incremental mode (default:
+            `output_file`), e.g. the labelled fight table so that its
+            outcomes are carried over
     """
     # Read the cleaned character data
     df = pd.read_csv(cleaned_character_file)
 
     # Remove any rows with missing names
-    df = df.dropna(subset=["name"])
-
-    print(f"Creating fights for {len(df)} characters...")
+    df = df.dropna(subset=["name"]).reset_index(drop=True)
 
     # Get all attribute columns (excluding 'name')
     attributes = [col for col in df.columns if col != "name"]
 
-    fight_data = []
-
-    # Generate all possible fight combinations
-    for i, (idx1, fighter1) in enumerate(df.iterrows()):
-        for idx2, fighter2 in df.iterrows():
-            if idx1 >= idx2:  # Avoid duplicates and self-fights
-                continue
-
-            fight_row = {
-                "fight_name": f"{fighter1['name']} vs {fighter2['name']}",
-                "fighter_1_name": fighter1["name"],
-                "fighter_2_name": fighter2["name"],
-            }
-
-            # Add separate columns for each fighter
-            for attr in attributes:
-                fight_row[f"fighter_1_{attr}"] = fighter1[attr]
-                fight_row[f"fighter_2_{attr}"] = fighter2[attr]
-
-                # Add difference features (fighter_1 - fighter_2)
-                if pd.notna(fighter1[attr]) and pd.notna(fighter2[attr]):
-                    fight_row[f"{attr}_diff"] = fighter1[attr] - fighter2[attr]
-                    # Add binary comparison (1 if fighter_1 > fighter_2, 0 otherwise)
-                    fight_row[f"{attr}_advantage"] = (
-                        1 if fighter1[attr] > fighter2[attr] else 0
-                    )
-                else:
-                    fight_row[f"{attr}_diff"] = None
-                    fight_row[f"{attr}_advantage"] = None
-
-            fight_data.append(fight_row)
-
-    # Create DataFrame
-    fight_df = pd.DataFrame(fight_data)
+    # All fight combinations, avoiding duplicates and self-fights
+    idx1, idx2 = np.triu_indices(len(df), k=1)
+
+    if base_file is None or not os.path.exists(base_file):
+        base_file = output_file
+
+    if incremental and os.path.exists(base_file):
+        existing_df = pd.read_csv(base_file)
+        changed, removed = _changed_characters(df, existing_df, attributes)
+        stale = changed | removed
+
+        print(
+            f"Updating fights for {len(df)} characters: "
+            f"{len(changed)} new/re-rated, {len(removed)} removed"
+        )
+
+        keep = ~(
+            existing_df["fighter_1_name"].isin(stale)
+            | existing_df["fighter_2_name"].isin(stale)
+        )
+        is_changed = df["name"].isin(changed).to_numpy()
+        new_pairs = is_changed[idx1] | is_changed[idx2]
+
+        new_df = build_fight_rows(df, idx1[new_pairs], idx2[new_pairs], attributes)
+        fight_df = pd.concat([existing_df[keep], new_df], ignore_index=True)
+
+        # Restore the order a full regeneration would produce
+        position = pd.Series(np.arange(len(df)), index=df["name"])
+        order = np.lexsort(
+            (
+                fight_df["fighter_2_name"].map(position).to_numpy(),
+                fight_df["fighter_1_name"].map(position).to_numpy(),
+            )
+        )
+        fight_df = fight_df.iloc[order].reset_index(drop=True)
+        generated = len(new_df)
+    else:
+        print(f"Creating fights for {len(df)} characters...")
+        fight_df = build_fight_rows(df, idx1, idx2, attributes)
+        generated = len(fight_df)
 
     # Save to CSV
     fight_df.to_csv(output_file, index=False)
 
     print(f"Fight data saved to {output_file}")
-    print(f"Generated {len(fight_data)} fights")
+    print(f"Generated {generated} fights ({len(fight_df)} total)")
     print(f"Columns created: {len(fight_df.columns)}")
 
     # Display first few rows as preview
@@ -76,6 +170,49 @@ def create_fight_data(cleaned_character_file, output_file):
     return fight_df
 
 
+# Attributes kept for modelling after the EDA in notebooks/eda.ipynb
+MODEL_ATTRIBUTES = [
+    "reaction_speed",
+    "stamina",
+    "strength",
+    "offense",
+    "defense",
+    "combat_skills",
+    "battle_iq",
+    "armament_haki",
+    "observation_haki",
+    "conqueror_haki",
+    "experience",
+]
+
+
+def select_model_features(fight_data_file, output_file):
+    """
+    Keep only the columns the model uses (fight_data.csv -> fight_data_cleaned.csv).
+
+    Drops attributes removed during EDA (high VIF or low predictive power).
+    """
+    df = pd.read_csv(fight_data_file)
+
+    columns = ["fight_name"]
+    for attr in MODEL_ATTRIBUTES:
+        columns += [
+            f"fighter_1_{attr}",
+            f"fighter_2_{attr}",
+            f"{attr}_diff",
+            f"{attr}_advantage",
+        ]
+    columns.append("outcome")
+
+    df_selected = df[columns]
+    df_selected.to_csv(output_file, index=False)
+
+    print(f"Kept {len(columns)} of {len(df.columns)} columns")
+    print(f"Model features saved to {output_file}")
+
+    return df_selected
+
+
 # Usage
 if __name__ == "__main__":
     cleaned_file = "data/processed/character_data_cleaned.csv"
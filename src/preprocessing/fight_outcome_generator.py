@@ -1,10 +1,64 @@
 import pandas as pd
+import numpy as np
+
+# Attributes compared when scoring a fight
+OUTCOME_ATTRIBUTES = [
+    "strength",
+    "travel_speed",
+    "agility",
+    "reaction_speed",
+    "offense",
+    "defense",
+    "endurance",
+    "durability",
+    "stamina",
+    "intelligence",
+    "battle_iq",
+    "combat_skills",
+    "weapon_proficiency",
+    "armament_haki",
+    "observation_haki",
+    "conqueror_haki",
+    "devil_fruit",
+    "mentality",
+    "experience",
+]
+
+
+def score_fights(fighter_1_values, fighter_2_values):
+    """
+    Score fights attribute by attribute.
+
+    Args:
+        fighter_1_values: (n_fights, n_attributes) array for fighter 1
+        fighter_2_values: Matching array for fighter 2
+
+    Returns:
+        Tuple of (fighter_1_points, fighter_2_points, outcomes) arrays
+    """
+    # NaN comparisons are False, so missing values award no point;
+    # equal values award both fighters a point
+    f1_points = (fighter_1_values >= fighter_2_values).sum(axis=1)
+    f2_points = (fighter_2_values >= fighter_1_values).sum(axis=1)
+
+    outcomes = np.where(
+        f1_points > f2_points,
+        "victory",
+        np.where(f2_points > f1_points, "loss", "draw"),
+    )
+    return f1_points, f2_points, outcomes
 
 
-def add_fight_outcomes(fight_data_file):
+def add_fight_outcomes(fight_data_file, output_file=None, incremental=False):
     """
     Add fight outcomes to the existing fight data CSV file.
 
+    Writes to `output_file` if given, otherwise overwrites `fight_data_file`.
+    With `incremental=True`, only rows without an outcome yet (e.g. pairs
+    added by `create_fight_data(..., incremental=True)`) are scored; the
+    whole file is still read and rewritten. Existing outcomes are trusted,
+    so rescore everything after changing the scoring rules.
+
     Scoring rules:
     - Fighter with higher attribute value gets 1 point
     - If attributes are equal, both fighters get 1 point
@@ -16,83 +70,47 @@ def add_fight_outcomes(fight_data_file):
 
     print(f"Adding outcomes to {len(df)} fights...")
 
-    # Define the attributes to compare
-    attributes = [
-        "strength",
-        "travel_speed",
-        "agility",
-        "reaction_speed",
-        "offense",
-        "defense",
-        "endurance",
-        "durability",
-        "stamina",
-        "intelligence",
-        "battle_iq",
-        "combat_skills",
-        "weapon_proficiency",
-        "armament_haki",
-        "observation_haki",
-        "conqueror_haki",
-        "devil_fruit",
-        "mentality",
-        "experience",
-    ]
-
-    fighter_1_points = []
-    fighter_2_points = []
-    outcomes = []
-
-    for _, fight in df.iterrows():
-        f1_points = 0
-        f2_points = 0
-
-        # Compare each attribute
-        for attr in attributes:
-            fighter_1_value = fight[f"fighter_1_{attr}"]
-            fighter_2_value = fight[f"fighter_2_{attr}"]
-
-            # Skip if either value is missing
-            if pd.isna(fighter_1_value) or pd.isna(fighter_2_value):
-                continue
-
-            # Award points based on comparison
-            if fighter_1_value > fighter_2_value:
-                f1_points += 1
-            elif fighter_2_value > fighter_1_value:
-                f2_points += 1
-            else:  # Equal values
-                f1_points += 1
-                f2_points += 1
-
-        # Determine outcome
-        if f1_points > f2_points:
-            outcome = "victory"
-        elif f2_points > f1_points:
-            outcome = "loss"
-        else:
-            outcome = "draw"
-
-        fighter_1_points.append(f1_points)
-        fighter_2_points.append(f2_points)
-        outcomes.append(outcome)
+    # Rows to score: all of them, or only those still missing an outcome
+    if incremental and "outcome" in df.columns:
+        to_score = df["outcome"].isna().to_numpy()
+    else:
+        to_score = np.ones(len(df), dtype=bool)
+        df["fighter_1_points"] = 0
+        df["fighter_2_points"] = 0
+        df["outcome"] = None
+
+    print(f"Scoring {int(to_score.sum())} fights...")
+
+    rows = df.loc[to_score]
+    f1_points, f2_points, outcomes = score_fights(
+        rows[[f"fighter_1_{attr}" for attr in OUTCOME_ATTRIBUTES]].to_numpy(
+            dtype=float
+        ),
+        rows[[f"fighter_2_{attr}" for attr in OUTCOME_ATTRIBUTES]].to_numpy(
+            dtype=float
+        ),
+    )
 
     # Add outcome columns to the original DataFrame
-    df["fighter_1_points"] = fighter_1_points
-    df["fighter_2_points"] = fighter_2_points
-    df["outcome"] = outcomes
+    df.loc[to_score, "fighter_1_points"] = f1_points
+    df.loc[to_score, "fighter_2_points"] = f2_points
+    df.loc[to_score, "outcome"] = outcomes
+    df["fighter_1_points"] = df["fighter_1_points"].astype(int)
+    df["fighter_2_points"] = df["fighter_2_points"].astype(int)
 
-    # Overwrite the original file
-    df.to_csv(fight_data_file, index=False)
+    # Overwrite the original file unless an output file is given
+    if output_file is None:
+        output_file = fight_data_file
+    df.to_csv(output_file, index=False)
 
     # Print statistics
-    outcome_counts = pd.Series(outcomes).value_counts()
+    outcome_counts = df["outcome"].value_counts()
     print(f"\nOutcome distribution:")
     print(f"Victories (Fighter 1 wins): {outcome_counts.get('victory', 0)}")
     print(f"Losses (Fighter 1 loses): {outcome_counts.get('loss', 0)}")
     print(f"Draws: {outcome_counts.get('draw', 0)}")
 
-    print(f"\nOutcomes added to {fight_data_file}")
+    print(f"\nOutcomes added to {output_file}")
     print(f"Total columns now: {len(df.columns)}")
 
     # Display preview
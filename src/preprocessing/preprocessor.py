@@ -1,6 +1,118 @@
 import pandas as pd
+import numpy as np
 import json
 
+from .aliases import CONQUEROR_HAKI_USERS, alias_keys, normalize_names
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _JSON_ERRORS = (orjson.JSONDecodeError, TypeError)
+except ImportError:
+    _json_loads = json.loads
+    _JSON_ERRORS = (json.JSONDecodeError, TypeError)
+
+
+# Rated attributes, in the column order of character_data_cleaned.csv
+ATTRIBUTES = [
+    "strength",
+    "travel_speed",
+    "agility",
+    "reaction_speed",
+    "offense",
+    "defense",
+    "endurance",
+    "durability",
+    "stamina",
+    "intelligence",
+    "battle_iq",
+    "combat_skills",
+    "weapon_proficiency",
+    "armament_haki",
+    "observation_haki",
+    "conqueror_haki",
+    "devil_fruit",
+    "mentality",
+    "experience",
+]
+
+
+def _decode_column(values):
+    """
+    Decode a column of JSON strings with a single parser call.
+
+    Returns None if any value is missing or malformed, so the caller can fall
+    back to row-by-row decoding to find the bad rows. A cell holding several
+    comma-separated JSON values still parses as part of the joined list, so
+    the decoded length must match the number of cells.
+    """
+    try:
+        decoded = _json_loads("[" + ",".join(values) + "]")
+    except _JSON_ERRORS:
+        return None
+    if len(decoded) != len(values):
+        return None
+    return decoded
+
+
+def flatten_character_records(df):
+    """
+    Flatten the raw `wiki_data` / `power_scaling` JSON columns in bulk.
+
+    Each column is decoded with one parser call (orjson when installed) and
+    the attribute means are pulled into float32 columns.
+
+    Args:
+        df: Raw character DataFrame as written by the scraper
+
+    Returns:
+        (cleaned_df, malformed) where cleaned_df has a `name` column plus one
+        float32 column per attribute, and malformed is a list of
+        (row_index, error) tuples for rows that could not be decoded
+    """
+    wiki_values = df["wiki_data"].tolist()
+    power_values = df["power_scaling"].tolist()
+    malformed = []
+
+    wiki_records = _decode_column(wiki_values)
+    power_records = _decode_column(power_values)
+
+    indices = df.index.tolist()
+    if wiki_records is None or power_records is None:
+        indices, wiki_records, power_records = [], [], []
+        for idx, wiki_json, power_json in zip(df.index, wiki_values, power_values):
+            try:
+                wiki_data = _json_loads(wiki_json)
+                power_scaling = _json_loads(power_json)
+            except _JSON_ERRORS as e:
+                malformed.append((idx, f"{type(e).__name__}: {e}"))
+                continue
+            indices.append(idx)
+            wiki_records.append(wiki_data)
+            power_records.append(power_scaling)
+
+    names = []
+    rows = []
+    for idx, wiki_data, power_scaling in zip(indices, wiki_records, power_records):
+        if not isinstance(wiki_data, dict) or "name" not in wiki_data:
+            malformed.append((idx, "KeyError: 'name'"))
+            continue
+        if not isinstance(power_scaling, dict):
+            power_scaling = {}
+        names.append(wiki_data["name"])
+        rows.append(
+            [(power_scaling.get(attr) or {}).get("mean") for attr in ATTRIBUTES]
+        )
+
+    cleaned_df = pd.DataFrame(
+        np.array(rows, dtype=np.float32).reshape(len(rows), len(ATTRIBUTES)),
+        columns=ATTRIBUTES,
+    )
+    cleaned_df.insert(0, "name", names)
+
+    return cleaned_df, malformed
+
 
 def clean_character_data(input_file, output_file):
     """
@@ -9,61 +121,20 @@ def clean_character_data(input_file, output_file):
     # Read the CSV file
     df = pd.read_csv(input_file)
 
-    cleaned_data = []
-
-    for _, row in df.iterrows():
-        try:
-            # Parse the wiki_data to get the name
-            wiki_data = json.loads(row["wiki_data"])
-            character_name = wiki_data["name"]
-
-            # Parse the power_scaling to get mean scores
-            power_scaling = json.loads(row["power_scaling"])
-
-            # Create a new row with name and mean scores
-            cleaned_row = {"name": character_name}
-
-            # Extract mean scores for each attribute
-            attributes = [
-                "strength",
-                "travel_speed",
-                "agility",
-                "reaction_speed",
-                "offense",
-                "defense",
-                "endurance",
-                "durability",
-                "stamina",
-                "intelligence",
-                "battle_iq",
-                "combat_skills",
-                "weapon_proficiency",
-                "armament_haki",
-                "observation_haki",
-                "conqueror_haki",
-                "devil_fruit",
-                "mentality",
-                "experience",
-            ]
-
-            for attr in attributes:
-                if attr in power_scaling and power_scaling[attr] is not None:
-                    cleaned_row[attr] = power_scaling[attr]["mean"]
-                else:
-                    cleaned_row[attr] = None
-
-            cleaned_data.append(cleaned_row)
-
-        except Exception as e:
-            print(f"Error processing row: {e}")
-            continue
+    cleaned_df, malformed = flatten_character_records(df)
 
-    # Create DataFrame and save
-    cleaned_df = pd.DataFrame(cleaned_data)
+    if malformed:
+        print(f"Skipped {len(malformed)} malformed rows:")
+        for idx, error in malformed[:10]:
+            print(f"  row {idx}: {error}")
+        if len(malformed) > 10:
+            print(f"  ... and {len(malformed) - 10} more")
+
+    # Save
     cleaned_df.to_csv(output_file, index=False)
 
     print(f"Cleaned data saved to {output_file}")
-    print(f"Processed {len(cleaned_data)} characters")
+    print(f"Processed {len(cleaned_df)} characters")
 
     # Display first few rows as preview
     print("\nPreview of cleaned data:")
@@ -76,81 +147,30 @@ def fix_conqueror_haki(cleaned_character_file, output_file=None):
     """
     Fix Conqueror's Haki scores based on confirmed users from One Piece wiki.
     Give 1 for confirmed users, 0 for others.
-    """
 
-    # List of confirmed Conqueror's Haki users from One Piece wiki
-    conqueror_users = {
-        # Supreme King Haki Users (Current/Alive)
-        "Shanks",
-        "Monkey D. Luffy",
-        "Silvers Rayleigh",
-        "Boa Hancock",
-        "Donquixote Doflamingo",
-        "Chinjao",
-        "Charlotte Linlin",  # Big Mom
-        "Charlotte Katakuri",
-        "Eustass Kid",
-        "Sengoku",
-        "Kaidou",  # Note: might be spelled as 'Kaido' in your data
-        "Roronoa Zoro",
-        "Yamato",
-        "Monkey D. Garp",
-        "Topman Marcus",
-        "Marcus Mars",
-        "Scopper Gaban",
-        "Imu",
-        # Deceased Users
-        "Edward Newgate",  # Whitebeard
-        "Portgas D. Ace",
-        "Kozuki Oden",
-        "Gol D. Roger",
-        "Joy Boy",
-        "Jaygarcia Saturn",
-        "Rocks D. Xebec",
-        "Harald",
-        # Non-Canon Users
-        "Naguri",
-        "Douglas Bullet",
-        # Alternative name formats (in case data uses different naming)
-        "Big Mom",
-        "Whitebeard",
-        "Gold Roger",
-        "Gol D Rogers",
-        "Charlotte Big Mom",
-        "Kaido",
-        "Kaido of the Beasts",
-        "Red-Haired Shanks",
-        "Dark King Rayleigh",
-        "Fire Fist Ace",
-        "Buddha Sengoku",
-        "Eustass Captain Kid",
-        "Captain Kid",
-        "Pirate Hunter Zoro",
-    }
+    Names are matched through the alias table in `aliases.py`, so spellings
+    such as "Kaido" / "Kaidou" or "Big Mom" / "Charlotte Linlin" all match.
+    """
 
     # Read the character data
     df = pd.read_csv(cleaned_character_file)
 
     print(f"Fixing Conqueror's Haki for {len(df)} characters...")
-    print(f"Known Conqueror's Haki users: {len(conqueror_users)}")
+    print(f"Known Conqueror's Haki users: {len(CONQUEROR_HAKI_USERS)}")
 
     # Create a copy to modify
     df_fixed = df.copy()
 
-    # Fix Conqueror's Haki values
-    matched_users = []
-    unmatched_conquerors = conqueror_users.copy()
-
-    for idx, row in df_fixed.iterrows():
-        character_name = row["name"]
+    # Label every row at once against the normalized alias keys
+    name_keys = normalize_names(df_fixed["name"])
+    is_conqueror = name_keys.isin(alias_keys(CONQUEROR_HAKI_USERS))
+    df_fixed["conqueror_haki"] = is_conqueror.astype(float)
 
-        # Check if character is a confirmed Conqueror's Haki user
-        if character_name in conqueror_users:
-            df_fixed.at[idx, "conqueror_haki"] = 1.0
-            matched_users.append(character_name)
-            unmatched_conquerors.discard(character_name)
-        else:
-            df_fixed.at[idx, "conqueror_haki"] = 0.0
+    matched_users = df_fixed.loc[is_conqueror, "name"].tolist()
+    present_keys = set(name_keys)
+    unmatched_conquerors = [
+        user for user in CONQUEROR_HAKI_USERS if not alias_keys([user]) & present_keys
+    ]
 
     # Save the fixed data
     if output_file is None:
@@ -165,7 +185,7 @@ def fix_conqueror_haki(cleaned_character_file, output_file=None):
 
     if unmatched_conquerors:
         print(f"\nKnown Conqueror users not found in dataset:")
-        print(f"{sorted(list(unmatched_conquerors))}")
+        print(f"{sorted(unmatched_conquerors)}")
 
     print(f"\nUpdated distribution:")
     print(df_fixed["conqueror_haki"].value_counts().sort_index())
@@ -1,5 +1,23 @@
 from .scraper import OnePieceCharacterScraper
 from .llm_rater import BaseLLMRater
-from .llm_implementations import OpenAIRater, GeminiRater
+from .llm_implementations import (
+    OpenAIRater,
+    GeminiRater,
+    LocalOpenAIRater,
+    MockRater,
+    create_raters,
+    register_rater,
+)
+from .checkpoint import CheckpointStore
 
-__all__ = ["OnePieceCharacterScraper", "BaseLLMRater", "OpenAIRater", "GeminiRater"]
+__all__ = [
+    "OnePieceCharacterScraper",
+    "BaseLLMRater",
+    "OpenAIRater",
+    "GeminiRater",
+    "LocalOpenAIRater",
+    "MockRater",
+    "create_raters",
+    "register_rater",
+    "CheckpointStore",
+]
@@ -0,0 +1,227 @@
+from typing import Dict, Iterator, List
+import pandas as pd
+import logging
+import json
+import os
+
+logger = logging.getLogger(__name__)
+
+
+class CheckpointStore:
+    """
+    Append-only JSONL checkpoint for scraped characters.
+
+    Every processed character is written as a single JSON line and flushed to
+    disk before `append` returns, so a crash can lose at most the record being
+    written. The set of processed keys is kept in memory so skip checks are
+    O(1) and startup only needs one sequential read of the file.
+    """
+
+    def __init__(self, path: str = "data/raw/character_data.jsonl"):
+        self.path = path
+        self._processed = set()
+        self._count = 0
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        if os.path.exists(self.path):
+            self._load_index()
+
+    def _load_index(self):
+        """Rebuild the processed set from the existing checkpoint file."""
+        self._drop_partial_tail()
+        for record in self.records():
+            self._index(record)
+        logger.info(f"Loaded {self._count} checkpointed characters from {self.path}")
+
+    def _drop_partial_tail(self):
+        """Truncate a half-written last line left behind by a crash."""
+        with open(self.path, "rb+") as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            if size == 0:
+                return
+            f.seek(size - 1)
+            if f.read(1) == b"\n":
+                return
+
+            # Walk back to the last complete record
+            position = size - 1
+            while position > 0:
+                step = min(4096, position)
+                f.seek(position - step)
+                chunk = f.read(step)
+                newline = chunk.rfind(b"\n")
+                if newline != -1:
+                    position = position - step + newline + 1
+                    break
+                position -= step
+
+            f.truncate(position)
+            logger.warning(f"Dropped partial trailing record in {self.path}")
+
+    def _index(self, record: Dict):
+        self._processed.add(record["key"])
+        name = (record.get("wiki_data") or {}).get("name")
+        if name:
+            self._processed.add(name)
+        self._count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._processed
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, key: str, result: Dict):
+        """
+        Durably append one scraped character.
+
+        Args:
+            key: Identifier used to skip the character on later runs
+                (usually the wiki page slug, e.g. "Kozuki_Hiyori")
+            result: Dict with "wiki_data" and "power_scaling" as returned by
+                `OnePieceCharacterScraper.process_character`
+        """
+        record = {
+            "key": key,
+            "wiki_data": result["wiki_data"],
+            "power_scaling": result["power_scaling"],
+        }
+        line = json.dumps(record) + "\n"
+
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+
+        self._index(record)
+
+    def records(self) -> Iterator[Dict]:
+        """
+        Iterate over checkpointed records in insertion order.
+
+        A truncated trailing line (from a crash mid-write) is skipped. If the
+        same key was appended more than once, every occurrence is yielded;
+        `compact` keeps only the latest one.
+        """
+        if not os.path.exists(self.path):
+            return
+
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(
+                        f"Skipping unreadable checkpoint line {line_number} in {self.path}"
+                    )
+
+    def import_csv(self, csv_file: str) -> int:
+        """
+        Seed the checkpoint from a CSV written by `save_to_csv`.
+
+        This is a one-off migration for runs started before the checkpoint
+        existed. Records are keyed by their wiki name.
+
+        Returns:
+            Number of records imported
+        """
+        df = pd.read_csv(csv_file)
+        imported = 0
+
+        with open(self.path, "a", encoding="utf-8") as f:
+            for wiki_json, power_json in zip(df["wiki_data"], df["power_scaling"]):
+                try:
+                    record = {
+                        "wiki_data": json.loads(wiki_json),
+                        "power_scaling": json.loads(power_json),
+                    }
+                    record["key"] = record["wiki_data"]["name"]
+                except (TypeError, KeyError, json.JSONDecodeError) as e:
+                    logger.warning(f"Skipping unreadable row in {csv_file}: {e}")
+                    continue
+
+                if record["key"] in self._processed:
+                    continue
+
+                f.write(json.dumps(record) + "\n")
+                self._index(record)
+                imported += 1
+
+            f.flush()
+            os.fsync(f.fileno())
+
+        logger.info(f"Imported {imported} characters from {csv_file}")
+        return imported
+
+    def compact(
+        self, output_file: str = "data/raw/character_data.csv", overwrite: bool = False
+    ) -> pd.DataFrame:
+        """
+        Write the checkpoint out in the format downstream preprocessing expects.
+
+        Produces the same `wiki_data` / `power_scaling` JSON-column layout as
+        `OnePieceCharacterScraper.save_to_csv`, keeping the latest record per
+        key. A `.parquet` extension writes Parquet instead of CSV. The output
+        is written to a temporary file and moved into place, so readers never
+        see a partially written file.
+
+        An existing output with more rows than the checkpoint (e.g. a full
+        scrape from before the checkpoint existed) is not replaced: seed the
+        store with `import_csv` first, write to another path, or pass
+        `overwrite=True`.
+
+        Args:
+            output_file: CSV or .parquet file to write
+            overwrite: Replace the output even if it holds more characters
+
+        Returns:
+            The compacted DataFrame
+
+        Raises:
+            FileExistsError: If the output would lose rows and `overwrite` is False
+        """
+        latest: Dict[str, Dict] = {}
+        for record in self.records():
+            latest.pop(record["key"], None)
+            latest[record["key"]] = record
+
+        rows: List[Dict] = [
+            {
+                "wiki_data": json.dumps(record["wiki_data"]),
+                "power_scaling": json.dumps(record["power_scaling"]),
+            }
+            for record in latest.values()
+        ]
+        df = pd.DataFrame(rows, columns=["wiki_data", "power_scaling"])
+
+        if not overwrite and os.path.exists(output_file):
+            existing_rows = len(_read_table(output_file))
+            if existing_rows > len(df):
+                raise FileExistsError(
+                    f"{output_file} has {existing_rows} characters but the checkpoint "
+                    f"only {len(df)}; import it with import_csv, choose another "
+                    f"output file or pass overwrite=True"
+                )
+
+        tmp_file = f"{output_file}.tmp"
+        if output_file.endswith(".parquet"):
+            df.to_parquet(tmp_file, index=False)
+        else:
+            df.to_csv(tmp_file, index=False)
+        os.replace(tmp_file, output_file)
+
+        logger.info(f"Compacted {len(df)} characters to {output_file}")
+        return df
+
+
+def _read_table(path: str) -> pd.DataFrame:
+    if path.endswith(".parquet"):
+        return pd.read_parquet(path)
+    return pd.read_csv(path)
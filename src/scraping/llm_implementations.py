@@ -1,9 +1,12 @@
 from openai import OpenAI
 import google.generativeai as genai
-from .llm_rater import BaseLLMRater
+from .llm_rater import BaseLLMRater, RATED_ATTRIBUTES, _parse_response
 import os
 from dotenv import load_dotenv
-from typing import Dict
+from typing import Dict, List, Type
+import hashlib
+import httpx
+import json
 
 load_dotenv()
 
@@ -24,7 +27,15 @@ class OpenAIRater(BaseLLMRater):
         )
         print("RAW LLM RESPONSE:", response.choices[0].message.content)
         # Use the parser from BaseLLMRater
-        return self._parse_response(response.choices[0].message.content)
+        return _parse_response(response.choices[0].message.content)
+
+    async def _complete(self, prompt: str, json_output: bool = False) -> str:
+        # gpt-4 has no JSON response mode; the batch prompt asks for JSON instead
+        response = self.client.chat.completions.create(
+            model="gpt-4",
+            messages=[{"role": "user", "content": prompt}],
+        )
+        return response.choices[0].message.content
 
 
 class GeminiRater(BaseLLMRater):
@@ -38,7 +49,152 @@ class GeminiRater(BaseLLMRater):
         # Use synchronous method even in async context
         response = model.generate_content(prompt)
         print("RAW LLM RESPONSE:", response.text)
-        return self._parse_response(response.text)
+        return _parse_response(response.text)
+
+    async def _complete(self, prompt: str, json_output: bool = False) -> str:
+        model = genai.GenerativeModel("gemini-2.0-flash")
+        generation_config = (
+            {"response_mime_type": "application/json"} if json_output else None
+        )
+        response = model.generate_content(prompt, generation_config=generation_config)
+        return response.text
+
+
+class LocalOpenAIRater(BaseLLMRater):
+    """
+    Rater for any OpenAI-compatible chat completions server (llama.cpp,
+    vLLM, Ollama, or `src.scraping.local_llm_server`).
+
+    Configured with LOCAL_LLM_URL (default http://localhost:8001/v1) and
+    LOCAL_LLM_MODEL. No API key or internet access is needed.
+    """
+
+    def __init__(self, base_url: str = None, model: str = None):
+        super().__init__()
+        self.base_url = (
+            base_url or os.getenv("LOCAL_LLM_URL", "http://localhost:8001/v1")
+        ).rstrip("/")
+        self.model = model or os.getenv("LOCAL_LLM_MODEL", "local")
+
+    async def _chat(self, messages: List[Dict], json_output: bool = False) -> str:
+        payload = {"model": self.model, "messages": messages, "temperature": 0}
+        if json_output:
+            payload["response_format"] = {"type": "json_object"}
+        async with httpx.AsyncClient(timeout=120) as client:
+            response = await client.post(
+                f"{self.base_url}/chat/completions", json=payload
+            )
+            response.raise_for_status()
+        return response.json()["choices"][0]["message"]["content"]
+
+    async def rate_character(self, character_data: Dict) -> Dict:
+        prompt = self.rating_prompt.format(character_name=character_data["name"])
+        content = await self._chat(
+            [
+                {"role": "system", "content": prompt},
+                {"role": "user", "content": f"Rate {character_data['name']}"},
+            ]
+        )
+        return _parse_response(content)
+
+    async def _complete(self, prompt: str, json_output: bool = False) -> str:
+        return await self._chat([{"role": "user", "content": prompt}], json_output)
+
+
+class MockRater(BaseLLMRater):
+    """
+    Deterministic offline rater for benchmarks and synthetic rosters.
+
+    Ratings are derived from a hash of the seed, character name and attribute,
+    so the same character always gets the same 1-10 scores (in 0.5 steps).
+    Replies are rendered as text/JSON and run through the normal parsers.
+    """
+
+    def __init__(self, seed: int = 0):
+        super().__init__()
+        self.seed = seed
+
+    def mock_ratings(self, character_name: str) -> Dict[str, float]:
+        ratings = {}
+        for attr in RATED_ATTRIBUTES:
+            digest = hashlib.sha256(
+                f"{self.seed}:{character_name}:{attr}".encode("utf-8")
+            ).digest()
+            ratings[attr] = 1 + (digest[0] % 19) / 2
+        return ratings
+
+    def mock_reply(self, character_name: str) -> str:
+        """Free-form reply in the shape `rating_prompt` asks for."""
+        return "\n".join(
+            f"{attr}: {score:g}/10 - mock justification"
+            for attr, score in self.mock_ratings(character_name).items()
+        )
+
+    def mock_batch_reply(self, character_names: List[str]) -> str:
+        """JSON reply in the shape `batch_rating_prompt` asks for."""
+        return json.dumps(
+            {
+                "characters": [
+                    {"name": name, "ratings": self.mock_ratings(name)}
+                    for name in character_names
+                ]
+            }
+        )
+
+    async def rate_character(self, character_data: Dict) -> Dict:
+        return _parse_response(self.mock_reply(character_data["name"]))
+
+    async def _complete(self, prompt: str, json_output: bool = False) -> str:
+        return self.mock_batch_reply(names_in_batch_prompt(prompt))
+
+
+def names_in_batch_prompt(prompt: str) -> List[str]:
+    """Recover the character names listed in a `batch_rating_prompt`."""
+    return [
+        line.strip()[2:].strip()
+        for line in prompt.splitlines()
+        if line.strip().startswith("- ")
+    ]
+
+
+# Rater name -> class, used by `create_raters` and the scraper's `raters` argument
+RATER_REGISTRY: Dict[str, Type[BaseLLMRater]] = {
+    "openai": OpenAIRater,
+    "gemini": GeminiRater,
+    "local": LocalOpenAIRater,
+    "mock": MockRater,
+}
+
+
+def register_rater(name: str, rater_class: Type[BaseLLMRater]):
+    """Make a rater available to `create_raters` under `name`."""
+    RATER_REGISTRY[name] = rater_class
+
+
+def create_raters(names=None) -> List[BaseLLMRater]:
+    """
+    Instantiate raters by registry name.
+
+    Args:
+        names: List of names or a comma-separated string. Defaults to the
+            RATERS environment variable, then "openai,gemini".
+
+    Returns:
+        List of rater instances
+    """
+    if names is None:
+        names = os.getenv("RATERS", "openai,gemini")
+    if isinstance(names, str):
+        names = [name.strip() for name in names.split(",") if name.strip()]
+
+    raters = []
+    for name in names:
+        if name not in RATER_REGISTRY:
+            raise ValueError(
+                f"Unknown rater '{name}'. Available: {sorted(RATER_REGISTRY)}"
+            )
+        raters.append(RATER_REGISTRY[name]())
+    return raters
 
 
 # class GrokRater(BaseLLMRater):
@@ -57,7 +213,7 @@ class GeminiRater(BaseLLMRater):
 #             headers=headers,
 #             json={"model": "grok-1", "messages": [{"role": "user", "content": prompt}]},
 #         )
-#         return self._parse_response(response.json()["choices"][0]["message"]["content"])
+#         return _parse_response(response.json()["choices"][0]["message"]["content"])
 
 
 # class PerplexityRater(BaseLLMRater):
@@ -81,4 +237,4 @@ class GeminiRater(BaseLLMRater):
 #                 "messages": [{"role": "user", "content": prompt}],
 #             },
 #         )
-#         return self._parse_response(response.json()["choices"][0]["text"])
+#         return _parse_response(response.json()["choices"][0]["text"])
@@ -1,12 +1,53 @@
 from abc import ABC, abstractmethod
-from typing import Dict
+from typing import Dict, List, Optional
 import logging
+import json
 import os
 from dotenv import load_dotenv
 import re
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# The 19 attributes every rater scores, in prompt order
+RATED_ATTRIBUTES = [
+    "strength",
+    "travel_speed",
+    "agility",
+    "reaction_speed",
+    "offense",
+    "defense",
+    "endurance",
+    "durability",
+    "stamina",
+    "intelligence",
+    "battle_iq",
+    "combat_skills",
+    "weapon_proficiency",
+    "armament_haki",
+    "observation_haki",
+    "conqueror_haki",
+    "devil_fruit",
+    "mentality",
+    "experience",
+]
+
+# Number of characters sent per request in batched rating mode
+DEFAULT_BATCH_SIZE = 5
+
+# Matches "<attribute>: <score>" for the known attributes only, tolerating
+# markdown ("**Travel Speed**: 8/10"), "Rating:" labels and spaces/underscores.
+_ATTRIBUTE_ALTERNATION = "|".join(
+    attr.replace("_", r"(?:'s)?[ _]") for attr in RATED_ATTRIBUTES
+)
+RATING_PATTERN = re.compile(
+    rf"\b(?P<attr>{_ATTRIBUTE_ALTERNATION})\b"
+    r"[\s\*:\-|(]*(?:rating\s*:?\s*\**\s*)?"
+    r"(?P<score>\d{1,2}(?:\.\d+)?)(?:\s*/\s*10)?",
+    re.IGNORECASE,
+)
+
 # ATTRIBUTE_MAP = {
 #     "physical_strength": "strength",
 #     "strength": "strength",
@@ -63,49 +104,160 @@ class BaseLLMRater(ABC):
         2. Brief justification
         """
 
+        self.batch_rating_prompt = """
+        As a One Piece expert, rate each of these characters on the following attributes from 1-10:
+        {character_names}
+        Use these exact attribute names:
+        strength, travel_speed, agility, reaction_speed, offense, defense, endurance, durability, stamina, intelligence, battle_iq, combat_skills, weapon_proficiency, armament_haki, observation_haki, conqueror_haki, devil_fruit, mentality, experience.
+        Respond with JSON only, no justifications, in exactly this shape:
+        {{"characters": [{{"name": "<character name as given>", "ratings": {{"strength": <1-10>, ...}}}}]}}
+        Include one entry per character, in the order given.
+        """
+
     @abstractmethod
     async def rate_character(self, character_data: Dict) -> Dict:
         pass
 
-    def _parse_response(self, response_text: str) -> Dict:
-        result = {}
-        pattern = re.compile(
-            r"(?P<attr>[A-Za-z_ ]+)[\:\-\*]*\s*(Rating:)?\s*(?P<score>\d{1,2})(/10)?",
-            re.IGNORECASE,
-        )
-        for match in pattern.finditer(response_text):
-            key = match.group("attr").strip().lower().replace(" ", "_")
-            try:
-                result[key] = float(match.group("score"))
-            except Exception:
-                result[key] = None
-        return result
-
-
-def build_power_scaling_dict(ratings_dicts: list) -> dict:
+    @abstractmethod
+    async def _complete(self, prompt: str, json_output: bool = False) -> str:
+        """
+        Send a single prompt to the provider and return the raw text reply.
+
+        Used by `rate_characters` for batched rating requests.
+        """
+
+    async def rate_characters(
+        self, characters: List[Dict], batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> List[Dict]:
+        """
+        Rate several characters, sending `batch_size` of them per request.
+
+        Characters missing from a batch reply, or returned without a score
+        for every attribute, are rated one at a time with `rate_character`.
+
+        Args:
+            characters: List of wiki_data dicts (must contain "name")
+            batch_size: Characters per request; 1 disables batching
+
+        Returns:
+            List of rating dicts, aligned with `characters`
+        """
+        ratings = []
+        for start in range(0, len(characters), batch_size):
+            batch = characters[start : start + batch_size]
+            batch_ratings = [None] * len(batch)
+
+            if len(batch) > 1:
+                names = [character["name"] for character in batch]
+                prompt = self.batch_rating_prompt.format(
+                    character_names="\n".join(f"- {name}" for name in names)
+                )
+                try:
+                    response_text = await self._complete(prompt, json_output=True)
+                    batch_ratings = _parse_batch_response(response_text, names)
+                except Exception as e:
+                    logger.warning(
+                        f"{type(self).__name__} batch request failed, "
+                        f"rating {len(batch)} characters individually: {e}"
+                    )
+
+            for i, character in enumerate(batch):
+                if batch_ratings[i] is None:
+                    batch_ratings[i] = await self.rate_character(character)
+            ratings.extend(batch_ratings)
+
+        return ratings
+
+
+def _load_json(response_text: str):
+    """Parse a JSON reply, unwrapping a markdown code fence if present."""
+    text = response_text.strip()
+    if text.startswith("```"):
+        text = text.strip("`")
+        text = text[text.find("{") :]
+    if not text.startswith(("{", "[")):
+        return None
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return None
+
+
+def _ratings_from_mapping(mapping) -> Dict:
+    """Keep only known attributes with numeric scores from a JSON object."""
+    ratings = {}
+    if not isinstance(mapping, dict):
+        return ratings
+    for attr in RATED_ATTRIBUTES:
+        try:
+            ratings[attr] = float(mapping[attr])
+        except (KeyError, TypeError, ValueError):
+            continue
+    return ratings
+
+
+def _parse_batch_response(response_text: str, names: List[str]) -> List[Optional[Dict]]:
+    """
+    Split a JSON batch reply into one rating dict per requested name.
+
+    Returns a list aligned with `names`; entries are None for characters
+    that are missing from the reply or lack a score for any attribute in
+    RATED_ATTRIBUTES. Raises ValueError if the reply is not JSON.
+    """
+    payload = _load_json(response_text)
+    if payload is None:
+        raise ValueError("unparseable batch JSON")
+
+    entries = payload.get("characters", []) if isinstance(payload, dict) else payload
+    by_name = {}
+    for position, entry in enumerate(entries if isinstance(entries, list) else []):
+        if not isinstance(entry, dict):
+            continue
+        ratings = _ratings_from_mapping(entry.get("ratings"))
+        if len(ratings) < len(RATED_ATTRIBUTES):
+            continue
+        name = str(entry.get("name", "")).strip().lower()
+        by_name[name or position] = ratings
+
+    results = []
+    for position, name in enumerate(names):
+        results.append(by_name.get(name.strip().lower(), by_name.get(position)))
+    return results
+
+
+def _parse_response(response_text: str) -> Dict:
+    """
+    Extract attribute ratings from a single-character reply.
+
+    JSON replies are read directly. Free-form replies are scanned with
+    RATING_PATTERN, keeping the first score seen for each attribute and
+    stopping as soon as all attributes are found.
+    """
+    payload = _load_json(response_text)
+    if isinstance(payload, dict):
+        ratings = _ratings_from_mapping(payload.get("ratings", payload))
+        if ratings:
+            return ratings
+
+    result = {}
+    for match in RATING_PATTERN.finditer(response_text):
+        key = re.sub(r"(?:'s)?[ _]+", "_", match.group("attr").lower())
+        if key in result:
+            continue
+        score = float(match.group("score"))
+        if score <= 10:
+            result[key] = score
+            if len(result) == len(RATED_ATTRIBUTES):
+                break
+    return result
+
+
+def build_power_scaling_dict(ratings_dicts: list, model_names: list = None) -> dict:
     # ratings_dicts: list of dicts from each model, e.g. [{'strength': 10, ...}, ...]
-    attributes = [
-        "strength",
-        "travel_speed",
-        "agility",
-        "reaction_speed",
-        "offense",
-        "defense",
-        "endurance",
-        "durability",
-        "stamina",
-        "intelligence",
-        "battle_iq",
-        "combat_skills",
-        "weapon_proficiency",
-        "armament_haki",
-        "observation_haki",
-        "conqueror_haki",
-        "devil_fruit",
-        "mentality",
-        "experience",
-    ]
-    model_names = ["OpenAIRater", "GeminiRater"]
+    # model_names: rater class names aligned with ratings_dicts
+    attributes = RATED_ATTRIBUTES
+    if model_names is None:
+        model_names = ["OpenAIRater", "GeminiRater"]
     output = {}
     for attr in attributes:
         values = [rd.get(attr) for rd in ratings_dicts if rd.get(attr) is not None]
@@ -0,0 +1,66 @@
+"""
+Minimal OpenAI-compatible chat completions server for offline rating runs.
+
+Answers `/v1/chat/completions` with MockRater's deterministic ratings, so
+LocalOpenAIRater (and the whole scrape -> rate pipeline) can be exercised
+over real HTTP without network access or API keys:
+
+    python -m uvicorn src.scraping.local_llm_server:app --port 8001
+    RATERS=local python main.py
+"""
+
+from fastapi import FastAPI
+from pydantic import BaseModel
+from typing import Dict, List, Optional
+import time
+import re
+
+from .llm_implementations import MockRater, names_in_batch_prompt
+
+app = FastAPI(title="Local LLM stand-in", version="1.0.0")
+rater = MockRater()
+
+
+class ChatMessage(BaseModel):
+    role: str
+    content: str
+
+
+class ChatCompletionRequest(BaseModel):
+    model: str = "local"
+    messages: List[ChatMessage]
+    temperature: Optional[float] = None
+    response_format: Optional[Dict] = None
+
+
+@app.post("/v1/chat/completions")
+async def chat_completions(request: ChatCompletionRequest):
+    prompt = "\n".join(message.content for message in request.messages)
+
+    batch_names = names_in_batch_prompt(prompt)
+    if batch_names:
+        content = rater.mock_batch_reply(batch_names)
+    else:
+        # Single-character prompts end with a "Rate <name>" user message
+        match = re.search(r"Rate (.+)$", request.messages[-1].content.strip())
+        content = rater.mock_reply(match.group(1) if match else prompt)
+
+    return {
+        "id": f"chatcmpl-local-{time.time_ns()}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": request.model,
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }
+        ],
+    }
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(app, host="127.0.0.1", port=8001)
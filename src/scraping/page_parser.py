@@ -0,0 +1,138 @@
+from typing import Dict, List
+from bs4 import BeautifulSoup, SoupStrainer
+import logging
+import glob
+import re
+import time
+import os
+
+logger = logging.getLogger(__name__)
+
+try:
+    import lxml  # noqa: F401
+
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+DEFAULT_BACKEND = "lxml" if HAS_LXML else "html.parser"
+
+
+# Only the tags `extract_character_data` reads (the page title and the
+# infobox table) are built into the tree; navigation, article body, scripts
+# and comments are skipped by the parser.
+CHARACTER_REGION = SoupStrainer(
+    ["h1", "table"], class_=re.compile(r"(^|\s)(page-header__title|infobox)(\s|$)")
+)
+
+
+def parse_page(html: str, backend: str = None, targeted: bool = True) -> BeautifulSoup:
+    """
+    Parse a fandom character page.
+
+    Args:
+        html: Raw page HTML
+        backend: BeautifulSoup tree builder ("lxml" or "html.parser").
+            Defaults to lxml when it is installed.
+        targeted: Only build the title and infobox region of the page
+
+    Returns:
+        BeautifulSoup object usable by `extract_character_data`
+    """
+    backend = backend or DEFAULT_BACKEND
+    if backend == "lxml" and not HAS_LXML:
+        logger.warning("lxml is not installed, falling back to html.parser")
+        backend = "html.parser"
+
+    parse_only = CHARACTER_REGION if targeted else None
+    return BeautifulSoup(html, backend, parse_only=parse_only)
+
+
+def load_fixture_pages(pages_dir: str) -> Dict[str, str]:
+    """Load saved HTML pages (as written with `save_pages_dir` set on the scraper)."""
+    pages = {}
+    for path in sorted(glob.glob(os.path.join(pages_dir, "*.html"))):
+        with open(path, "r", encoding="utf-8") as f:
+            pages[os.path.basename(path)] = f.read()
+    return pages
+
+
+def benchmark_parsers(
+    pages_dir: str = "data/raw/pages", repeats: int = 3
+) -> List[Dict]:
+    """
+    Compare parse + extract throughput of the full html.parser baseline
+    against the targeted parsers, and check the extracted fields match.
+
+    Args:
+        pages_dir: Directory of saved character pages
+        repeats: Number of passes over the corpus per configuration
+
+    Returns:
+        List of result dicts, one per configuration
+    """
+    # Imported here to avoid a circular import with scraper.py
+    from .scraper import OnePieceCharacterScraper
+
+    pages = load_fixture_pages(pages_dir)
+    if not pages:
+        print(f"No .html pages found in {pages_dir}")
+        return []
+
+    extractor = OnePieceCharacterScraper(raters=[])
+
+    configs = [("html.parser", False), ("html.parser", True)]
+    if HAS_LXML:
+        configs += [("lxml", False), ("lxml", True)]
+
+    total_mb = sum(len(html.encode("utf-8")) for html in pages.values()) / 1e6
+    print(f"Benchmarking {len(pages)} pages ({total_mb:.1f} MB), {repeats} repeats")
+
+    baseline = None
+    results = []
+    for backend, targeted in configs:
+        extracted = {}
+        start = time.perf_counter()
+        for _ in range(repeats):
+            for page_name, html in pages.items():
+                soup = parse_page(html, backend=backend, targeted=targeted)
+                extracted[page_name] = extractor.extract_character_data(soup)
+        elapsed = time.perf_counter() - start
+
+        if baseline is None:
+            baseline = extracted
+        mismatches = sorted(
+            page_name
+            for page_name in pages
+            if extracted[page_name] != baseline[page_name]
+        )
+
+        result = {
+            "backend": backend,
+            "targeted": targeted,
+            "pages_per_sec": len(pages) * repeats / elapsed,
+            "mismatches": mismatches,
+        }
+        results.append(result)
+
+    base_rate = results[0]["pages_per_sec"]
+    print(f"\n{'backend':<12} {'targeted':<9} {'pages/s':>9} {'speedup':>8}  fields")
+    for r in results:
+        status = (
+            "identical" if not r["mismatches"] else f"{len(r['mismatches'])} differ"
+        )
+        print(
+            f"{r['backend']:<12} {str(r['targeted']):<9} {r['pages_per_sec']:>9.1f} "
+            f"{r['pages_per_sec'] / base_rate:>7.2f}x  {status}"
+        )
+        for page_name in r["mismatches"][:5]:
+            print(f"    {page_name}")
+
+    return results
+
+
+# Usage
+if __name__ == "__main__":
+    import sys
+
+    benchmark_parsers(sys.argv[1] if len(sys.argv) > 1 else "data/raw/pages")
@@ -0,0 +1,162 @@
+from typing import Dict, List, Tuple
+import random
+import glob
+import json
+import time
+import os
+import re
+
+from .llm_rater import RATED_ATTRIBUTES, _parse_response
+
+
+def legacy_parse(response_text: str) -> Dict:
+    """The original free-form parser, kept as the benchmark baseline."""
+    result = {}
+    pattern = re.compile(
+        r"(?P<attr>[A-Za-z_ ]+)[\:\-\*]*\s*(Rating:)?\s*(?P<score>\d{1,2})(/10)?",
+        re.IGNORECASE,
+    )
+    for match in pattern.finditer(response_text):
+        key = match.group("attr").strip().lower().replace(" ", "_")
+        try:
+            result[key] = float(match.group("score"))
+        except Exception:
+            result[key] = None
+    return result
+
+
+JUSTIFICATIONS = [
+    "Defeated 3 Yonko commanders and survived 2 days of continuous battle.",
+    "Widely regarded as one of the top 10 fighters of the era.",
+    "Held off an Admiral for about 5 minutes during the war.",
+    "Trained for 2 years on Rusukaina, greatly improving overall ability.",
+    "Rarely relies on this; mostly a support role in the crew.",
+    "Shown mastery on par with the strongest characters in the series.",
+]
+
+
+def _display_name(attr: str) -> str:
+    return attr.replace("_", " ").title().replace("Iq", "IQ")
+
+
+def _format_response(ratings: Dict[str, float], style: str, rng: random.Random) -> str:
+    if style == "json":
+        return json.dumps({"ratings": ratings})
+    if style == "fenced_json":
+        return "```json\n" + json.dumps(ratings, indent=2) + "\n```"
+
+    lines = ["Here is my assessment of the character:", ""]
+    for number, (attr, score) in enumerate(ratings.items(), 1):
+        name = _display_name(attr) if rng.random() < 0.7 else attr
+        score_text = f"{score:g}"
+        justification = rng.choice(JUSTIFICATIONS)
+        if style == "markdown":
+            lines.append(f"{number}. **{name}**: {score_text}/10")
+            lines.append(f"   - Justification: {justification}")
+        elif style == "rating_label":
+            lines.append(f"**{name}**")
+            lines.append(f"- Rating: {score_text}")
+            lines.append(f"- Brief justification: {justification}")
+        elif style == "table":
+            if number == 1:
+                lines += ["| Attribute | Rating | Justification |", "|---|---|---|"]
+            lines.append(f"| {name} | {score_text} | {justification} |")
+        else:
+            lines.append(f"{name} - {score_text}: {justification}")
+    lines += ["", "Overall a top tier fighter, easily 9 out of 10 in most categories."]
+    return "\n".join(lines)
+
+
+STYLES = ["json", "fenced_json", "markdown", "rating_label", "table", "plain"]
+
+
+def generate_responses(n: int = 600, seed: int = 42) -> List[Tuple[str, Dict]]:
+    """
+    Generate synthetic provider replies with known ratings.
+
+    The replies mimic the formats GPT-4 and Gemini return for
+    `rating_prompt`: JSON, fenced JSON, numbered markdown, "Rating:" labels,
+    markdown tables and plain lines, all padded with numeric justifications.
+
+    Returns:
+        List of (response_text, expected_ratings) tuples
+    """
+    rng = random.Random(seed)
+    corpus = []
+    for i in range(n):
+        ratings = {attr: float(rng.randint(1, 10)) for attr in RATED_ATTRIBUTES}
+        style = STYLES[i % len(STYLES)]
+        corpus.append((_format_response(ratings, style, rng), ratings))
+    return corpus
+
+
+def load_saved_responses(responses_dir: str) -> List[str]:
+    """Load raw replies saved as .txt files (e.g. the RAW LLM RESPONSE logs)."""
+    responses = []
+    for path in sorted(glob.glob(os.path.join(responses_dir, "*.txt"))):
+        with open(path, "r", encoding="utf-8") as f:
+            responses.append(f.read())
+    return responses
+
+
+def _time(parse, texts: List[str], repeats: int) -> Tuple[float, List[Dict]]:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        parsed = [parse(text) for text in texts]
+    return (time.perf_counter() - start) / (repeats * len(texts)), parsed
+
+
+def benchmark_response_parsing(
+    responses_dir: str = None, n: int = 600, repeats: int = 5
+) -> Dict:
+    """
+    Compare the legacy parser against `_parse_response`.
+
+    Correctness is measured on the synthetic corpus, where the true ratings
+    are known. Saved real replies (if `responses_dir` is given) are used for
+    speed and to count the unknown "junk" keys each parser emits.
+    """
+    corpus = generate_responses(n)
+    texts = [text for text, _ in corpus]
+
+    report = {}
+    print(f"Synthetic corpus: {len(corpus)} replies in {len(STYLES)} formats")
+    for label, parser in [("legacy", legacy_parse), ("structured", _parse_response)]:
+        seconds, parsed = _time(parser, texts, repeats)
+        exact = sum(
+            all(result.get(attr) == expected[attr] for attr in RATED_ATTRIBUTES)
+            for result, (_, expected) in zip(parsed, corpus)
+        )
+        junk = sum(len(set(result) - set(RATED_ATTRIBUTES)) for result in parsed)
+        report[label] = {"us_per_reply": seconds * 1e6, "exact": exact, "junk": junk}
+        print(
+            f"  {label:<11} {seconds * 1e6:8.1f} us/reply  "
+            f"exact {exact}/{len(corpus)}  junk keys {junk}"
+        )
+
+    if responses_dir:
+        saved = load_saved_responses(responses_dir)
+        print(f"Saved replies: {len(saved)} from {responses_dir}")
+        for label, parser in [
+            ("legacy", legacy_parse),
+            ("structured", _parse_response),
+        ]:
+            if not saved:
+                break
+            seconds, parsed = _time(parser, saved, repeats)
+            found = sum(len(set(result) & set(RATED_ATTRIBUTES)) for result in parsed)
+            junk = sum(len(set(result) - set(RATED_ATTRIBUTES)) for result in parsed)
+            print(
+                f"  {label:<11} {seconds * 1e6:8.1f} us/reply  "
+                f"attributes found {found}/{len(saved) * len(RATED_ATTRIBUTES)}  "
+                f"junk keys {junk}"
+            )
+
+    return report
+
+
+# Usage
+if __name__ == "__main__":
+    import sys
+
+    benchmark_response_parsing(sys.argv[1] if len(sys.argv) > 1 else None)
@@ -5,9 +5,11 @@ import pandas as pd
 import logging
 import httpx
 import json
+import os
 
-from .llm_rater import BaseLLMRater, build_power_scaling_dict
-from .llm_implementations import OpenAIRater, GeminiRater
+from .llm_rater import BaseLLMRater, build_power_scaling_dict, DEFAULT_BATCH_SIZE
+from .llm_implementations import create_raters
+from .page_parser import parse_page, DEFAULT_BACKEND
 
 # Configure logging
 logging.basicConfig(
@@ -17,12 +19,22 @@ logger = logging.getLogger(__name__)
 
 
 class OnePieceCharacterScraper:
-    def __init__(self):
+    def __init__(
+        self,
+        raters=None,
+        parser_backend: str = DEFAULT_BACKEND,
+        save_pages_dir: str = None,
+    ):
         self.base_url = "https://onepiece.fandom.com/wiki"
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
         }
 
+        # lxml when installed, parsing only the title and infobox region
+        self.parser_backend = parser_backend
+        # Optionally keep raw pages as fixtures for parser benchmarks
+        self.save_pages_dir = save_pages_dir
+
         # Define character attributes
         self.attributes = {
             "basic_stats": [
@@ -46,12 +58,20 @@ class OnePieceCharacterScraper:
             "other_factors": ["devil_fruit", "mentality", "experience"],
         }
 
-        self.raters = [
-            OpenAIRater(),
-            GeminiRater(),
-            # GrokRater(),
-            # PerplexityRater(),
-        ]
+        # Rater instances, or registry names such as ["mock"] / "local,mock".
+        # Defaults to the RATERS env var, then OpenAI + Gemini.
+        if raters is None or isinstance(raters, str):
+            raters = create_raters(raters)
+        else:
+            raters = [
+                create_raters([rater])[0] if isinstance(rater, str) else rater
+                for rater in raters
+            ]
+        self.raters: List[BaseLLMRater] = raters
+
+    @property
+    def rater_names(self) -> List[str]:
+        return [type(rater).__name__ for rater in self.raters]
 
     async def get_page(self, url: str) -> BeautifulSoup:
         """
@@ -69,11 +89,23 @@ class OnePieceCharacterScraper:
             ) as client:
                 response = await client.get(url)
                 response.raise_for_status()
-                return BeautifulSoup(response.text, "html.parser")
+                if self.save_pages_dir:
+                    self._save_page(url, response.text)
+                return parse_page(response.text, backend=self.parser_backend)
         except httpx.RequestError as e:
             logger.error(f"Error fetching {url}: {e}")
             return None
 
+    def _save_page(self, url: str, html: str):
+        os.makedirs(self.save_pages_dir, exist_ok=True)
+        page_name = url.rstrip("/").rsplit("/", 1)[-1]
+        with open(
+            os.path.join(self.save_pages_dir, f"{page_name}.html"),
+            "w",
+            encoding="utf-8",
+        ) as f:
+            f.write(html)
+
     async def process_character(self, character_name: str):
         soup = await self.get_page(f"{self.base_url}/{character_name}")
         wiki_data = self.extract_character_data(soup)
@@ -81,9 +113,47 @@ class OnePieceCharacterScraper:
         for rater in self.raters:
             rating = await rater.rate_character(wiki_data)
             ratings.append(rating)
-        power_scaling = build_power_scaling_dict(ratings)
+        power_scaling = build_power_scaling_dict(ratings, self.rater_names)
         return {"wiki_data": wiki_data, "power_scaling": power_scaling}
 
+    async def process_characters(
+        self, character_names: List[str], batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> Dict[str, Dict]:
+        """
+        Scrape and rate several characters, rating them in batches.
+
+        Each rater is sent `batch_size` characters per request instead of one.
+
+        Args:
+            character_names: Wiki page names, e.g. ["Nami", "Kozuki_Hiyori"]
+            batch_size: Characters per rating request
+
+        Returns:
+            Dict mapping page name to {"wiki_data", "power_scaling"} for every
+            character whose page could be extracted
+        """
+        wiki_pages = {}
+        for character_name in character_names:
+            soup = await self.get_page(f"{self.base_url}/{character_name}")
+            wiki_data = self.extract_character_data(soup) if soup else None
+            if wiki_data and wiki_data["name"]:
+                wiki_pages[character_name] = wiki_data
+
+        wiki_list = list(wiki_pages.values())
+        per_rater = [
+            await rater.rate_characters(wiki_list, batch_size=batch_size)
+            for rater in self.raters
+        ]
+
+        results = {}
+        for i, (character_name, wiki_data) in enumerate(wiki_pages.items()):
+            ratings = [rater_ratings[i] for rater_ratings in per_rater]
+            results[character_name] = {
+                "wiki_data": wiki_data,
+                "power_scaling": build_power_scaling_dict(ratings, self.rater_names),
+            }
+        return results
+
     def extract_character_data(self, soup: BeautifulSoup) -> Dict:
         """
         Extract character information and power scaling data.
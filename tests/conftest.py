@@ -0,0 +1,16 @@
+import pandas as pd
+import pytest
+
+from src.models.svm_model import OnePieceFightPredictor
+
+FIGHT_FILE = "data/processed/fight_data_cleaned.csv"
+
+
+@pytest.fixture(scope="session")
+def fight_data():
+    return pd.read_csv(FIGHT_FILE).sample(600, random_state=0).reset_index(drop=True)
+
+
+@pytest.fixture(scope="session")
+def predictor(fight_data):
+    return OnePieceFightPredictor().fit(fight_data)
@@ -0,0 +1,119 @@
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api import main
+
+FIGHTER = {
+    "reaction_speed": 7,
+    "stamina": 7,
+    "strength": 7,
+    "offense": 7,
+    "defense": 7,
+    "combat_skills": 7,
+    "battle_iq": 7,
+    "armament_haki": 7,
+    "observation_haki": 7,
+    "conqueror_haki": 0,
+    "experience": 7,
+}
+
+
+@pytest.fixture(scope="module")
+def client():
+    if main.predictor is None or main.character_data is None:
+        pytest.skip("Model or roster not available")
+    return TestClient(main.app)
+
+
+def test_roster_prediction_labels_match_predict(client):
+    response = client.post(
+        "/predict/roster", json={"fighter": FIGHTER, "top": 100}
+    ).json()
+
+    opponents = response["opponents"]
+    assert sum(response["predicted"].values()) == opponents
+    assert sum(response["expected"].values()) == pytest.approx(opponents)
+
+    for matchup in response["easiest_opponents"][:5]:
+        opponent = main.get_character_stats(matchup["name"])
+        single = client.post(
+            "/predict", json={"fighter_1": FIGHTER, "fighter_2": opponent.model_dump()}
+        ).json()
+        assert matchup["prediction"] == single["prediction"]
+
+
+def _sweep(client, axes, **kwargs):
+    return client.post(
+        "/predict/sweep",
+        json={"fighter_1": FIGHTER, "fighter_2": FIGHTER, "axes": axes, **kwargs},
+    )
+
+
+def test_sweep_labels_match_predict(client):
+    axis = {"stat": "strength", "fighter": 1, "start": 0, "stop": 10, "steps": 11}
+    response = _sweep(client, [axis]).json()
+
+    for value, label in zip(
+        response["axes"][0]["values"][::5], response["predictions"][::5]
+    ):
+        single = client.post(
+            "/predict",
+            json={"fighter_1": {**FIGHTER, "strength": value}, "fighter_2": FIGHTER},
+        ).json()
+        assert label == single["prediction"]
+
+    values = response["axes"][0]["values"]
+    for crossing in response["crossings"]:
+        step = max(i for i, value in enumerate(values) if value <= crossing["value"])
+        step = min(step, len(values) - 2)
+        assert response["predictions"][step] == crossing["from"]
+        assert response["predictions"][step + 1] == crossing["to"]
+
+
+def test_sweep_rejects_bad_axes(client):
+    axis = {"stat": "strength", "fighter": 1, "start": 0, "stop": 10, "steps": 5}
+
+    assert _sweep(client, [axis, axis]).status_code == 400
+    assert _sweep(client, [{**axis, "stat": "charisma"}]).status_code == 400
+    assert _sweep(client, [axis, {**axis, "fighter": 2}]).status_code == 200
+    big = {**axis, "steps": 1000}
+    assert _sweep(client, [big, {**big, "stat": "stamina"}]).status_code == 400
+
+
+def test_boundary_crossing_with_tied_probabilities():
+    axis = main.SweepAxis(stat="strength", fighter=1, start=0, stop=10, steps=2)
+    probabilities = np.full((2, 3), 1 / 3)
+
+    crossings = main.boundary_crossings(
+        [axis],
+        [np.array([0.0, 10.0])],
+        probabilities,
+        np.array(["loss", "victory"]),
+        ["draw", "loss", "victory"],
+    )
+
+    assert crossings == [
+        {
+            "stat": "fighter_1.strength",
+            "value": 5.0,
+            "from": "loss",
+            "to": "victory",
+            "at": {},
+        }
+    ]
+
+
+def test_api_does_not_import_llm_clients():
+    code = (
+        "import sys, src.api.main; "
+        "print('openai' in sys.modules or 'google.generativeai' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip().splitlines()[-1] == "False"
@@ -0,0 +1,73 @@
+import json
+import zipfile
+
+import joblib
+import numpy as np
+import pytest
+
+from src.models.artifact import load_artifact
+from src.models.svm_model import OnePieceFightPredictor
+
+
+@pytest.fixture(scope="module")
+def saved_model(predictor, tmp_path_factory):
+    model_file = str(tmp_path_factory.mktemp("model") / "svm_fight_predictor.pkl")
+    predictor.save_model(model_file)
+    return model_file
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_npz_matches_pickle(saved_model, mmap):
+    from_pickle = joblib.load(saved_model)
+    from_npz = load_artifact(saved_model.replace(".pkl", ".npz"), mmap=mmap)
+
+    assert from_npz.keys() == from_pickle.keys()
+    for key in ("model", "scaler", "label_encoder"):
+        pickled = vars(from_pickle[key])
+        restored = vars(from_npz[key])
+        assert restored.keys() == pickled.keys()
+        for attribute, value in pickled.items():
+            if isinstance(value, np.ndarray):
+                np.testing.assert_array_equal(restored[attribute], value)
+            else:
+                assert restored[attribute] == value, attribute
+    for key in ("features", "symmetric", "test_accuracy", "feature_importance"):
+        assert from_npz[key] == from_pickle[key]
+
+
+def test_npz_predictions_match_pickle(saved_model, fight_data):
+    from_pickle = OnePieceFightPredictor().load_model(saved_model)
+    from_npz = OnePieceFightPredictor().load_model(saved_model.replace(".pkl", ".npz"))
+
+    np.testing.assert_array_equal(
+        from_npz.predict_proba(fight_data), from_pickle.predict_proba(fight_data)
+    )
+
+
+def test_npz_arrays_are_aligned(saved_model):
+    with zipfile.ZipFile(saved_model.replace(".pkl", ".npz")) as archive:
+        metadata = json.loads(archive.read("metadata.json"))
+    support_vectors = load_artifact(saved_model.replace(".pkl", ".npz"))[
+        "model"
+    ].support_vectors_
+
+    assert "estimators" in metadata
+    assert isinstance(support_vectors, np.memmap)
+    assert support_vectors.ctypes.data % 64 == 0
+
+
+def test_unknown_estimator_class_is_refused(saved_model, tmp_path):
+    tampered = str(tmp_path / "tampered.npz")
+    with zipfile.ZipFile(
+        saved_model.replace(".pkl", ".npz")
+    ) as source, zipfile.ZipFile(tampered, "w") as target:
+        for member in source.infolist():
+            data = source.read(member)
+            if member.filename == "metadata.json":
+                metadata = json.loads(data)
+                metadata["estimators"]["model"]["class"] = "os.system"
+                data = json.dumps(metadata)
+            target.writestr(member, data)
+
+    with pytest.raises(ValueError):
+        load_artifact(tampered)
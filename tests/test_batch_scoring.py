@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from src.models.rbf_inference import RBFKernelScorer
+
+
+@pytest.mark.parametrize("use_scorer", [False, True])
+def test_file_output_matches_predict_proba(predictor, fight_data, tmp_path, use_scorer):
+    predictor.kernel_scorer = RBFKernelScorer(predictor.model) if use_scorer else None
+    # Room for both threads' kernel blocks plus ~100-row tiles
+    budget = 2 * (
+        predictor._kernel_block_bytes() + 100 * predictor._inference_bytes_per_row()
+    )
+
+    probabilities = predictor.predict_proba_to_file(
+        fight_data,
+        str(tmp_path / "proba.npy"),
+        max_memory_mb=budget / 2**20,
+        n_jobs=2,
+        dtype=np.float64,
+    )
+
+    np.testing.assert_allclose(probabilities, predictor.predict_proba(fight_data))
+    np.testing.assert_array_equal(np.load(tmp_path / "proba.npy"), probabilities)
+    predictor.kernel_scorer = None
+
+
+def test_budget_below_kernel_blocks_is_refused(predictor, fight_data, tmp_path):
+    predictor.kernel_scorer = RBFKernelScorer(predictor.model)
+    kernel_mb = predictor._kernel_block_bytes() / 2**20
+
+    with pytest.raises(ValueError):
+        predictor.predict_proba_to_file(
+            fight_data,
+            str(tmp_path / "proba.npy"),
+            max_memory_mb=3 * kernel_mb,
+            n_jobs=4,
+        )
+    predictor.kernel_scorer = None
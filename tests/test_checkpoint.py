@@ -0,0 +1,98 @@
+import json
+
+import pandas as pd
+import pytest
+
+from src.scraping.checkpoint import CheckpointStore
+
+
+def _result(name):
+    return {"wiki_data": {"name": name}, "power_scaling": {"strength": {"mean": 5.0}}}
+
+
+def test_records_survive_reopening(tmp_path):
+    path = str(tmp_path / "characters.jsonl")
+    store = CheckpointStore(path)
+    store.append("Monkey_D._Luffy", _result("Monkey D. Luffy"))
+    store.append("Roronoa_Zoro", _result("Roronoa Zoro"))
+
+    reopened = CheckpointStore(path)
+
+    assert len(reopened) == 2
+    assert "Roronoa_Zoro" in reopened
+    assert "Monkey D. Luffy" in reopened
+
+
+def test_truncated_tail_is_dropped_on_open(tmp_path):
+    path = tmp_path / "characters.jsonl"
+    store = CheckpointStore(str(path))
+    store.append("Monkey_D._Luffy", _result("Monkey D. Luffy"))
+    store.append("Roronoa_Zoro", _result("Roronoa Zoro"))
+    complete = path.read_bytes()
+    # Crash in the middle of writing the third record
+    partial = json.dumps({"key": "Nami", **_result("Nami")}).encode()[:25]
+    path.write_bytes(complete + partial)
+
+    recovered = CheckpointStore(str(path))
+
+    assert path.read_bytes() == complete
+    assert len(recovered) == 2
+    assert "Nami" not in recovered
+
+    # Appends after recovery start on a fresh line
+    recovered.append("Nami", _result("Nami"))
+    assert [record["key"] for record in CheckpointStore(str(path)).records()] == [
+        "Monkey_D._Luffy",
+        "Roronoa_Zoro",
+        "Nami",
+    ]
+
+
+def test_truncated_only_record_leaves_empty_file(tmp_path):
+    path = tmp_path / "characters.jsonl"
+    path.write_bytes(b'{"key": "Nami", "wiki_')
+
+    store = CheckpointStore(str(path))
+
+    assert len(store) == 0
+    assert path.read_bytes() == b""
+
+
+def _save_csv(path, names):
+    rows = [
+        {
+            "wiki_data": json.dumps(result["wiki_data"]),
+            "power_scaling": json.dumps(result["power_scaling"]),
+        }
+        for result in (_result(name) for name in names)
+    ]
+    pd.DataFrame(rows).to_csv(path, index=False)
+
+
+def test_compact_refuses_to_shrink_existing_csv(tmp_path):
+    csv_file = tmp_path / "character_data.csv"
+    _save_csv(csv_file, ["Monkey D. Luffy", "Roronoa Zoro", "Nami"])
+    before = csv_file.read_bytes()
+    store = CheckpointStore(str(tmp_path / "characters.jsonl"))
+    store.append("Usopp", _result("Usopp"))
+
+    with pytest.raises(FileExistsError):
+        store.compact(str(csv_file))
+    assert csv_file.read_bytes() == before
+
+    # Seeding the store from the CSV first keeps every character
+    store.import_csv(str(csv_file))
+    compacted = store.compact(str(csv_file))
+    assert len(compacted) == 4
+    assert len(pd.read_csv(csv_file)) == 4
+
+
+def test_compact_overwrite(tmp_path):
+    csv_file = tmp_path / "character_data.csv"
+    _save_csv(csv_file, ["Monkey D. Luffy", "Roronoa Zoro"])
+    store = CheckpointStore(str(tmp_path / "characters.jsonl"))
+    store.append("Usopp", _result("Usopp"))
+
+    store.compact(str(csv_file), overwrite=True)
+
+    assert len(pd.read_csv(csv_file)) == 1
@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+
+@pytest.fixture(scope="module")
+def fights(predictor, fight_data):
+    return predictor.prepare_features(fight_data.head(3)).to_numpy(dtype=float)
+
+
+def test_shapley_values_sum_to_prediction_minus_baseline(predictor, fights):
+    probabilities, attributions = predictor.explain(fights, method="shapley")
+
+    baseline = predictor.proba_from_features(predictor.scaler.mean_[None, :])
+    np.testing.assert_allclose(probabilities, predictor.proba_from_features(fights))
+    np.testing.assert_allclose(
+        attributions.sum(axis=1), probabilities - baseline, atol=1e-9
+    )
+
+
+def test_shapley_with_custom_baseline(predictor, fights):
+    baseline = fights[0]
+
+    _, attributions = predictor.explain(fights, method="shapley", baseline=baseline)
+
+    # The baseline fight itself has nothing to explain
+    np.testing.assert_allclose(attributions[0], 0, atol=1e-12)
+    expected = predictor.proba_from_features(fights) - predictor.proba_from_features(
+        baseline[None, :]
+    )
+    np.testing.assert_allclose(attributions.sum(axis=1), expected, atol=1e-9)
+
+
+def test_occlusion_matches_single_feature_replacement(predictor, fights):
+    probabilities, attributions = predictor.explain(fights[:1], method="occlusion")
+
+    for k in range(fights.shape[1]):
+        occluded = fights[:1].copy()
+        occluded[0, k] = predictor.scaler.mean_[k]
+        np.testing.assert_allclose(
+            attributions[0, k],
+            probabilities[0] - predictor.proba_from_features(occluded)[0],
+        )
+
+
+def test_unknown_method(predictor, fights):
+    with pytest.raises(ValueError):
+        predictor.explain(fights, method="lime")
@@ -0,0 +1,40 @@
+import pandas as pd
+
+from src.preprocessing.fight_generator import create_fight_data
+from src.preprocessing.fight_outcome_generator import add_fight_outcomes
+
+ROSTER_FILE = "data/processed/character_data_cleaned.csv"
+
+
+def _labelled_fights(roster_file, unlabeled_file, fight_file, incremental=False):
+    create_fight_data(
+        roster_file, unlabeled_file, incremental=incremental, base_file=fight_file
+    )
+    return add_fight_outcomes(
+        unlabeled_file, output_file=fight_file, incremental=incremental
+    )
+
+
+def test_incremental_update_matches_full_rebuild(tmp_path):
+    roster = pd.read_csv(ROSTER_FILE).head(20)
+    roster_file = str(tmp_path / "roster.csv")
+    roster.to_csv(roster_file, index=False)
+    unlabeled_file = str(tmp_path / "unlabeled.csv")
+    fight_file = str(tmp_path / "fights.csv")
+    _labelled_fights(roster_file, unlabeled_file, fight_file)
+
+    # Re-rate one character, remove one, add one
+    roster.loc[3, "strength"] = 1.0
+    added = roster.iloc[[5]].assign(name="Newcomer")
+    roster = pd.concat([roster.drop(index=10), added], ignore_index=True)
+    roster.to_csv(roster_file, index=False)
+
+    _labelled_fights(roster_file, unlabeled_file, fight_file, incremental=True)
+    full = _labelled_fights(
+        roster_file, str(tmp_path / "full_unlabeled.csv"), str(tmp_path / "full.csv")
+    )
+
+    pd.testing.assert_frame_equal(
+        pd.read_csv(fight_file), pd.read_csv(tmp_path / "full.csv")
+    )
+    assert len(full) == 20 * 19 // 2
@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import StandardScaler
+
+from src.models.pair_dataset import PairDataset
+from src.models.svm_model import OnePieceFightPredictor
+
+FIGHT_FILE = "data/processed/fight_data_cleaned.csv"
+ROSTER_FILE = "data/processed/character_data_cleaned.csv"
+
+# Smallest chunk fit_incremental will use, whatever the memory ceiling
+CHUNK_ROWS = 1000
+
+
+def _training_rows(n_rows, test_size=0.2):
+    """The rows fit_incremental trains on: its per-chunk hold-out, replayed."""
+    return np.concatenate(
+        [
+            np.random.default_rng([42, chunk]).random(min(CHUNK_ROWS, n_rows - start))
+            >= test_size
+            for chunk, start in enumerate(range(0, n_rows, CHUNK_ROWS))
+        ]
+    )
+
+
+def _fit(source):
+    predictor = OnePieceFightPredictor()
+    chunks = []
+    chunk_reader = predictor._chunk_reader
+
+    def counting_reader(*args, **kwargs):
+        n_chunks, read_chunk = chunk_reader(*args, **kwargs)
+        chunks.append(n_chunks)
+        return n_chunks, read_chunk
+
+    predictor._chunk_reader = counting_reader
+    predictor.fit_incremental(source, epochs=1, max_memory_mb=0.01, n_components=50)
+    return predictor, chunks[0]
+
+
+def test_csv_scaler_matches_full_batch(tmp_path):
+    fights = pd.read_csv(FIGHT_FILE).head(2500)
+    csv_file = tmp_path / "fights.csv"
+    fights.to_csv(csv_file, index=False)
+
+    predictor, n_chunks = _fit(str(csv_file))
+
+    assert n_chunks == 3
+    X = predictor.prepare_features(fights)[_training_rows(len(fights))]
+    expected = StandardScaler().fit(X)
+    np.testing.assert_allclose(predictor.scaler.mean_, expected.mean_)
+    np.testing.assert_allclose(predictor.scaler.scale_, expected.scale_)
+    assert predictor.scaler.n_samples_seen_ == len(X)
+
+
+def test_pair_dataset_scaler_matches_full_batch():
+    pairs = PairDataset.from_roster(pd.read_csv(ROSTER_FILE).head(75))
+
+    predictor, n_chunks = _fit(pairs)
+
+    assert n_chunks == -(-len(pairs) // CHUNK_ROWS) > 1
+    X = pairs.features(predictor.all_features)[_training_rows(len(pairs))]
+    expected = StandardScaler().fit(X)
+    np.testing.assert_allclose(predictor.scaler.mean_, expected.mean_)
+    np.testing.assert_allclose(predictor.scaler.scale_, expected.scale_)
+    assert predictor.is_fitted and 0 <= predictor.test_accuracy <= 1
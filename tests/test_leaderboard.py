@@ -0,0 +1,45 @@
+import pandas as pd
+
+from src.models.leaderboard import cached_leaderboard, leaderboard_key
+
+
+def _inputs(tmp_path):
+    model_file = tmp_path / "model.pkl"
+    model_file.write_bytes(b"model")
+    roster = pd.DataFrame({"name": ["Nami", "Usopp"], "strength": [3.0, 2.5]})
+    return str(model_file), roster
+
+
+def test_key_depends_on_precision_and_symmetry(tmp_path):
+    model_file, roster = _inputs(tmp_path)
+
+    keys = {
+        leaderboard_key(model_file, roster),
+        leaderboard_key(model_file, roster, precision="float32"),
+        leaderboard_key(model_file, roster, symmetric=True),
+    }
+
+    assert len(keys) == 3
+    assert leaderboard_key(model_file, roster) == leaderboard_key(
+        model_file, roster, precision="float64", symmetric=False
+    )
+
+
+def test_cached_leaderboard_recomputes_for_new_key(tmp_path):
+    model_file, roster = _inputs(tmp_path)
+    cache_file = str(tmp_path / "leaderboard.json")
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return pd.DataFrame({"name": ["Nami"], "rating": [1500.0]})
+
+    key = leaderboard_key(model_file, roster)
+    cached_leaderboard(key, compute, cache_file)
+    cached_leaderboard(key, compute, cache_file)
+    assert len(calls) == 1
+
+    cached_leaderboard(
+        leaderboard_key(model_file, roster, precision="float32"), compute, cache_file
+    )
+    assert len(calls) == 2
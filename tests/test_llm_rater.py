@@ -0,0 +1,102 @@
+import asyncio
+import json
+
+import pytest
+
+from src.scraping.llm_implementations import MockRater, names_in_batch_prompt
+from src.scraping.llm_rater import (
+    BaseLLMRater,
+    RATED_ATTRIBUTES,
+    _parse_batch_response,
+    _parse_response,
+)
+
+
+class _PartialBatchRater(MockRater):
+    """Batch replies drop one attribute for the first character."""
+
+    def __init__(self):
+        super().__init__()
+        self.individually_rated = []
+
+    async def rate_character(self, character_data):
+        self.individually_rated.append(character_data["name"])
+        return await super().rate_character(character_data)
+
+    async def _complete(self, prompt, json_output=False):
+        reply = json.loads(self.mock_batch_reply(names_in_batch_prompt(prompt)))
+        del reply["characters"][0]["ratings"]["devil_fruit"]
+        return json.dumps(reply)
+
+
+def test_batch_rating_matches_individual_rating():
+    rater = MockRater()
+    characters = [{"name": name} for name in ("Nami", "Usopp", "Sanji")]
+
+    ratings = asyncio.run(rater.rate_characters(characters, batch_size=3))
+
+    assert ratings == [
+        rater.mock_ratings(character["name"]) for character in characters
+    ]
+
+
+def test_incomplete_batch_entry_is_rated_individually():
+    rater = _PartialBatchRater()
+    characters = [{"name": name} for name in ("Nami", "Usopp", "Sanji")]
+
+    ratings = asyncio.run(rater.rate_characters(characters, batch_size=3))
+
+    assert rater.individually_rated == ["Nami"]
+    assert all(set(rating) == set(RATED_ATTRIBUTES) for rating in ratings)
+    assert ratings[0] == rater.mock_ratings("Nami")
+
+
+def test_rater_must_implement_complete():
+    class SingleOnlyRater(BaseLLMRater):
+        async def rate_character(self, character_data):
+            return {}
+
+    with pytest.raises(TypeError):
+        SingleOnlyRater()
+
+
+def test_parse_markdown_ratings():
+    reply = "**Travel Speed**: 8/10 - fast\n**Armament Haki**: 9/10\n**Conqueror's Haki**: 10/10"
+
+    assert _parse_response(reply) == {
+        "travel_speed": 8.0,
+        "armament_haki": 9.0,
+        "conqueror_haki": 10.0,
+    }
+
+
+def test_parse_out_of_ten_and_rating_labels():
+    reply = (
+        "Strength: 7.5/10\n"
+        "battle_iq - Rating: 9\n"
+        "Observation Haki (Rating: **6**)\n"
+        "Defense: 4 / 10"
+    )
+
+    assert _parse_response(reply) == {
+        "strength": 7.5,
+        "battle_iq": 9.0,
+        "observation_haki": 6.0,
+        "defense": 4.0,
+    }
+
+
+def test_parse_drops_scores_above_ten():
+    reply = "Strength: 15/10\nStrength: 8/10\nStamina: 42\nIntelligence: 3"
+
+    # The out-of-range score is skipped and a later valid one is kept
+    assert _parse_response(reply) == {"strength": 8.0, "intelligence": 3.0}
+
+
+def test_parse_ignores_unknown_attributes():
+    assert _parse_response("Speed: 9\nCharisma: 10\nAgility: 7") == {"agility": 7.0}
+
+
+def test_parse_batch_rejects_non_json():
+    with pytest.raises(ValueError):
+        _parse_batch_response("Nami: Strength 3", ["Nami"])
@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from src.models.matchups import MatchupIndex
+
+CLASSES = ["draw", "loss", "victory"]
+
+
+@pytest.fixture(scope="module")
+def matrix():
+    n = 12
+    matrix = np.random.default_rng(0).dirichlet([1, 1, 1], (n, n))
+    matrix[np.arange(n), np.arange(n)] = np.nan
+    return matrix
+
+
+@pytest.fixture(scope="module")
+def index(matrix):
+    return MatchupIndex(matrix, CLASSES, [f"C{i}" for i in range(len(matrix))])
+
+
+def _brute_force(index, name, min_prob, beaten_by=False):
+    """Every qualifying opponent, highest probability first."""
+    i = list(index.names).index(name)
+    row = index.win_prob[:, i] if beaten_by else index.win_prob[i]
+    matches = [
+        (index.names[j], row[j])
+        for j in range(len(row))
+        if j != i and row[j] >= min_prob
+    ]
+    return sorted(matches, key=lambda match: -match[1])
+
+
+@pytest.mark.parametrize("min_prob", [0.0, 0.3, 0.5, 0.7, 1.1])
+@pytest.mark.parametrize("beaten_by", [False, True])
+def test_threshold_query_matches_brute_force(index, min_prob, beaten_by):
+    for name in index.names:
+        assert index.query(name, min_prob, beaten_by=beaten_by) == _brute_force(
+            index, name, min_prob, beaten_by
+        )
+
+
+def test_top_k_and_ascending(index):
+    expected = _brute_force(index, "C3", 0.3)
+
+    assert index.query("C3", 0.3, k=2) == expected[:2]
+    assert index.query("C3", 0.3, k=2, ascending=True) == expected[::-1][:2]
+    assert index.query("C3", 0.3, k=100) == expected
+    assert index.query("C3", 0.3, ascending=True) == expected[::-1]
+
+
+def test_threshold_is_inclusive(index):
+    name, prob = index.query("C0", 0.0)[4]
+
+    assert (name, prob) in index.query("C0", prob)
+    assert (name, prob) not in index.query("C0", np.nextafter(prob, 1))
+
+
+def test_win_probability_averages_both_orientations(index, matrix):
+    draws = matrix[..., CLASSES.index("draw")]
+
+    # Whatever isn't a draw is a win for one side
+    np.testing.assert_allclose(
+        index.win_prob + index.win_prob.T, 1 - (draws + draws.T) / 2
+    )
+    assert "C0" in index and "Nobody" not in index
@@ -0,0 +1,79 @@
+import os
+
+import pytest
+
+from src.scraping.page_parser import (
+    HAS_LXML,
+    benchmark_parsers,
+    load_fixture_pages,
+    parse_page,
+)
+from src.scraping.scraper import OnePieceCharacterScraper
+
+PAGES_DIR = os.path.join(os.path.dirname(__file__), "fixtures", "pages")
+
+BACKENDS = ["html.parser"] + (["lxml"] if HAS_LXML else [])
+
+
+@pytest.fixture(scope="module")
+def extractor():
+    return OnePieceCharacterScraper(raters=[])
+
+
+@pytest.fixture(scope="module")
+def pages():
+    return load_fixture_pages(PAGES_DIR)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_targeted_parse_extracts_the_same_fields(extractor, pages, backend):
+    assert len(pages) == 3
+    for page_name, html in pages.items():
+        full = extractor.extract_character_data(
+            parse_page(html, "html.parser", targeted=False)
+        )
+        targeted = extractor.extract_character_data(
+            parse_page(html, backend, targeted=True)
+        )
+        assert targeted == full, page_name
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_targeted_parse_keeps_title_and_infobox_intact(pages, backend):
+    for page_name, html in pages.items():
+        full = parse_page(html, backend, targeted=False)
+        targeted = parse_page(html, backend, targeted=True)
+        for name, css_class in (("h1", "page-header__title"), ("table", "infobox")):
+            assert str(targeted.find(name, class_=css_class)) == str(
+                full.find(name, class_=css_class)
+            ), page_name
+
+
+def test_fixture_fields(extractor, pages):
+    luffy = extractor.extract_character_data(parse_page(pages["Monkey_D._Luffy.html"]))
+    robin = extractor.extract_character_data(parse_page(pages["Nico_Robin.html"]))
+    pandaman = extractor.extract_character_data(parse_page(pages["Pandaman.html"]))
+
+    assert luffy["name"] == "Monkey D. Luffy"
+    assert luffy["bounty"] == "3,000,000,000[1]"
+    assert luffy["affiliation"] == "Straw Hat Pirates; Straw Hat Grand Fleet"
+    assert luffy["title"] == "Fifth Emperor of the Sea"
+    assert robin["name"] == "Nico Robin"
+    assert robin["bounty"] == "930,000,000"
+    assert robin["affiliation"].startswith("Straw Hat Pirates & Revolutionary Army")
+    assert pandaman["name"] == "Pandaman"
+    assert pandaman["bounty"] is None and pandaman["affiliation"] is None
+
+
+def test_targeted_tree_skips_the_rest_of_the_page(pages):
+    soup = parse_page(pages["Monkey_D._Luffy.html"], "html.parser")
+
+    assert [tag.name for tag in soup.find_all(recursive=False)] == ["h1", "table"]
+    assert soup.find("script") is None
+
+
+def test_benchmark_reports_no_mismatches():
+    results = benchmark_parsers(PAGES_DIR, repeats=1)
+
+    assert len(results) == 2 * len(BACKENDS)
+    assert all(result["mismatches"] == [] for result in results)
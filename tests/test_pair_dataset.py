@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+
+from src.models.pair_dataset import PairDataset
+from src.preprocessing.fight_generator import create_fight_data
+from src.preprocessing.fight_outcome_generator import add_fight_outcomes
+
+ROSTER_FILE = "data/processed/character_data_cleaned.csv"
+
+
+def _roster_and_fights(tmp_path):
+    roster_file = str(tmp_path / "roster.csv")
+    pd.read_csv(ROSTER_FILE).head(25).to_csv(roster_file, index=False)
+    fight_file = str(tmp_path / "fights.csv")
+    create_fight_data(roster_file, fight_file)
+    add_fight_outcomes(fight_file)
+    return roster_file, pd.read_csv(fight_file)
+
+
+def test_features_match_fight_table(tmp_path, predictor):
+    roster_file, fights = _roster_and_fights(tmp_path)
+    pairs = PairDataset.from_roster(roster_file)
+
+    assert len(pairs) == len(fights) == 25 * 24 // 2
+    assert list(pairs.names[pairs.idx1]) == list(fights["fighter_1_name"])
+    assert list(pairs.names[pairs.idx2]) == list(fights["fighter_2_name"])
+    np.testing.assert_allclose(
+        pairs.feature_matrix(predictor.all_features),
+        predictor.prepare_features(fights).to_numpy(dtype=float),
+    )
+    assert list(pairs.outcomes()) == list(fights["outcome"])
+
+
+def test_batched_slices_match_full_matrix(tmp_path, predictor):
+    pairs = PairDataset.from_roster(_roster_and_fights(tmp_path)[0])
+    full = pairs.feature_matrix(predictor.all_features)
+
+    np.testing.assert_allclose(
+        pairs.features(predictor.all_features, 100, 250), full[100:250]
+    )
+    assert list(pairs.outcomes(100, 250, batch_size=7)) == list(
+        pairs.outcomes()[100:250]
+    )
+
+
+def test_predictions_match_fight_table(tmp_path, predictor):
+    roster_file, fights = _roster_and_fights(tmp_path)
+    pairs = PairDataset.from_roster(roster_file)
+
+    np.testing.assert_allclose(
+        predictor.predict_proba(pairs), predictor.predict_proba(fights)
+    )
+    assert list(predictor.predict(pairs)) == list(predictor.predict(fights))
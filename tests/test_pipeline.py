@@ -0,0 +1,118 @@
+import os
+
+from src import pipeline
+from src.pipeline import Stage, code_files, run_pipeline, stage_key
+
+
+def _upper(input_file, output_file, suffix=""):
+    with open(input_file) as f:
+        text = f.read()
+    with open(output_file, "w") as f:
+        f.write(text.upper() + suffix)
+
+
+def _stages(tmp_path, **params):
+    return [
+        Stage(
+            "upper",
+            _upper,
+            inputs=[str(tmp_path / "in.txt")],
+            outputs=[str(tmp_path / "out.txt")],
+            params=params,
+        )
+    ]
+
+
+def test_unchanged_stage_is_cached(tmp_path):
+    (tmp_path / "in.txt").write_text("luffy")
+    manifest = str(tmp_path / "manifest.json")
+
+    assert run_pipeline(_stages(tmp_path), manifest_file=manifest) == {"upper": "ran"}
+    assert run_pipeline(_stages(tmp_path), manifest_file=manifest) == {
+        "upper": "cached"
+    }
+    assert (tmp_path / "out.txt").read_text() == "LUFFY"
+
+
+def test_changed_input_reruns_stage(tmp_path):
+    (tmp_path / "in.txt").write_text("luffy")
+    manifest = str(tmp_path / "manifest.json")
+    run_pipeline(_stages(tmp_path), manifest_file=manifest)
+
+    (tmp_path / "in.txt").write_text("zoro")
+
+    assert run_pipeline(_stages(tmp_path), manifest_file=manifest) == {"upper": "ran"}
+    assert (tmp_path / "out.txt").read_text() == "ZORO"
+
+
+def test_changed_params_change_key(tmp_path):
+    (tmp_path / "in.txt").write_text("luffy")
+
+    assert stage_key(_stages(tmp_path)[0]) != stage_key(
+        _stages(tmp_path, suffix="!")[0]
+    )
+
+
+def test_modified_output_reruns_stage(tmp_path):
+    (tmp_path / "in.txt").write_text("luffy")
+    manifest = str(tmp_path / "manifest.json")
+    run_pipeline(_stages(tmp_path), manifest_file=manifest)
+
+    (tmp_path / "out.txt").write_text("edited by hand")
+
+    assert run_pipeline(_stages(tmp_path), manifest_file=manifest) == {"upper": "ran"}
+
+
+def test_stage_code_includes_imported_modules():
+    stages = {stage.name: stage for stage in pipeline.STAGES}
+    files = {
+        name: [path.replace("\\", "/") for path in code_files(stage.code)]
+        for name, stage in stages.items()
+    }
+
+    assert any(path.endswith("src/preprocessing/aliases.py") for path in files["clean"])
+    for module in ("incremental", "pair_dataset", "artifact", "rbf_inference"):
+        assert any(path.endswith(f"src/models/{module}.py") for path in files["train"])
+    # Stage wrappers in pipeline.py don't pull in every other stage's code
+    assert not any(path.endswith("src/models/svm_model.py") for path in files["clean"])
+
+
+def _append(input_file, output_file, base_file=None):
+    base = ""
+    if base_file is not None and os.path.exists(base_file):
+        with open(base_file) as f:
+            base = f.read()
+    with open(input_file) as f, open(output_file, "w") as out:
+        out.write(base + f.read())
+
+
+def test_optional_input_is_part_of_the_key(tmp_path):
+    (tmp_path / "in.txt").write_text("luffy")
+    base_file = tmp_path / "base.txt"
+    manifest = str(tmp_path / "manifest.json")
+    stages = [
+        Stage(
+            "append",
+            _append,
+            inputs=[str(tmp_path / "in.txt")],
+            outputs=[str(tmp_path / "out.txt")],
+            optional_inputs={"base_file": str(base_file)},
+        )
+    ]
+
+    # A missing optional input is not an error
+    assert run_pipeline(stages, manifest_file=manifest) == {"append": "ran"}
+    assert run_pipeline(stages, manifest_file=manifest) == {"append": "cached"}
+
+    base_file.write_text("zoro ")
+    assert run_pipeline(stages, manifest_file=manifest) == {"append": "ran"}
+    assert (tmp_path / "out.txt").read_text() == "zoro luffy"
+
+
+def test_fight_stage_declares_the_labelled_table():
+    stages = {stage.name: stage for stage in pipeline.STAGES}
+
+    assert pipeline.FIGHT_FILE in stages["fights"].optional_inputs.values()
+    # Roster updates and out-of-core training are separate switches
+    assert "incremental" in stages["fights"].params
+    assert "out_of_core" in stages["train"].params
@@ -0,0 +1,34 @@
+import json
+
+import pandas as pd
+
+from src.preprocessing.preprocessor import flatten_character_records
+
+
+def _raw_row(name, strength):
+    return {
+        "wiki_data": json.dumps({"name": name}),
+        "power_scaling": json.dumps({"strength": {"mean": strength}}),
+    }
+
+
+def test_flatten_character_records_decodes_in_bulk():
+    df = pd.DataFrame([_raw_row("A", 5.0), _raw_row("B", 6.0)])
+
+    cleaned, malformed = flatten_character_records(df)
+
+    assert malformed == []
+    assert cleaned["name"].tolist() == ["A", "B"]
+    assert cleaned["strength"].tolist() == [5.0, 6.0]
+
+
+def test_cell_with_two_json_values_does_not_shift_rows():
+    rows = [_raw_row("A", 5.0), _raw_row("B", 6.0), _raw_row("C", 7.0)]
+    rows[1]["wiki_data"] = '{"name":"B"},{"name":"X"}'
+    df = pd.DataFrame(rows)
+
+    cleaned, malformed = flatten_character_records(df)
+
+    assert [idx for idx, _ in malformed] == [1]
+    assert cleaned["name"].tolist() == ["A", "C"]
+    assert cleaned["strength"].tolist() == [5.0, 7.0]
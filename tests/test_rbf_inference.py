@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+from sklearn.svm import SVC
+
+from src.models.rbf_inference import RBFKernelScorer
+from src.models.svm_model import OnePieceFightPredictor
+
+
+@pytest.fixture
+def scaled_features(predictor, fight_data):
+    return predictor._scale(
+        predictor.prepare_features(fight_data).to_numpy(dtype=float)
+    )
+
+
+def test_float64_scorer_matches_svc(predictor, scaled_features):
+    scorer = RBFKernelScorer(predictor.model, dtype=np.float64)
+
+    np.testing.assert_allclose(
+        scorer.predict_proba(scaled_features),
+        predictor.model.predict_proba(scaled_features),
+        atol=1e-6,
+    )
+    np.testing.assert_array_equal(
+        scorer.predict(scaled_features), predictor.model.predict(scaled_features)
+    )
+
+
+def test_small_blocks_give_the_same_decision_values(predictor, scaled_features):
+    whole = RBFKernelScorer(predictor.model, dtype=np.float64)
+    blocked = RBFKernelScorer(predictor.model, dtype=np.float64, block_rows=7)
+
+    np.testing.assert_allclose(
+        blocked.decision_values(scaled_features), whole.decision_values(scaled_features)
+    )
+
+
+def test_scorer_rejects_non_rbf_models():
+    model = SVC(kernel="linear", probability=True)
+
+    with pytest.raises(TypeError):
+        RBFKernelScorer(model)
+
+
+def test_reduced_precision_enabled_within_tolerance(predictor, fight_data):
+    predictor.kernel_scorer = None
+
+    report = predictor.enable_reduced_precision(fight_data)
+
+    assert report["activated"]
+    assert predictor.kernel_scorer is not None
+    assert predictor.kernel_scorer.dtype == np.float32
+    np.testing.assert_allclose(
+        predictor.predict_proba(fight_data),
+        predictor.model.predict_proba(
+            predictor._scale(
+                predictor.prepare_features(fight_data).to_numpy(dtype=float)
+            )
+        ),
+        atol=0.01,
+    )
+    predictor.kernel_scorer = None
+
+
+def test_reduced_precision_rejected_outside_tolerance(predictor, fight_data):
+    predictor.kernel_scorer = None
+
+    report = predictor.enable_reduced_precision(fight_data, max_probability_error=0.0)
+
+    assert not report["activated"]
+    assert report["max_probability_error"] > 0
+    assert predictor.kernel_scorer is None
+
+
+def test_reduced_precision_rejected_for_unsupported_model(predictor, fight_data):
+    linear = OnePieceFightPredictor()
+    linear.load_model_data(
+        {
+            "model": SVC(kernel="linear", probability=True),
+            "scaler": predictor.scaler,
+            "label_encoder": predictor.label_encoder,
+            "features": predictor.all_features,
+        }
+    )
+
+    report = linear.enable_reduced_precision(fight_data)
+
+    assert not report["activated"]
+    assert "reason" in report
+    assert linear.kernel_scorer is None
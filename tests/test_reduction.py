@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+
+from src.models.reduction import DataReduction, kmeans_coreset, stratified_subsample
+
+
+def _data(seed=0):
+    """Integer-valued features (so duplicates occur) and unbalanced classes."""
+    rng = np.random.default_rng(seed)
+    y = np.repeat([0, 1, 2], [600, 300, 20])
+    X = rng.integers(0, 4, (len(y), 3)) + y[:, None]
+    return pd.DataFrame(X, columns=["a", "b", "c"]), y
+
+
+def _counts(y):
+    return dict(zip(*np.unique(y, return_counts=True)))
+
+
+def test_kmeans_coreset_weights_sum_to_row_count():
+    X, y = _data()
+
+    centres, labels, weights = kmeans_coreset(X, y, ratio=0.1)
+
+    assert weights.sum() == len(X)
+    # Every class keeps its own total weight
+    for label, count in _counts(y).items():
+        assert weights[labels == label].sum() == count
+    assert len(centres) < len(X) / 5
+
+
+def test_reduction_weights_sum_to_row_count():
+    X, y = _data()
+
+    for reduction in (DataReduction(), DataReduction(ratio=0.2, method="kmeans")):
+        X_reduced, y_reduced, weights = reduction.apply(X, y)
+        assert len(X_reduced) == len(y_reduced) == len(weights) < len(X)
+        assert weights.sum() == len(X)
+
+
+def test_stratified_subsample_keeps_class_shares():
+    _, y = _data()
+
+    keep = stratified_subsample(y, ratio=0.5, min_per_class=0)
+
+    assert _counts(y[keep]) == {0: 300, 1: 150, 2: 10}
+    assert len(np.unique(keep)) == len(keep)
+
+
+def test_min_per_class():
+    X, y = _data()
+
+    stratified = stratified_subsample(y, ratio=0.05, min_per_class=25)
+    _, labels, weights = kmeans_coreset(X, y, ratio=0.05, min_per_class=25)
+
+    # Class 2 has only 20 rows, so all of them are kept
+    assert _counts(y[stratified]) == {0: 30, 1: 25, 2: 20}
+    assert _counts(labels) == {0: 30, 1: 25, 2: 20}
+    assert weights.sum() == len(X)
@@ -0,0 +1,55 @@
+import numpy as np
+
+from src.models.simulation import TournamentSimulator, seed_order
+
+CLASSES = ["draw", "loss", "victory"]
+
+
+def _simulator(n=5, seed=0):
+    matrix = np.random.default_rng(seed).dirichlet([1, 1, 1], (n, n))
+    matrix[np.arange(n), np.arange(n)] = np.nan
+    return TournamentSimulator(matrix, CLASSES, [f"C{i}" for i in range(n)])
+
+
+def test_round_robin_reports_expected_counts():
+    standings = _simulator().round_robin()
+
+    totals = standings[["expected_wins", "expected_draws", "expected_losses"]].sum(
+        axis=1
+    )
+    np.testing.assert_allclose(totals, standings["fights"])
+    assert (standings["fights"] == 8).all()
+    # Every fight has one winner and one loser
+    np.testing.assert_allclose(
+        standings["expected_wins"].sum(), standings["expected_losses"].sum()
+    )
+
+
+def test_seed_order_is_standard():
+    assert seed_order(4).tolist() == [0, 3, 1, 2]
+    assert seed_order(8).tolist() == [0, 7, 3, 4, 1, 6, 2, 5]
+
+
+def test_byes_go_to_top_seeds():
+    simulator = _simulator(n=5)
+    names = ["C4", "C3", "C2", "C1", "C0"]
+
+    bracket = simulator.simulate_bracket(names, n_simulations=2000, seed=0).set_index(
+        "name"
+    )
+
+    # Seeds 1-3 get a bye in an 8-slot bracket; seeds 4 and 5 must fight
+    assert (bracket.loc[["C4", "C3", "C2"], "round_1"] == 1.0).all()
+    np.testing.assert_allclose(bracket.loc[["C1", "C0"], "round_1"].sum(), 1.0)
+
+
+def test_random_seeding_never_pairs_two_byes():
+    simulator = _simulator(n=5)
+
+    bracket = simulator.simulate_bracket(
+        n_simulations=2000, seed=0, random_seeding=True
+    )
+
+    # Three entrants advance by bye and one wins the only real first-round fight
+    np.testing.assert_allclose(bracket["round_1"].sum(), 4.0)
+    np.testing.assert_allclose(bracket["champion"].sum(), 1.0)
@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.models.pair_dataset import PairDataset
+from src.models.svm_model import OnePieceFightPredictor, swap_outcomes
+
+ROSTER_FILE = "data/processed/character_data_cleaned.csv"
+SWAP = {"victory": "loss", "loss": "victory", "draw": "draw"}
+
+
+@pytest.fixture(scope="module")
+def symmetric_predictor(fight_data):
+    return OnePieceFightPredictor(symmetric=True).fit(fight_data)
+
+
+@pytest.fixture(scope="module")
+def pairs():
+    return PairDataset.from_roster(pd.read_csv(ROSTER_FILE).head(30))
+
+
+def test_symmetry_gap_is_zero(symmetric_predictor, predictor, fight_data, pairs):
+    assert symmetric_predictor.symmetry_gap(fight_data) < 1e-9
+    assert symmetric_predictor.symmetry_gap(pairs) < 1e-9
+    # The plain model is not symmetric by construction
+    assert predictor.symmetry_gap(fight_data) > 1e-6
+
+
+def test_pairwise_matrix_swaps_victory_and_loss(symmetric_predictor, pairs):
+    matrix = symmetric_predictor.pairwise_proba(pairs)
+    classes = symmetric_predictor.label_encoder.classes_
+
+    np.testing.assert_allclose(
+        matrix[pairs.idx2, pairs.idx1],
+        swap_outcomes(matrix[pairs.idx1, pairs.idx2], classes),
+    )
+    # The derived lower triangle agrees with scoring the mirrored fights directly
+    np.testing.assert_allclose(
+        matrix[pairs.idx2, pairs.idx1],
+        symmetric_predictor.predict_proba(pairs.mirrored()),
+    )
+
+
+def test_mirrored_fights_get_swapped_labels(symmetric_predictor, pairs):
+    labels = symmetric_predictor.predict(pairs)
+    mirrored = symmetric_predictor.predict(pairs.mirrored())
+
+    assert list(mirrored) == [SWAP[label] for label in labels]